@@ -1,9 +1,2 @@
-from ai_analyzer.application.usecase.analyze_news_usecase import AnalyzeNewsUseCase
-from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
-
-class AnalyzeNewsUseCaseFactory:
-    @staticmethod
-    def create() -> AnalyzeNewsUseCase:
-        return AnalyzeNewsUseCase(
-            sentiment_port=FinbertSentimentAdapter.getInstance()
-        )
\ No newline at end of file
+# 유스케이스 조립은 ai_analyzer 쪽 팩토리를 그대로 사용한다 (같은 어댑터/레지스트리 공유)
+from ai_analyzer.application.factory.analyze_news_usecase_factory import AnalyzeNewsUseCaseFactory  # noqa: F401
@@ -1,20 +1,81 @@
+import asyncio
+from typing import List
+
 from fastapi import APIRouter, HTTPException
 
-from ai_analyzer.adapter.input.web.request.analyze_request import AnalyzeRequest
+from ai_analyzer.adapter.input.web.request.analyze_request import AnalyzeRequest, AnalyzeBatchRequest
 from ai_analyzer.application.factory.analyze_news_usecase_factory import AnalyzeNewsUseCaseFactory
+from ai_analyzer.domain.value_object.analysis_result_vo import AnalysisResultVO
+from ai_analyzer.infrastructure.cache.analysis_result_cache import AnalysisResultCache, ANALYSIS_CACHE_ENABLED
+from ai_analyzer.infrastructure.executor.inference_executor import InferenceExecutor, InferenceQueueFullError
 
 ai_analyzer_router = APIRouter(tags=["AI Analyzer"])
 
 
-@ai_analyzer_router.post("/analyze")
-async def analyze_financial_news(request: AnalyzeRequest):
-    usecase = AnalyzeNewsUseCaseFactory.create()
-    result = usecase.analyze(request.content)
-
-    return {
+def _to_response(result: AnalysisResultVO) -> dict:
+    response = {
         "sentiment": {
             "label": result.sentiment_label,
             "score": result.sentiment_score
         },
         "keywords": result.keywords
-    }
\ No newline at end of file
+    }
+    if result.sentiment_windows is not None:
+        response["sentiment"]["windows"] = result.sentiment_windows
+    if result.timings is not None:
+        response["timings"] = result.timings
+    return response
+
+
+# 추론 워커 스레드에서 실행된다 (모델 로드/추론이 이벤트 루프를 막지 않도록)
+def _analyze_batch(contents: List[str]) -> List[AnalysisResultVO]:
+    usecase = AnalyzeNewsUseCaseFactory.create()
+    return usecase.analyze_batch(contents)
+
+
+def _queue_full() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="분석 요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"}
+    )
+
+
+async def _run_inference(fn, *args):
+    try:
+        return await InferenceExecutor.getInstance().run(fn, *args)
+    except InferenceQueueFullError:
+        raise _queue_full()
+
+
+@ai_analyzer_router.post("/analyze")
+async def analyze_financial_news(request: AnalyzeRequest):
+    try:
+        async with InferenceExecutor.getInstance().slot() as pool:
+            # 모델 로드(최초 1회)도 워커 스레드에서 수행
+            usecase = await asyncio.get_running_loop().run_in_executor(pool, AnalyzeNewsUseCaseFactory.create)
+            # 감성 분석과 키워드 추출을 같은 풀에서 동시에 실행
+            result = await usecase.analyze_async(
+                request.content,
+                pool,
+                long_document=request.long_document,
+                return_windows=request.return_windows
+            )
+    except InferenceQueueFullError:
+        raise _queue_full()
+
+    return _to_response(result)
+
+
+@ai_analyzer_router.post("/analyze-batch")
+async def analyze_financial_news_batch(request: AnalyzeBatchRequest):
+    results = await _run_inference(_analyze_batch, request.contents)
+
+    return {"results": [_to_response(result) for result in results]}
+
+
+@ai_analyzer_router.get("/cache/stats")
+async def get_analysis_cache_stats():
+    if not ANALYSIS_CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **AnalysisResultCache.getInstance().stats()}
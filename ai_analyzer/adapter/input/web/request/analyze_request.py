@@ -1,4 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List
 
 class AnalyzeRequest(BaseModel):
-    content: str
\ No newline at end of file
+    content: str
+    # 512 토큰을 넘는 긴 기사를 슬라이딩 윈도우로 분석
+    long_document: bool = False
+    # 윈도우별 감성 점수도 함께 반환
+    return_windows: bool = False
+
+class AnalyzeBatchRequest(BaseModel):
+    contents: List[str] = Field(..., min_length=1, max_length=64)
\ No newline at end of file
@@ -0,0 +1,197 @@
+import fcntl
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+import torch
+from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer
+
+# FinBERT 추론 백엔드 선택
+# - torch      : 기본 PyTorch FP32 모델 (GPU가 있으면 GPU 사용)
+# - torch_int8 : PyTorch 동적 양자화(int8, nn.Linear) - CPU 전용
+# - onnx       : ONNX Runtime (최초 1회 ONNX 로 export 후 재사용)
+# - onnx_int8  : ONNX Runtime + int8 동적 양자화
+FINBERT_BACKEND = os.getenv("FINBERT_BACKEND", "torch")
+FINBERT_ONNX_DIR = os.getenv(
+    "FINBERT_ONNX_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "river-ai-server", "finbert-onnx")
+)
+FINBERT_ORT_THREADS = int(os.getenv("FINBERT_ORT_THREADS", "0"))  # 0 이면 ONNX Runtime 기본값
+
+ONNX_INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+@contextmanager
+def _file_lock(path: str):
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _tmp_path(path: str) -> str:
+    # 같은 디렉터리(같은 파일시스템)의 임시 파일 - os.replace 가 원자적으로 동작하도록
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{ext}"
+
+
+class FinbertBackend(ABC):
+    """
+    토크나이저로 패딩된 배치를 받아 logits 를 돌려주는 추론 백엔드.
+    tensor_type 은 tokenizer.pad(return_tensors=...) 에 그대로 전달된다.
+    """
+    name: str
+    tensor_type: str
+    device: str = "cpu"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.config = AutoConfig.from_pretrained(model_name)
+
+    @abstractmethod
+    def predict_logits(self, batch) -> torch.Tensor:
+        pass
+
+
+class TorchFinbertBackend(FinbertBackend):
+    name = "torch"
+    tensor_type = "pt"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        # GPU가 있으면 cuda, 없으면 cpu
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.model.to(self.device)
+        self.model.eval()
+
+    def predict_logits(self, batch) -> torch.Tensor:
+        batch = batch.to(self.device)
+        with torch.inference_mode():
+            return self.model(**batch).logits.cpu()
+
+
+class QuantizedTorchFinbertBackend(TorchFinbertBackend):
+    name = "torch_int8"
+
+    def __init__(self, model_name: str):
+        FinbertBackend.__init__(self, model_name)
+        # 동적 양자화는 CPU 에서만 동작
+        self.device = "cpu"
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+        self.model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxFinbertBackend(FinbertBackend):
+    name = "onnx"
+    tensor_type = "np"
+    quantize = False
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError(
+                f"FINBERT_BACKEND={self.name} 을 사용하려면 onnxruntime 패키지가 필요합니다."
+            ) from e
+
+        model_path = self._ensure_onnx_model()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if FINBERT_ORT_THREADS > 0:
+            options.intra_op_num_threads = FINBERT_ORT_THREADS
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+    def _ensure_onnx_model(self) -> str:
+        model_dir = os.path.join(FINBERT_ONNX_DIR, self.model_name.replace("/", "__"))
+        fp32_path = os.path.join(model_dir, "model.onnx")
+        int8_path = os.path.join(model_dir, "model.int8.onnx")
+        os.makedirs(model_dir, exist_ok=True)
+
+        # 여러 워커가 동시에 export 하지 않도록 파일 락으로 직렬화하고,
+        # 임시 파일에 끝까지 쓴 뒤 os.replace 로 옮겨 중간에 죽어도 잘린 모델이 남지 않게 한다
+        with _file_lock(os.path.join(model_dir, ".lock")):
+            if not os.path.exists(fp32_path):
+                print(f"Exporting {self.model_name} to ONNX ({fp32_path})...")
+                model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                model.eval()
+                dummy = torch.ones(1, 8, dtype=torch.long)
+                tmp_path = _tmp_path(fp32_path)
+                torch.onnx.export(
+                    model,
+                    (dummy, dummy, torch.zeros_like(dummy)),
+                    tmp_path,
+                    input_names=ONNX_INPUT_NAMES,
+                    output_names=["logits"],
+                    dynamic_axes={name: {0: "batch", 1: "sequence"} for name in ONNX_INPUT_NAMES}
+                    | {"logits": {0: "batch"}},
+                    opset_version=17,
+                    dynamo=False
+                )
+                os.replace(tmp_path, fp32_path)
+                del model
+
+            if not self.quantize:
+                return fp32_path
+
+            if not os.path.exists(int8_path):
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+                print(f"Quantizing ONNX model to int8 ({int8_path})...")
+                tmp_path = _tmp_path(int8_path)
+                quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+                os.replace(tmp_path, int8_path)
+            return int8_path
+
+    def predict_logits(self, batch) -> torch.Tensor:
+        input_ids = batch["input_ids"].astype("int64")
+        feeds = {
+            "input_ids": input_ids,
+            "attention_mask": batch["attention_mask"].astype("int64"),
+        }
+        token_type_ids = batch.get("token_type_ids")
+        feeds["token_type_ids"] = (
+            token_type_ids.astype("int64") if token_type_ids is not None else input_ids * 0
+        )
+        logits = self.session.run(["logits"], feeds)[0]
+        return torch.from_numpy(logits)
+
+
+class QuantizedOnnxFinbertBackend(OnnxFinbertBackend):
+    name = "onnx_int8"
+    quantize = True
+
+
+FINBERT_BACKENDS = {
+    backend.name: backend
+    for backend in [TorchFinbertBackend, QuantizedTorchFinbertBackend, OnnxFinbertBackend, QuantizedOnnxFinbertBackend]
+}
+
+
+def create_finbert_backend(model_name: str, backend_name: str = FINBERT_BACKEND) -> FinbertBackend:
+    if backend_name not in FINBERT_BACKENDS:
+        raise ValueError(
+            f"알 수 없는 FINBERT_BACKEND: {backend_name} (사용 가능: {', '.join(FINBERT_BACKENDS)})"
+        )
+    return FINBERT_BACKENDS[backend_name](model_name)
+
+
+class FinbertModel:
+    """레지스트리에 올라가는 FinBERT 묶음 (토크나이저 + 추론 백엔드)."""
+
+    def __init__(self, tokenizer, backend: FinbertBackend):
+        self.tokenizer = tokenizer
+        self.backend = backend
+        # fast tokenizer 는 truncation 설정을 바꾸며 호출되므로 스레드 간 동시 호출을 막는다
+        self.tokenizer_lock = threading.Lock()
+
+
+def load_finbert_model(model_name: str, backend_name: str = FINBERT_BACKEND) -> FinbertModel:
+    print(f"Loading {model_name} (backend: {backend_name})...")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    return FinbertModel(tokenizer, create_finbert_backend(model_name, backend_name))
@@ -1,30 +1,44 @@
+import os
+from typing import List
+
 import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+from ai_analyzer.adapter.output.ai.finbert_backend import FinbertModel, FINBERT_BACKEND
 from ai_analyzer.application.port.sentiment_analysis_port import SentimentAnalysisPort
+from ai_analyzer.infrastructure.batching.length_bucket_scheduler import plan_length_bucketed_batches
+from ai_analyzer.infrastructure.batching.micro_batcher import MicroBatcher
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+
+# 마이크로 배치 설정 (환경변수로 조정 가능)
+FINBERT_MAX_BATCH_SIZE = int(os.getenv("FINBERT_MAX_BATCH_SIZE", "16"))
+FINBERT_MAX_WAIT_MS = float(os.getenv("FINBERT_MAX_WAIT_MS", "5"))
+FINBERT_MAX_BATCH_TOKENS = int(os.getenv("FINBERT_MAX_BATCH_TOKENS", "8192"))
+FINBERT_MAX_LENGTH = 512
+
+# 긴 기사용 슬라이딩 윈도우 설정
+# - FINBERT_WINDOW_OVERLAP: 인접 윈도우끼리 겹치는 토큰 수
+# - FINBERT_WINDOW_AGGREGATION: length_weighted(윈도우가 새로 덮는 토큰 수 가중 평균) | mean | max
+FINBERT_WINDOW_OVERLAP = int(os.getenv("FINBERT_WINDOW_OVERLAP", "128"))
+FINBERT_WINDOW_AGGREGATION = os.getenv("FINBERT_WINDOW_AGGREGATION", "length_weighted")
 
 
 class FinbertSentimentAdapter(SentimentAnalysisPort):
     __instance = None
+    MODEL_NAME = "snunlp/KR-FinBert-SC"
 
     def __new__(cls):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
-            print("Loading KR-FinBERT-SC model...")
-
-            model_name = "snunlp/KR-FinBert-SC"
-            # 1. 모델과 토크나이저 로드
-            cls.__instance.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            cls.__instance.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-
-            # 2. 파이프라인 생성 (GPU가 있으면 device=0, 없으면 -1)
-            device = 0 if torch.cuda.is_available() else -1
-            cls.__instance.classifier = pipeline(
-                "sentiment-analysis",
-                model=cls.__instance.model,
-                tokenizer=cls.__instance.tokenizer,
-                device=device  # GPU 가속 사용
+
+            # 1. 모델(토크나이저 + 추론 백엔드)은 ModelRegistry 의 "finbert" 항목으로 관리
+            cls.__instance.registry = ModelRegistry.getInstance()
+
+            # 2. 동시 요청을 모아서 한 번에 추론하는 마이크로 배처
+            cls.__instance.batcher = MicroBatcher(
+                cls.__instance._classify_batch,
+                max_batch_size=FINBERT_MAX_BATCH_SIZE,
+                max_wait_ms=FINBERT_MAX_WAIT_MS,
+                name="finbert-batcher",
             )
-            print(f"KR-FinBERT-SC model loaded. (Device: {device})")
         return cls.__instance
 
     @classmethod
@@ -33,15 +47,126 @@ class FinbertSentimentAdapter(SentimentAnalysisPort):
             cls.__instance = cls()
         return cls.__instance
 
+    @classmethod
+    def model_signature(cls) -> str:
+        # 결과 캐시 키에 사용 (모델/집계 방식이 바뀌면 캐시도 달라짐)
+        return f"{cls.MODEL_NAME}@{FINBERT_BACKEND}:{FINBERT_WINDOW_AGGREGATION}"
+
+    def _model(self) -> FinbertModel:
+        return self.registry.get("finbert")
+
     # 메서드 이름을 analyze로 통일 (UseCase에서 호출하기 편하게)
     def analyze(self, text: str) -> dict:
-        # 3. 파이프라인에서 truncation 옵션 사용 (토큰 단위 512개 제한)
-        # 텍스트 길이 제한 (토큰 단위 권장)
-        results = self.classifier(text, truncation=True, max_length=512)
-        top_result = results[0]
+        # 단건 요청도 배처에 넣어서 동시에 들어온 다른 요청과 함께 추론
+        return self.batcher.submit(text).result()
+
+    def analyze_batch(self, texts: List[str]) -> List[dict]:
+        futures = self.batcher.submit_many(texts)
+        return [future.result() for future in futures]
+
+    def _classify_batch(self, texts: List[str]) -> List[dict]:
+        model = self._model()
+
+        # 토큰 단위 512개 제한 (truncation), 패딩은 실제 배치 단위로 수행
+        with model.tokenizer_lock:
+            encodings = model.tokenizer(texts, truncation=True, max_length=FINBERT_MAX_LENGTH)
+        lengths = [len(ids) for ids in encodings["input_ids"]]
+
+        # 길이가 비슷한 것끼리 묶어 패딩 낭비를 줄이고, 결과는 원래 순서로 되돌린다
+        results: List[dict] = [None] * len(texts)
+        for indices in plan_length_bucketed_batches(lengths, FINBERT_MAX_BATCH_TOKENS, FINBERT_MAX_BATCH_SIZE):
+            features = [{key: encodings[key][i] for key in encodings.keys()} for i in indices]
+            for i, result in zip(indices, self._forward(model, features)):
+                results[i] = result
+        return results
+
+    def analyze_long_document(self, text: str, return_windows: bool = False) -> dict:
+        model = self._model()
+
+        # 1. 전체 기사를 한 번만 토큰화 (윈도우마다 다시 토큰화하지 않음)
+        with model.tokenizer_lock:
+            input_ids = model.tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"]
+
+        # 2. [CLS]/[SEP] 자리를 뺀 크기로 겹치는 윈도우를 만든다
+        window_size = FINBERT_MAX_LENGTH - model.tokenizer.num_special_tokens_to_add()
+        overlap = min(FINBERT_WINDOW_OVERLAP, window_size // 2)
+        spans = _window_spans(len(input_ids), window_size, overlap)
+        features = [
+            {"input_ids": model.tokenizer.build_inputs_with_special_tokens(input_ids[start:end])}
+            for start, end in spans
+        ]
+
+        # 3. 모든 윈도우를 배치로 추론 (토큰 상한 내에서 묶음)
+        lengths = [len(feature["input_ids"]) for feature in features]
+        probs = torch.empty(len(features), model.backend.config.num_labels)
+        for indices in plan_length_bucketed_batches(lengths, FINBERT_MAX_BATCH_TOKENS, FINBERT_MAX_BATCH_SIZE):
+            probs[indices] = self._predict_proba(model, [features[i] for i in indices])
+
+        # 4. 윈도우 점수 결합
+        weights = _window_weights(spans, FINBERT_WINDOW_AGGREGATION)
+        if FINBERT_WINDOW_AGGREGATION == "max":
+            # 가장 확신도가 높은 윈도우의 결과를 그대로 사용
+            combined = probs[probs.max(dim=-1).values.argmax()]
+        else:
+            combined = (probs * weights.unsqueeze(-1)).sum(dim=0) / weights.sum()
+
+        id2label = model.backend.config.id2label
+        score, label_id = combined.max(dim=-1)
+        result = dict(label=id2label[label_id.item()], score=score.item())
+
+        if return_windows:
+            window_scores, window_labels = probs.max(dim=-1)
+            result["windows"] = [
+                dict(start=start, end=end, label=id2label[label_id], score=window_score)
+                for (start, end), label_id, window_score
+                in zip(spans, window_labels.tolist(), window_scores.tolist())
+            ]
+        return result
+
+    @staticmethod
+    def _predict_proba(model: FinbertModel, features: List[dict]) -> torch.Tensor:
+        batch = model.tokenizer.pad(features, padding=True, return_tensors=model.backend.tensor_type)
+        logits = model.backend.predict_logits(batch)
+        return torch.softmax(logits.float(), dim=-1)
+
+    def _forward(self, model: FinbertModel, features: List[dict]) -> List[dict]:
+        scores, label_ids = self._predict_proba(model, features).max(dim=-1)
+        id2label = model.backend.config.id2label
 
         # 4. 딕셔너리 반환
-        return dict(
-            label=top_result['label'],  # 'positive', 'negative', 'neutral' 중 하나
-            score=top_result['score']
-        )
\ No newline at end of file
+        return [
+            dict(
+                label=id2label[label_id],  # 'positive', 'negative', 'neutral' 중 하나
+                score=score
+            )
+            for label_id, score in zip(label_ids.tolist(), scores.tolist())
+        ]
+
+
+def _window_spans(num_tokens: int, window_size: int, overlap: int) -> List[tuple]:
+    # (start, end) 토큰 구간 목록. 짧은 글은 윈도우 1개.
+    if num_tokens <= window_size:
+        return [(0, num_tokens)]
+
+    step = window_size - overlap
+    spans = []
+    for start in range(0, num_tokens, step):
+        end = min(start + window_size, num_tokens)
+        spans.append((start, end))
+        if end == num_tokens:
+            break
+    return spans
+
+
+def _window_weights(spans: List[tuple], aggregation: str) -> torch.Tensor:
+    if aggregation == "mean":
+        return torch.ones(len(spans))
+
+    # length_weighted: 이전 윈도우와 겹치지 않는 새 토큰 수만큼 가중치를 준다
+    # (겹친 구간이 두 번 반영되지 않으므로 가중치 합 = 기사 전체 토큰 수)
+    weights = []
+    prev_end = 0
+    for start, end in spans:
+        weights.append(max(end - max(start, prev_end), 1))
+        prev_end = end
+    return torch.tensor(weights, dtype=torch.float)
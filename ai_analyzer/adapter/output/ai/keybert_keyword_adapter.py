@@ -1,23 +1,37 @@
-from keybert import KeyBERT
-from kiwipiepy import Kiwi  # 추가: 형태소 분석기
+import os
+import threading
+from typing import List, Optional
+
+import numpy as np
 from ai_analyzer.application.port.keyword_extraction_port import KeywordExtractionPort
+from ai_analyzer.infrastructure.batching.length_bucket_scheduler import run_length_bucketed
+from ai_analyzer.infrastructure.cache.embedding_cache import CandidateEmbeddingCache, normalize_rows
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+
+# Kiwi 배치 분석에 사용할 스레드 수 (0이면 가용 코어 수만큼 사용)
+KIWI_NUM_WORKERS = int(os.getenv("KIWI_NUM_WORKERS", "0"))
+
+# MiniLM 임베딩 배치 설정 (길이별로 묶어 토큰 상한 안에서 배치 구성)
+MINILM_MAX_BATCH_SIZE = int(os.getenv("MINILM_MAX_BATCH_SIZE", "64"))
+MINILM_MAX_BATCH_TOKENS = int(os.getenv("MINILM_MAX_BATCH_TOKENS", "8192"))
 
 
 class KeybertKeywordAdapter(KeywordExtractionPort):
     __instance = None
+    MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
 
     def __new__(cls):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
-            print("Loading KeyBERT & Kiwi model...")
-
-            # 1. KeyBERT 모델 로드
-            cls.__instance.kw_model = KeyBERT(model='paraphrase-multilingual-MiniLM-L12-v2')
 
-            # 2. Kiwi 형태소 분석기 로드 (고유명사 추출용)
-            cls.__instance.kiwi = Kiwi()
+            # 1. KeyBERT(MiniLM) 와 Kiwi 형태소 분석기(고유명사 추출용)는 ModelRegistry 로 관리
+            # ("minilm", "kiwi" 항목 - 처음 사용할 때 로드됨)
+            cls.__instance.registry = ModelRegistry.getInstance()
 
-            print("KeyBERT & Kiwi loaded.")
+            # 2. 후보 단어 임베딩 캐시 (같은 고유명사를 매번 다시 임베딩하지 않도록)
+            # 임베딩 차원을 알려면 모델이 필요하므로 처음 사용할 때 만든다 (embedding_cache 참고)
+            cls.__instance._embedding_cache: Optional[CandidateEmbeddingCache] = None
+            cls.__instance._embedding_cache_lock = threading.Lock()
         return cls.__instance
 
     @classmethod
@@ -26,10 +40,76 @@ class KeybertKeywordAdapter(KeywordExtractionPort):
             cls.__instance = cls()
         return cls.__instance
 
+    @classmethod
+    def model_signature(cls) -> str:
+        # 결과 캐시 키에 사용 (Kiwi 후보 추출 + KeyBERT 임베딩 모델)
+        return f"kiwi+{cls.MODEL_NAME}"
+
+    @property
+    def kw_model(self):
+        return self.registry.get("minilm")
+
+    @property
+    def kiwi(self):
+        return self.registry.get("kiwi")
+
+    @property
+    def embedding_cache(self) -> CandidateEmbeddingCache:
+        # 어댑터 생성만으로 MiniLM 을 로드하지 않도록 첫 키워드 추출 때 만든다 (유휴 언로드 후 재생성 시에도 마찬가지)
+        if self._embedding_cache is None:
+            with self._embedding_cache_lock:
+                if self._embedding_cache is None:
+                    dim = self.kw_model.model.embedding_model.get_sentence_embedding_dimension()
+                    self._embedding_cache = CandidateEmbeddingCache(self.MODEL_NAME, dim)
+        return self._embedding_cache
+
     def extract_keywords(self, text: str, top_n: int = 5) -> list:
         # 1. 형태소 분석을 통해 고유명사(NNP) 후보군 추출
-        # 외국어(SL)도 고유명사일 확률이 높으므로 포함하는 것이 좋습니다 (예: Tesla, Apple)
         tokens = self.kiwi.analyze(text)
+        candidates = self._candidates(tokens)
+
+        # 2. 고유명사 후보가 없을 경우 예외 처리 (빈 리스트 반환 혹은 전체 분석)
+        if not candidates:
+            return []
+            # 또는 아래처럼 기본 추출로 폴백(fallback)할 수도 있습니다.
+            # return self._fallback_extraction(text, top_n)
+
+        # 3. 문서 임베딩만 새로 계산하고, 후보 단어 임베딩은 캐시에서 가져옴 (새 단어만 계산)
+        doc_embedding = self._embed([text])[0]
+        candidate_embeddings = self.embedding_cache.lookup(candidates, self._embed)
+
+        return self._rank(candidates, candidate_embeddings, doc_embedding, top_n)
+
+    def extract_keywords_batch(self, texts: List[str], top_n: int = 5) -> List[list]:
+        if not texts:
+            return []
+
+        # 1. Kiwi 멀티스레드 배치 분석 (결과는 입력 순서대로 반환됨)
+        candidates_per_text = [self._candidates(tokens) for tokens in self.kiwi.analyze(texts)]
+
+        # 2. 모든 문서 임베딩을 한 번에, 전체 문서의 고유 후보 단어도 한 번에 (캐시에 없는 것만) 계산
+        unique_candidates = list(dict.fromkeys(
+            candidate for candidates in candidates_per_text for candidate in candidates
+        ))
+        if not unique_candidates:
+            return [[] for _ in texts]
+        doc_embeddings = self._embed(texts)
+        candidate_embeddings = self.embedding_cache.lookup(unique_candidates, self._embed)
+        row_of = {candidate: row for row, candidate in enumerate(unique_candidates)}
+
+        # 3. 문서별로 자기 후보들만 골라 순위 계산
+        results = []
+        for candidates, doc_embedding in zip(candidates_per_text, doc_embeddings):
+            if not candidates:
+                results.append([])
+                continue
+            rows = [row_of[candidate] for candidate in candidates]
+            results.append(self._rank(candidates, candidate_embeddings[rows], doc_embedding, top_n))
+        return results
+
+    @staticmethod
+    def _candidates(tokens) -> List[str]:
+        # 외국어(SL)도 고유명사일 확률이 높으므로 포함하는 것이 좋습니다 (예: Tesla, Apple)
         candidates = []
 
         # tokens[0][0]은 분석 결과의 첫 번째 문장/분석 결과를 의미합니다.
@@ -38,27 +118,41 @@ class KeybertKeywordAdapter(KeywordExtractionPort):
             if token.tag in ['NNP', 'SL']:
                 candidates.append(token.form)
 
-        # 중복 제거 (순서 유지를 위해 dict 사용하거나 그냥 set 사용)
-        candidates = list(set(candidates))
+        # 중복 제거 (순서 유지를 위해 dict 사용)
+        return list(dict.fromkeys(candidates))
 
-        # 2. 고유명사 후보가 없을 경우 예외 처리 (빈 리스트 반환 혹은 전체 분석)
-        if not candidates:
-            return []
-            # 또는 아래처럼 기본 추출로 폴백(fallback)할 수도 있습니다.
-            # return self._fallback_extraction(text, top_n)
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        kw_model = self.kw_model
+        embedding_model = kw_model.model.embedding_model  # SentenceTransformer
+
+        # 토큰 길이만 계산 (패딩 없이 길이만 받는다 - 실제 토큰화는 encode 안에서 배치별로 한 번 더 일어남)
+        # 길이 계산과 encode 는 토크나이저 padding 설정이 서로 달라 설정을 바꿔 가며 호출되므로,
+        # 추론 풀의 다른 스레드와 겹치지 않도록 모두 tokenizer_lock 안에서 호출한다
+        with kw_model.tokenizer_lock:
+            encodings = embedding_model.tokenizer(
+                texts, padding=False, truncation="longest_first", max_length=embedding_model.max_seq_length,
+                return_length=True, return_attention_mask=False, return_token_type_ids=False
+            )
+        lengths = encodings["length"]
+
+        def encode(batch: List[str]) -> list:
+            with kw_model.tokenizer_lock:
+                return list(embedding_model.encode(batch, batch_size=len(batch), show_progress_bar=False))
 
-        # 3. KeyBERT에게 전체 텍스트가 아닌 '후보 단어들(candidates)' 중에서만 뽑으라고 시킴
-        keywords = self.kw_model.extract_keywords(
-            text,
-            candidates=candidates,  # 핵심 변경 사항
-            keyphrase_ngram_range=(1, 1),
-            stop_words=None,
-            top_n=top_n
-        )
+        # 짧은 후보 단어와 긴 기사가 섞여도 비슷한 길이끼리 배치로 묶어 패딩 낭비를 줄임
+        vectors = run_length_bucketed(texts, lengths, encode, MINILM_MAX_BATCH_TOKENS, MINILM_MAX_BATCH_SIZE)
+        return normalize_rows(np.stack(vectors))
 
-        return [kw[0] for kw in keywords]
+    @staticmethod
+    def _rank(candidates: List[str], candidate_embeddings: np.ndarray, doc_embedding: np.ndarray, top_n: int) -> list:
+        # 4. 정규화된 벡터끼리의 내적 = 코사인 유사도 (후보 전체를 한 번에 계산)
+        similarities = candidate_embeddings @ doc_embedding
+        top_indices = np.argsort(-similarities)[:top_n]
+        return [candidates[i] for i in top_indices]
 
     # (옵션) 후보가 없을 때 그냥 원래대로 추출하는 메서드
     def _fallback_extraction(self, text, top_n):
-        keywords = self.kw_model.extract_keywords(text, keyphrase_ngram_range=(1, 1), top_n=top_n)
+        kw_model = self.kw_model
+        with kw_model.tokenizer_lock:
+            keywords = kw_model.extract_keywords(text, keyphrase_ngram_range=(1, 1), top_n=top_n)
         return [kw[0] for kw in keywords]
\ No newline at end of file
@@ -1,11 +1,23 @@
 from ai_analyzer.application.usecase.analyze_news_usecase import AnalyzeNewsUseCase
-from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
-from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+from ai_analyzer.infrastructure.cache.analysis_result_cache import AnalysisResultCache, ANALYSIS_CACHE_ENABLED
+
+# 결과 포맷이 바뀌면 올려서 기존 캐시를 무효화
+ANALYSIS_RESULT_VERSION = "v2"
 
 class AnalyzeNewsUseCaseFactory:
     @staticmethod
     def create() -> AnalyzeNewsUseCase:
+        # 어댑터는 torch / transformers 를 끌어오므로 처음 유스케이스를 만들 때 import
+        from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
+        from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+
         return AnalyzeNewsUseCase(
             sentiment_port=FinbertSentimentAdapter.getInstance(),
-            keyword_port=KeybertKeywordAdapter.getInstance()
-        )
\ No newline at end of file
+            keyword_port=KeybertKeywordAdapter.getInstance(),
+            cache_port=AnalysisResultCache.getInstance() if ANALYSIS_CACHE_ENABLED else None,
+            model_signature="|".join([
+                FinbertSentimentAdapter.model_signature(),
+                KeybertKeywordAdapter.model_signature(),
+                ANALYSIS_RESULT_VERSION
+            ])
+        )
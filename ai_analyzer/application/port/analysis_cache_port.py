@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ai_analyzer.domain.value_object.analysis_result_vo import AnalysisResultVO
+
+class AnalysisCachePort(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[AnalysisResultVO]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, result: AnalysisResultVO) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
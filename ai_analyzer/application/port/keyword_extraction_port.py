@@ -4,4 +4,8 @@ from typing import List
 class KeywordExtractionPort(ABC):
     @abstractmethod
     def extract_keywords(self, text: str, top_n: int = 5) -> List[str]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def extract_keywords_batch(self, texts: List[str], top_n: int = 5) -> List[List[str]]:
+        pass
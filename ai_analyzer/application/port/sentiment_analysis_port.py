@@ -1,6 +1,15 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 class SentimentAnalysisPort(ABC):
     @abstractmethod
     def analyze(self, text: str) -> dict:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def analyze_batch(self, texts: List[str]) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def analyze_long_document(self, text: str, return_windows: bool = False) -> dict:
+        pass
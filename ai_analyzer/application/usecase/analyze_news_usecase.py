@@ -1,22 +1,141 @@
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Tuple
+
+from ai_analyzer.application.port.analysis_cache_port import AnalysisCachePort
 from ai_analyzer.application.port.sentiment_analysis_port import SentimentAnalysisPort
 from ai_analyzer.application.port.keyword_extraction_port import KeywordExtractionPort
 from ai_analyzer.domain.value_object.analysis_result_vo import AnalysisResultVO
 
 
 class AnalyzeNewsUseCase:
-    def __init__(self, sentiment_port: SentimentAnalysisPort, keyword_port: KeywordExtractionPort):
+    def __init__(
+        self,
+        sentiment_port: SentimentAnalysisPort,
+        keyword_port: KeywordExtractionPort,
+        cache_port: Optional[AnalysisCachePort] = None,
+        model_signature: str = ""
+    ):
         self.sentiment_port = sentiment_port
         self.keyword_port = keyword_port
+        # 캐시 키에 모델 이름/버전을 포함시켜 모델이 바뀌면 자동으로 무효화
+        self.cache_port = cache_port
+        self.model_signature = model_signature
+
+    def analyze(
+        self,
+        content: str,
+        long_document: bool = False,
+        return_windows: bool = False,
+        top_n: int = 5
+    ) -> AnalysisResultVO:
+        cache_key = self._cache_key(content, top_n, long_document, return_windows)
+        if self.cache_port is not None:
+            cached = self.cache_port.get(cache_key)
+            if cached is not None:
+                return cached
 
-    def analyze(self, content: str) -> AnalysisResultVO:
-        # 3. 감성 분석 수행
-        sentiment_result = self.sentiment_port.analyze(content)
+        # 3. 감성 분석 수행 (긴 기사는 슬라이딩 윈도우로 전체 본문 반영)
+        sentiment_result = self._analyze_sentiment(content, long_document, return_windows)
 
         # 4. 키워드 추출 수행
-        keywords = self.keyword_port.extract_keywords(content, top_n=5)
+        keywords = self.keyword_port.extract_keywords(content, top_n=top_n)
+
+        result = self._to_result(sentiment_result, keywords)
+        if self.cache_port is not None:
+            self.cache_port.set(cache_key, result)
+        return result
+
+    async def analyze_async(
+        self,
+        content: str,
+        executor: Executor,
+        long_document: bool = False,
+        return_windows: bool = False,
+        top_n: int = 5
+    ) -> AnalysisResultVO:
+        """
+        analyze 와 같은 결과를 반환하되, 감성 분석과 키워드 추출을 executor 에서 동시에 실행한다.
+        (두 작업 모두 네이티브 코드에서 GIL 을 놓으므로 지연시간이 합이 아닌 max 에 가까워짐)
+        결과의 timings 에 단계별 소요 시간(ms)을 담는다.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        cache_key = self._cache_key(content, top_n, long_document, return_windows)
+        if self.cache_port is not None:
+            cached, cache_ms = await loop.run_in_executor(executor, _timed, self.cache_port.get, cache_key)
+            if cached is not None:
+                return cached.model_copy(update={"timings": dict(
+                    cache_ms=cache_ms, total_ms=_elapsed_ms(start)
+                )})
+
+        (sentiment_result, sentiment_ms), (keywords, keywords_ms) = await asyncio.gather(
+            loop.run_in_executor(executor, _timed, self._analyze_sentiment, content, long_document, return_windows),
+            loop.run_in_executor(executor, _timed, self.keyword_port.extract_keywords, content, top_n)
+        )
+
+        result = self._to_result(sentiment_result, keywords)
+        if self.cache_port is not None:
+            await loop.run_in_executor(executor, self.cache_port.set, cache_key, result)
+
+        return result.model_copy(update={"timings": dict(
+            sentiment_ms=sentiment_ms, keywords_ms=keywords_ms, total_ms=_elapsed_ms(start)
+        )})
+
+    def _analyze_sentiment(self, content: str, long_document: bool, return_windows: bool) -> dict:
+        if long_document:
+            return self.sentiment_port.analyze_long_document(content, return_windows=return_windows)
+        return self.sentiment_port.analyze(content)
 
+    @staticmethod
+    def _to_result(sentiment_result: dict, keywords: List[str]) -> AnalysisResultVO:
         return AnalysisResultVO(
             sentiment_label=sentiment_result['label'],
             sentiment_score=sentiment_result['score'],
-            keywords=keywords
-        )
\ No newline at end of file
+            keywords=keywords,
+            sentiment_windows=sentiment_result.get('windows')
+        )
+
+    def analyze_batch(self, contents: List[str], top_n: int = 5) -> List[AnalysisResultVO]:
+        results: List[Optional[AnalysisResultVO]] = [None] * len(contents)
+        cache_keys = [self._cache_key(content, top_n) for content in contents]
+
+        if self.cache_port is not None:
+            for i, cache_key in enumerate(cache_keys):
+                results[i] = self.cache_port.get(cache_key)
+
+        # 캐시에 없는 기사만 모아서 감성 분석/키워드 추출을 각각 배치로 처리 (입력 순서 유지)
+        missing = [i for i, result in enumerate(results) if result is None]
+        missing_contents = [contents[i] for i in missing]
+        sentiment_results = self.sentiment_port.analyze_batch(missing_contents)
+        keywords_results = self.keyword_port.extract_keywords_batch(missing_contents, top_n=top_n)
+
+        for i, sentiment_result, keywords in zip(missing, sentiment_results, keywords_results):
+            results[i] = self._to_result(sentiment_result, keywords)
+            if self.cache_port is not None:
+                self.cache_port.set(cache_keys[i], results[i])
+        return results
+
+    def _cache_key(self, content: str, top_n: int, long_document: bool = False, return_windows: bool = False) -> str:
+        # 유니코드 정규화 + 공백 정리 후 해시 (같은 기사면 같은 키)
+        normalized = re.sub(r'\s+', ' ', unicodedata.normalize("NFC", content)).strip()
+        mode = "long" if long_document else "short"
+        if return_windows:
+            mode += "+windows"
+        key_source = f"{self.model_signature}\n{mode}\n{top_n}\n{normalized}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def _timed(fn: Callable[..., Any], *args) -> Tuple[Any, float]:
+    # 워커 스레드 안에서 실제 실행 시간만 측정 (큐 대기 시간 제외)
+    start = time.perf_counter()
+    return fn(*args), _elapsed_ms(start)
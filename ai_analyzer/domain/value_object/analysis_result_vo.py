@@ -1,7 +1,11 @@
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List, Optional
 
 class AnalysisResultVO(BaseModel):
     sentiment_label: str
     sentiment_score: float
-    keywords: List[str]
\ No newline at end of file
+    keywords: List[str]
+    # 긴 기사 모드에서 return_windows=True 일 때만 채워짐
+    sentiment_windows: Optional[List[dict]] = None
+    # analyze_async 에서 채워지는 단계별 소요 시간(ms)
+    timings: Optional[Dict[str, float]] = None
@@ -0,0 +1,46 @@
+from typing import Any, Callable, List, Sequence
+
+from ai_analyzer.infrastructure.batching.micro_batcher import split_by_token_budget
+
+
+def plan_length_bucketed_batches(lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    입력을 토큰 길이순으로 정렬한 뒤 토큰 상한(배치 크기 x 최장 길이) 안에서 묶는다.
+    비슷한 길이끼리 같은 배치에 들어가므로 패딩 낭비가 줄고, 짧은 입력은 더 큰 배치로 묶인다.
+    반환값은 원래 입력 기준 인덱스 묶음.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    sorted_lengths = [lengths[i] for i in order]
+    return [
+        [order[j] for j in batch]
+        for batch in split_by_token_budget(sorted_lengths, max_batch_tokens, max_batch_size)
+    ]
+
+
+def run_length_bucketed(
+    items: Sequence[Any],
+    lengths: Sequence[int],
+    process_batch: Callable[[List[Any]], List[Any]],
+    max_batch_tokens: int,
+    max_batch_size: int,
+) -> List[Any]:
+    """
+    길이별로 묶어 process_batch 를 실행하고, 결과를 원래 입력 순서로 되돌려 반환한다.
+    """
+    results: List[Any] = [None] * len(items)
+    for indices in plan_length_bucketed_batches(lengths, max_batch_tokens, max_batch_size):
+        for i, result in zip(indices, process_batch([items[i] for i in indices])):
+            results[i] = result
+    return results
+
+
+def padding_stats(lengths: Sequence[int], batches: List[List[int]]) -> dict:
+    """배치 계획의 실제 토큰 수 / 패딩 포함 토큰 수 / 낭비 비율."""
+    real_tokens = sum(lengths)
+    padded_tokens = sum(len(batch) * max(lengths[i] for i in batch) for batch in batches if batch)
+    return dict(
+        batches=len(batches),
+        real_tokens=real_tokens,
+        padded_tokens=padded_tokens,
+        waste_ratio=(1 - real_tokens / padded_tokens) if padded_tokens else 0.0,
+    )
@@ -0,0 +1,119 @@
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from queue import Queue, Empty
+from typing import Any, Callable, List, Sequence
+
+
+def split_by_token_budget(lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    토큰 길이 목록을 받아, 패딩 포함 토큰 수(배치 크기 x 최장 길이)가
+    max_batch_tokens 를 넘지 않도록 인덱스 묶음으로 나눈다.
+    (입력 순서를 그대로 유지하며 앞에서부터 채운다)
+    """
+    batches: List[List[int]] = []
+    cur: List[int] = []
+    cur_max = 0
+
+    for idx, length in enumerate(lengths):
+        new_max = max(cur_max, length)
+        if cur and (len(cur) >= max_batch_size or new_max * (len(cur) + 1) > max_batch_tokens):
+            batches.append(cur)
+            cur, new_max = [], length
+        cur.append(idx)
+        cur_max = new_max
+
+    if cur:
+        batches.append(cur)
+    return batches
+
+
+class MicroBatcher:
+    """
+    여러 스레드에서 동시에 들어온 단건 요청을 짧은 대기 시간(max_wait_ms) 동안 모아서
+    process_batch 한 번으로 처리하는 동적 마이크로 배치 엔진.
+
+    - process_batch(items) 는 items 와 같은 길이/순서의 결과 리스트를 반환해야 한다.
+    - 배치는 max_batch_size 개가 모이거나 대기 시간이 끝나면 즉시 처리된다.
+    - 토큰 상한(max tokens)은 process_batch 쪽에서 split_by_token_budget 으로 적용한다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        name: str = "micro-batcher",
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self.name = name
+        self._start()
+        _batchers.add(self)
+
+    def _start(self) -> None:
+        self._queue: Queue = Queue()
+        self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def submit_many(self, items: Sequence[Any]) -> List[Future]:
+        return [self.submit(item) for item in items]
+
+    def _collect(self) -> list:
+        # 첫 요청이 올 때까지는 블로킹, 이후 max_wait 동안만 추가 요청을 기다린다.
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    # 대기 시간이 끝났어도 이미 큐에 쌓여 있는 요청은 함께 처리
+                    batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            items = [item for item, _ in batch]
+            try:
+                results = list(self.process_batch(items))
+                if len(results) != len(batch):
+                    # zip 으로 나눠 주면 남는 요청은 결과를 영원히 기다리므로 배치 전체를 실패 처리
+                    raise RuntimeError(
+                        f"{self.name}: process_batch returned {len(results)} results for {len(batch)} items"
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+# fork 된 자식 프로세스에는 워커 스레드가 따라오지 않으므로 (큐 내부 락 상태도 신뢰할 수 없음)
+# 자식에서 큐와 워커 스레드를 새로 만든다. (preload-then-fork 워커 모드 대비)
+_batchers: "weakref.WeakSet[MicroBatcher]" = weakref.WeakSet()
+
+
+def _restart_batchers_after_fork() -> None:
+    for batcher in list(_batchers):
+        batcher._start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_batchers_after_fork)
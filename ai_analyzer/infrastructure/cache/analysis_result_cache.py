@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import redis
+from pydantic import ValidationError
+
+from ai_analyzer.application.port.analysis_cache_port import AnalysisCachePort
+from ai_analyzer.domain.value_object.analysis_result_vo import AnalysisResultVO
+from config.redis_config import get_redis
+
+# 캐시 설정 (환경변수로 조정 가능)
+ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+ANALYSIS_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_LOCAL_MAX_ENTRIES", "4096"))
+ANALYSIS_CACHE_LOCAL_TTL_SEC = int(os.getenv("ANALYSIS_CACHE_LOCAL_TTL_SEC", "600"))
+ANALYSIS_CACHE_REDIS_TTL_SEC = int(os.getenv("ANALYSIS_CACHE_REDIS_TTL_SEC", "86400"))
+# AnalysisResultVO 구조가 바뀌면 올린다 (예전 구조로 저장된 값은 다른 키가 되어 읽히지 않음)
+ANALYSIS_CACHE_SCHEMA_VERSION = "v2"
+ANALYSIS_CACHE_REDIS_PREFIX = f"ai_analyzer:result:{ANALYSIS_CACHE_SCHEMA_VERSION}:"
+
+
+class LRUCache:
+    """
+    크기 상한과 TTL 이 있는 스레드 안전 LRU 캐시 (프로세스 내부 1차 캐시용).
+    """
+
+    def __init__(self, max_entries: int, ttl_sec: float):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl_sec)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class AnalysisResultCache(AnalysisCachePort):
+    """
+    AnalyzeNewsUseCase 결과용 2단 캐시.
+    - 1차: 프로세스 내 LRU (마이크로초 단위 응답)
+    - 2차: Redis (워커/파드 간 공유). Redis 장애 시에는 캐시 없이 동작한다.
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.local = LRUCache(ANALYSIS_CACHE_LOCAL_MAX_ENTRIES, ANALYSIS_CACHE_LOCAL_TTL_SEC)
+            cls.__instance.redis = get_redis()
+            cls.__instance.counters = dict(local_hits=0, redis_hits=0, misses=0, redis_errors=0, invalid_entries=0)
+            cls.__instance.counter_lock = threading.Lock()
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def get(self, key: str) -> Optional[AnalysisResultVO]:
+        result = self.local.get(key)
+        if result is not None:
+            self._count("local_hits")
+            return result
+
+        try:
+            raw = self.redis.get(ANALYSIS_CACHE_REDIS_PREFIX + key)
+        except redis.RedisError as e:
+            print(f"[AnalysisResultCache] redis get failed: {e}")
+            self._count("redis_errors")
+            raw = None
+
+        if raw is None:
+            self._count("misses")
+            return None
+
+        try:
+            result = AnalysisResultVO.model_validate_json(raw)
+        except ValidationError as e:
+            # 깨졌거나 예전 스키마로 저장된 값은 없는 것으로 보고 지운다 (다시 분석해서 덮어씀)
+            print(f"[AnalysisResultCache] invalid cached value, dropping: {e.error_count()} errors")
+            self._count("invalid_entries")
+            self._count("misses")
+            self._delete(key)
+            return None
+        # Redis 에서 찾은 값은 1차 캐시에도 올려둔다
+        self.local.set(key, result)
+        self._count("redis_hits")
+        return result
+
+    def set(self, key: str, result: AnalysisResultVO) -> None:
+        self.local.set(key, result)
+        try:
+            self.redis.set(
+                ANALYSIS_CACHE_REDIS_PREFIX + key,
+                result.model_dump_json(),
+                ex=ANALYSIS_CACHE_REDIS_TTL_SEC
+            )
+        except redis.RedisError as e:
+            print(f"[AnalysisResultCache] redis set failed: {e}")
+            self._count("redis_errors")
+
+    def _delete(self, key: str) -> None:
+        try:
+            self.redis.delete(ANALYSIS_CACHE_REDIS_PREFIX + key)
+        except redis.RedisError as e:
+            print(f"[AnalysisResultCache] redis delete failed: {e}")
+            self._count("redis_errors")
+
+    def stats(self) -> dict:
+        with self.counter_lock:
+            counters = dict(self.counters)
+        lookups = counters["local_hits"] + counters["redis_hits"] + counters["misses"]
+        hits = counters["local_hits"] + counters["redis_hits"]
+        return dict(
+            **counters,
+            hit_rate=(hits / lookups) if lookups else 0.0,
+            local_size=len(self.local),
+            local_max_entries=ANALYSIS_CACHE_LOCAL_MAX_ENTRIES,
+            local_ttl_sec=ANALYSIS_CACHE_LOCAL_TTL_SEC,
+            redis_ttl_sec=ANALYSIS_CACHE_REDIS_TTL_SEC,
+        )
+
+    def _count(self, name: str) -> None:
+        with self.counter_lock:
+            self.counters[name] += 1
@@ -0,0 +1,173 @@
+import fcntl
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# 후보 단어 임베딩 캐시 설정 (환경변수로 조정 가능)
+# - KEYWORD_EMBEDDING_CACHE_SIZE: 메모리 LRU 에 보관할 단어 수
+# - KEYWORD_EMBEDDING_CACHE_DIR: 지정하면 디스크(memmap) 저장소를 함께 사용
+# - KEYWORD_EMBEDDING_DISK_CAPACITY: 디스크 저장소에 보관할 최대 단어 수
+KEYWORD_EMBEDDING_CACHE_SIZE = int(os.getenv("KEYWORD_EMBEDDING_CACHE_SIZE", "50000"))
+KEYWORD_EMBEDDING_CACHE_DIR = os.getenv("KEYWORD_EMBEDDING_CACHE_DIR")
+KEYWORD_EMBEDDING_DISK_CAPACITY = int(os.getenv("KEYWORD_EMBEDDING_DISK_CAPACITY", "500000"))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    # 코사인 유사도를 내적 한 번으로 계산할 수 있도록 L2 정규화
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class DiskEmbeddingStore:
+    """
+    memory-mapped 파일(vectors.f32) + 단어 목록(words.jsonl)으로 구성된 추가 전용 저장소.
+    여러 워커 프로세스가 같은 디렉터리를 공유할 수 있도록 쓰기 시에는 파일 락을 건다.
+    """
+
+    def __init__(self, directory: str, dim: int, capacity: int):
+        os.makedirs(directory, exist_ok=True)
+        self.dim = dim
+        self.capacity = capacity
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.words_path = os.path.join(directory, "words.jsonl")
+        self.lock_path = os.path.join(directory, ".lock")
+
+        self.rows: Dict[str, int] = {}
+        self._words_offset = 0
+        self._lock = threading.Lock()
+
+        with self._file_lock():
+            mode = "r+" if os.path.exists(self.vectors_path) else "w+"
+            self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode=mode, shape=(capacity, dim))
+            self._refresh()
+
+    def get(self, word: str) -> Optional[np.ndarray]:
+        row = self.rows.get(word)
+        if row is None:
+            return None
+        return np.array(self.vectors[row])
+
+    def put_many(self, words: List[str], vectors: np.ndarray) -> None:
+        with self._lock, self._file_lock():
+            # 다른 프로세스가 추가한 단어를 먼저 반영한 뒤 새 단어만 기록
+            self._refresh()
+            lines = []
+            for word, vector in zip(words, vectors):
+                if word in self.rows:
+                    continue
+                row = len(self.rows)
+                if row >= self.capacity:
+                    break
+                self.vectors[row] = vector
+                self.rows[word] = row
+                lines.append(json.dumps(word, ensure_ascii=False) + "\n")
+
+            if lines:
+                self.vectors.flush()
+                with open(self.words_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                self._words_offset = os.path.getsize(self.words_path)
+
+    def _refresh(self) -> None:
+        if not os.path.exists(self.words_path):
+            return
+        with open(self.words_path, "r", encoding="utf-8") as f:
+            f.seek(self._words_offset)
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                self.rows.setdefault(json.loads(line), len(self.rows))
+            self._words_offset = f.tell()
+
+    def _file_lock(self):
+        return _FileLock(self.lock_path)
+
+
+class _FileLock:
+    def __init__(self, path: str):
+        self.path = path
+
+    def __enter__(self):
+        self._fd = open(self.path, "a")
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._fd.close()
+
+
+class CandidateEmbeddingCache:
+    """
+    KeyBERT 후보 단어(회사명, 티커, 기관명 등)의 임베딩 캐시.
+    - 키: (모델 이름, 단어) - 모델마다 별도 인스턴스/디렉터리를 사용
+    - 1차: 메모리 LRU, 2차(선택): memmap 디스크 저장소
+    - 캐시에 없는 단어만 embed_fn 한 번으로 계산한다
+    """
+
+    def __init__(self, model_name: str, dim: int, max_entries: int = KEYWORD_EMBEDDING_CACHE_SIZE,
+                 disk_dir: Optional[str] = KEYWORD_EMBEDDING_CACHE_DIR,
+                 disk_capacity: int = KEYWORD_EMBEDDING_DISK_CAPACITY):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.disk: Optional[DiskEmbeddingStore] = None
+        if disk_dir:
+            self.disk = DiskEmbeddingStore(os.path.join(disk_dir, model_name.replace("/", "__")), dim, disk_capacity)
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = dict(hits=0, misses=0)
+
+    def lookup(self, words: List[str], embed_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        words 순서대로 정규화된 임베딩 행렬 (len(words), dim) 을 반환.
+        """
+        found: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+
+        with self._lock:
+            for word in words:
+                vector = self._memory.get(word)
+                if vector is not None:
+                    self._memory.move_to_end(word)
+                    found[word] = vector
+                elif self.disk is not None and (vector := self.disk.get(word)) is not None:
+                    found[word] = vector
+                    self._remember(word, vector)
+                else:
+                    missing.append(word)
+            self.counters["hits"] += len(found)
+            self.counters["misses"] += len(missing)
+
+        if missing:
+            vectors = normalize_rows(embed_fn(missing))
+            with self._lock:
+                for word, vector in zip(missing, vectors):
+                    found[word] = vector
+                    self._remember(word, vector)
+            self._persist(missing, vectors)
+
+        return np.stack([found[word] for word in words])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(
+                **self.counters,
+                memory_size=len(self._memory),
+                disk_size=len(self.disk.rows) if self.disk is not None else None
+            )
+
+    def _remember(self, word: str, vector: np.ndarray) -> None:
+        self._memory[word] = vector
+        self._memory.move_to_end(word)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _persist(self, words: List[str], vectors: np.ndarray) -> None:
+        if self.disk is not None:
+            self.disk.put_many(words, vectors)
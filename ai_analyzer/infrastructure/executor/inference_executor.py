@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, List
+
+# 추론 전용 워커 풀 설정 (환경변수로 조정 가능)
+# - INFERENCE_MAX_CONCURRENCY: 동시에 추론을 수행하는 워커 스레드 수
+# - INFERENCE_MAX_QUEUE: 워커가 모두 바쁠 때 대기할 수 있는 요청 수 (초과 시 즉시 거절)
+INFERENCE_MAX_CONCURRENCY = int(os.getenv("INFERENCE_MAX_CONCURRENCY", "4"))
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "32"))
+
+
+class InferenceQueueFullError(Exception):
+    """추론 대기열이 가득 차서 요청을 받을 수 없을 때 발생."""
+    pass
+
+
+class _TrackedExecutor(Executor):
+    # slot 안에서 제출된 작업을 기록해 두는 풀 래퍼 (요청이 취소되어도 실제 작업이 끝날 때까지 pending 에 남기기 위함)
+    def __init__(self, pool: ThreadPoolExecutor):
+        self.pool = pool
+        self.futures: List[Future] = []
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = self.pool.submit(fn, *args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+class InferenceExecutor:
+    """
+    FinBERT / Kiwi / KeyBERT 추론을 이벤트 루프 밖의 스레드 풀에서 실행한다.
+    - 워커 수(INFERENCE_MAX_CONCURRENCY)로 동시 추론 수를 제한
+    - 실행 중 + 대기 중인 요청이 한도를 넘으면 InferenceQueueFullError 로 빠르게 거절
+    - 모델 프리로드는 하지 않는다 (서버 시작 시 레지스트리 프리로드 스레드가 담당, 실패해도 풀은 계속 동작)
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.max_concurrency = INFERENCE_MAX_CONCURRENCY
+            cls.__instance.max_queue = INFERENCE_MAX_QUEUE
+            cls.__instance.pool = ThreadPoolExecutor(
+                max_workers=INFERENCE_MAX_CONCURRENCY,
+                thread_name_prefix="inference"
+            )
+            # 이벤트 루프 스레드에서만 증감하므로 별도 락은 필요 없음
+            cls.__instance.pending = 0
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        요청 하나가 추론 풀을 사용하는 구간. 한도를 넘으면 즉시 InferenceQueueFullError.
+        (하나의 요청이 구간 안에서 여러 작업을 pool 에 제출할 수 있다 - 예: analyze_async)
+        """
+        if self.pending >= self.max_concurrency + self.max_queue:
+            raise InferenceQueueFullError(
+                f"inference queue is full (pending={self.pending}, "
+                f"concurrency={self.max_concurrency}, queue={self.max_queue})"
+            )
+
+        self.pending += 1
+        tracked = _TrackedExecutor(self.pool)
+        try:
+            yield tracked
+        finally:
+            # 클라이언트가 끊겨 요청이 취소되어도 워커 스레드의 작업은 끝까지 돌므로, 끝날 때까지 한도에 포함한다
+            self._release_when_done(tracked.futures)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        async with self.slot() as pool:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+
+    def _release_when_done(self, futures: List[Future]) -> None:
+        running = [future for future in futures if not future.done()]
+        if not running:
+            self.pending -= 1
+            return
+
+        loop = asyncio.get_running_loop()
+        left = [len(running)]
+
+        def finish() -> None:
+            left[0] -= 1
+            if left[0] == 0:
+                self.pending -= 1
+
+        def on_done(_) -> None:
+            # 완료 콜백은 워커 스레드에서 불리므로 카운터 변경은 이벤트 루프 스레드로 넘긴다
+            try:
+                loop.call_soon_threadsafe(finish)
+            except RuntimeError:
+                pass  # 서버 종료 중 (이벤트 루프가 이미 닫힘)
+
+        for future in running:
+            future.add_done_callback(on_done)
+
+    def stats(self) -> dict:
+        return dict(
+            pending=self.pending,
+            max_concurrency=self.max_concurrency,
+            max_queue=self.max_queue
+        )
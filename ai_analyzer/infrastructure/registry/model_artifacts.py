@@ -0,0 +1,209 @@
+"""
+오프라인 모델 아티팩트 번들.
+
+허브 이름 대신 로컬 디렉터리에서 모델/토크나이저를 읽어 오도록 한다.
+- 번들 구조: <root>/<version>/{manifest.json, finbert/, minilm/}, <root>/current -> <version>
+- 가중치는 safetensors 로 저장 -> 로드 시 memory-map 되어 피크 메모리/로드 시간이 줄어든다
+- manifest.json 에 파일별 크기와 sha256 을 기록해 손상/부분 복사를 감지한다
+
+번들 만들기 (네트워크가 되는 곳에서 한 번):
+    python -m ai_analyzer.infrastructure.registry.model_artifacts build --output /models --version 2025.01
+검증:
+    python -m ai_analyzer.infrastructure.registry.model_artifacts verify /models/current
+서버 실행 시:
+    MODEL_ARTIFACT_DIR=/models/current
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+
+# 지정하면 모든 모델을 이 번들에서 로드하고 허브에는 접근하지 않는다 (오프라인 모드)
+MODEL_ARTIFACT_DIR = os.getenv("MODEL_ARTIFACT_DIR")
+# 로드 시 검증 수준: none | size (파일 크기만, 기본) | sha256 (전체 해시 - 느림)
+MODEL_ARTIFACT_VERIFY = os.getenv("MODEL_ARTIFACT_VERIFY", "size")
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def _bundled_models() -> Dict[str, str]:
+    # 번들 키 -> 허브 이름 (어댑터의 MODEL_NAME 을 그대로 사용)
+    from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
+    from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+
+    return {
+        "finbert": FinbertSentimentAdapter.MODEL_NAME,
+        "minilm": KeybertKeywordAdapter.MODEL_NAME,
+    }
+
+
+def resolve_model_path(key: str, hub_name: str) -> str:
+    """
+    MODEL_ARTIFACT_DIR 이 없으면 허브 이름을 그대로, 있으면 번들 안의 로컬 경로를 반환한다.
+    번들이 손상되었거나 다른 모델로 만들어졌으면 RuntimeError.
+    """
+    if not MODEL_ARTIFACT_DIR:
+        return hub_name
+
+    manifest = load_manifest(MODEL_ARTIFACT_DIR, MODEL_ARTIFACT_VERIFY)
+    entry = manifest["models"].get(key)
+    if entry is None:
+        raise RuntimeError(f"모델 번들({MODEL_ARTIFACT_DIR})에 {key} 가 없습니다.")
+    if entry["source"] != hub_name:
+        raise RuntimeError(
+            f"모델 번들의 {key} 는 {entry['source']} 로 만들어졌습니다 (필요: {hub_name}). 번들을 다시 만들어 주세요."
+        )
+    return os.path.join(MODEL_ARTIFACT_DIR, key)
+
+
+def enable_offline_mode() -> None:
+    # 번들을 쓰는 경우 허브 조회(HEAD 요청 등)를 하지 않도록 설정
+    # (huggingface_hub 가 import 되기 전에 호출되어야 완전히 적용됨)
+    if MODEL_ARTIFACT_DIR:
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+
+@lru_cache(maxsize=None)
+def load_manifest(bundle_dir: str, verify: str = "size") -> dict:
+    manifest_path = os.path.join(bundle_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise RuntimeError(f"{manifest_path} 가 없습니다. 모델 번들 경로를 확인해 주세요.")
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if verify != "none":
+        problems = _verify(bundle_dir, manifest, full=(verify == "sha256"))
+        if problems:
+            raise RuntimeError(f"모델 번들 검증 실패 ({bundle_dir}): " + "; ".join(problems[:5]))
+    return manifest
+
+
+def build_bundle(output_root: str, version: str, activate: bool = True) -> str:
+    """
+    필요한 모델/토크나이저를 허브에서 받아 <output_root>/<version> 에 safetensors 로 저장한다.
+    임시 디렉터리에 만든 뒤 rename 하므로 중간에 실패해도 불완전한 번들이 남지 않는다.
+    """
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    from sentence_transformers import SentenceTransformer
+
+    bundle_dir = os.path.join(output_root, version)
+    if os.path.exists(bundle_dir):
+        raise FileExistsError(f"{bundle_dir} 가 이미 있습니다. 다른 --version 을 지정해 주세요.")
+
+    staging_dir = f"{bundle_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    models = {}
+    for key, hub_name in _bundled_models().items():
+        target = os.path.join(staging_dir, key)
+        print(f"Packaging {hub_name} -> {target}")
+        if key == "finbert":
+            AutoTokenizer.from_pretrained(hub_name).save_pretrained(target)
+            AutoModelForSequenceClassification.from_pretrained(hub_name).save_pretrained(
+                target, safe_serialization=True
+            )
+            kind = "transformers"
+        else:
+            SentenceTransformer(hub_name).save(target, safe_serialization=True)
+            kind = "sentence-transformers"
+        models[key] = dict(source=hub_name, kind=kind, files=_checksums(target))
+
+    manifest = dict(
+        format=MANIFEST_FORMAT,
+        version=version,
+        created_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        libraries=_library_versions(),
+        models=models,
+    )
+    with open(os.path.join(staging_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    os.rename(staging_dir, bundle_dir)
+    if activate:
+        _point_current(output_root, version)
+    print(f"Model bundle written to {bundle_dir}")
+    return bundle_dir
+
+
+def _point_current(output_root: str, version: str) -> None:
+    # current 심볼릭 링크를 원자적으로 교체
+    link = os.path.join(output_root, "current")
+    tmp_link = f"{link}.tmp-{os.getpid()}"
+    os.symlink(version, tmp_link)
+    os.replace(tmp_link, link)
+
+
+def _checksums(directory: str) -> Dict[str, dict]:
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            files[os.path.relpath(path, directory)] = dict(size=os.path.getsize(path), sha256=_sha256(path))
+    return files
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _verify(bundle_dir: str, manifest: dict, full: bool) -> list:
+    problems = []
+    if manifest.get("format") != MANIFEST_FORMAT:
+        problems.append(f"지원하지 않는 manifest format: {manifest.get('format')}")
+    for key, entry in manifest.get("models", {}).items():
+        for relpath, expected in entry["files"].items():
+            path = os.path.join(bundle_dir, key, relpath)
+            if not os.path.exists(path):
+                problems.append(f"{key}/{relpath} 없음")
+            elif os.path.getsize(path) != expected["size"]:
+                problems.append(f"{key}/{relpath} 크기 불일치")
+            elif full and _sha256(path) != expected["sha256"]:
+                problems.append(f"{key}/{relpath} sha256 불일치")
+    return problems
+
+
+def _library_versions() -> Dict[str, Optional[str]]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for package in ("torch", "transformers", "sentence-transformers", "safetensors", "tokenizers"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오프라인 모델 아티팩트 번들 생성/검증")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="허브에서 모델을 받아 번들 생성")
+    build.add_argument("--output", required=True, help="번들 루트 디렉터리")
+    build.add_argument("--version", default=time.strftime("%Y%m%d-%H%M%S"))
+    build.add_argument("--no-activate", action="store_true", help="current 링크를 바꾸지 않음")
+
+    verify = commands.add_parser("verify", help="manifest 의 sha256 과 파일 비교")
+    verify.add_argument("bundle_dir")
+
+    args = parser.parse_args()
+    if args.command == "build":
+        build_bundle(args.output, args.version, activate=not args.no_activate)
+    else:
+        manifest = load_manifest(os.path.realpath(args.bundle_dir), "sha256")
+        print(f"OK: version {manifest['version']} ({', '.join(manifest['models'])})")
+
+
+if __name__ == "__main__":
+    main()
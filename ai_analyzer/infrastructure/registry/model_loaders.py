@@ -0,0 +1,75 @@
+# 기본 모델 로더/워밍업 정의.
+# torch / transformers / keybert / kiwipiepy 는 로더 함수 안에서만 import 한다.
+import threading
+
+from ai_analyzer.infrastructure.registry.model_artifacts import enable_offline_mode, resolve_model_path
+
+# 모델 번들(MODEL_ARTIFACT_DIR)을 쓰면 transformers/huggingface_hub 가 import 되기 전에 오프라인 모드로 전환
+enable_offline_mode()
+
+WARMUP_TEXTS = [
+    "삼성전자가 3분기 영업이익이 시장 전망치를 크게 웃돌았다고 발표했다.",
+    "미국 연준의 금리 인상 우려로 코스피가 하락 마감했다. " * 20,
+]
+
+
+def load_finbert():
+    from ai_analyzer.adapter.output.ai.finbert_backend import load_finbert_model
+    from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
+
+    # MODEL_ARTIFACT_DIR 이 있으면 로컬 번들(safetensors, mmap)에서, 없으면 허브 이름으로 로드
+    return load_finbert_model(resolve_model_path("finbert", FinbertSentimentAdapter.MODEL_NAME))
+
+
+def finbert_fork_safe() -> bool:
+    # ONNX Runtime 세션은 생성 시 스레드 풀을 만들므로 fork 후 자식에서 쓸 수 없다
+    from ai_analyzer.adapter.output.ai.finbert_backend import FINBERT_BACKEND
+
+    return not FINBERT_BACKEND.startswith("onnx")
+
+
+def warmup_finbert(model) -> None:
+    # 짧은 글/긴 글 배치를 한 번씩 돌려 커널과 토크나이저 캐시를 데운다
+    for texts in ([WARMUP_TEXTS[0]], WARMUP_TEXTS):
+        batch = model.tokenizer(
+            texts, truncation=True, max_length=512, padding=True, return_tensors=model.backend.tensor_type
+        )
+        model.backend.predict_logits(batch)
+
+
+def load_minilm():
+    from keybert import KeyBERT
+    from sentence_transformers import SentenceTransformer
+    from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+
+    model_path = resolve_model_path("minilm", KeybertKeywordAdapter.MODEL_NAME)
+    print(f"Loading KeyBERT ({model_path})...")
+    kw_model = KeyBERT(model=SentenceTransformer(model_path))
+    # fast tokenizer 는 padding/truncation 설정을 바꾸며 호출되므로 스레드 간 동시 호출을 막는다
+    # (encode 도 안에서 같은 토크나이저를 쓰므로 토큰화/encode 모두 이 락 안에서)
+    kw_model.tokenizer_lock = threading.Lock()
+    return kw_model
+
+
+def warmup_minilm(kw_model) -> None:
+    with kw_model.tokenizer_lock:
+        kw_model.model.embed(WARMUP_TEXTS)
+
+
+def load_kiwi():
+    from kiwipiepy import Kiwi
+    from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KIWI_NUM_WORKERS
+
+    print("Loading Kiwi...")
+    return Kiwi(num_workers=KIWI_NUM_WORKERS)
+
+
+def warmup_kiwi(kiwi) -> None:
+    list(kiwi.analyze(WARMUP_TEXTS))
+
+
+def register_default_models(registry) -> None:
+    registry.register("finbert", load_finbert, warmup_finbert, fork_safe=finbert_fork_safe)
+    registry.register("minilm", load_minilm, warmup_minilm)
+    # Kiwi 는 생성 시 분석 스레드 풀을 만들므로 워커마다 따로 로드 (가중치도 작음)
+    registry.register("kiwi", load_kiwi, warmup_kiwi, fork_safe=False)
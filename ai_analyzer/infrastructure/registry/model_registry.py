@@ -0,0 +1,298 @@
+import gc
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from ai_analyzer.infrastructure.registry.process_memory import read_memory_usage
+
+# 서버 시작 시 미리 로드(+워밍업)할 모델 목록. /health/ready 는 이 모델들이 모두 준비되면 200.
+# 빈 값이면 프리로드하지 않고 첫 요청 시 로드한다.
+PRELOAD_MODELS = [name.strip() for name in os.getenv("PRELOAD_MODELS", "finbert,minilm,kiwi").split(",") if name.strip()]
+
+# 메모리 예산 모드 (0 이면 비활성)
+# - MODEL_IDLE_UNLOAD_SEC: 이 시간(초) 동안 사용되지 않은 모델은 언로드
+# - MODEL_MEMORY_BUDGET_MB: 로드된 모델의 추정 RSS 합이 이 값을 넘으면 가장 오래 안 쓴 모델부터 언로드
+# - MODEL_REAPER_INTERVAL_SEC: 유휴 모델을 확인하는 주기
+# 언로드된 모델은 다음 get() 에서 다시 로드된다.
+MODEL_IDLE_UNLOAD_SEC = float(os.getenv("MODEL_IDLE_UNLOAD_SEC", "0"))
+MODEL_MEMORY_BUDGET_MB = float(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
+MODEL_REAPER_INTERVAL_SEC = float(os.getenv("MODEL_REAPER_INTERVAL_SEC", "30"))
+
+# 모델 상태 값
+NOT_LOADED = "not_loaded"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+UNLOADED = "unloaded"  # 유휴/메모리 예산으로 언로드됨 (요청 시 자동 재로드되므로 ready 로 취급)
+
+_instance_lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    FinBERT / MiniLM(KeyBERT) / Kiwi 등 무거운 모델을 이름으로 관리하는 레지스트리.
+    - 어댑터는 모델을 직접 들고 있지 않고 get(name) 으로 꺼내 쓴다
+    - 같은 모델을 여러 스레드가 동시에 요청해도 로드는 한 번만 수행 (모델별 락)
+    - 모델별 로드 상태 / 로드 시간 / 워밍업 시간을 기록 (헬스 체크용)
+    - 프로세스당 하나만 존재하므로, 부모에서 로드 후 fork 하면 자식 워커들이 가중치를 copy-on-write 로 공유한다
+    - 유휴 시간 / 메모리 예산을 넘으면 모델을 언로드하고, 다음 요청 때 한 번만 다시 로드한다
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            # 프리로드 스레드 / reaper / 요청 스레드가 동시에 처음 호출해도 하나만 만들고,
+            # 초기화가 모두 끝난 뒤에 공개한다 (덜 초기화된 레지스트리가 보이지 않도록)
+            with _instance_lock:
+                if cls.__instance is None:
+                    instance = super().__new__(cls)
+                    instance.loaders: Dict[str, Callable[[], Any]] = {}
+                    instance.warmups: Dict[str, Optional[Callable[[Any], None]]] = {}
+                    instance.models: Dict[str, Any] = {}
+                    instance.states: Dict[str, dict] = {}
+                    instance.locks: Dict[str, threading.Lock] = {}
+                    instance.fork_safe: Dict[str, Union[bool, Callable[[], bool]]] = {}
+                    instance.last_used: Dict[str, float] = {}
+                    # fork 전에 부모가 로드한 모델 - 자식에서 언로드해도 메모리가 줄지 않으므로 언로드 대상에서 제외
+                    instance.pinned: set = set()
+                    instance.idle_unload_sec = MODEL_IDLE_UNLOAD_SEC
+                    instance.memory_budget_mb = MODEL_MEMORY_BUDGET_MB
+                    instance.reaper: Optional[threading.Thread] = None
+
+                    # 기본 모델 로더 등록 (무거운 import 는 로더 함수 안에서만 일어남)
+                    from ai_analyzer.infrastructure.registry.model_loaders import register_default_models
+                    register_default_models(instance)
+
+                    if hasattr(os, "register_at_fork"):
+                        os.register_at_fork(after_in_child=instance._reinit_after_fork)
+                    instance._start_reaper()
+                    cls.__instance = instance
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        warmup: Optional[Callable[[Any], None]] = None,
+        fork_safe: Union[bool, Callable[[], bool]] = True
+    ) -> None:
+        """
+        fork_safe: 로드된 모델을 fork 후 자식 프로세스에서 그대로 써도 되는지.
+        (내부 스레드 풀을 미리 만드는 모델은 False - 워커마다 따로 로드한다)
+        """
+        self.loaders[name] = loader
+        self.warmups[name] = warmup
+        self.fork_safe[name] = fork_safe
+        self.locks.setdefault(name, threading.Lock())
+        self.states.setdefault(name, dict(
+            status=NOT_LOADED, load_time_sec=None, warmup_time_sec=None, loaded_at=None, error=None,
+            rss_mb=None, loads=0, reloads=0, last_reload_sec=None, total_reload_sec=0.0,
+            idle_evictions=0, budget_evictions=0
+        ))
+
+    def get(self, name: str) -> Any:
+        self.last_used[name] = time.monotonic()
+        model = self.models.get(name)
+        if model is not None:
+            return model
+        return self._load(name, warmup=False)
+
+    def put(self, name: str, model: Any) -> None:
+        # 벤치마크 등에서 로더를 거치지 않고 모델을 교체할 때 사용
+        with self.locks[name]:
+            self.models[name] = model
+            self.last_used[name] = time.monotonic()
+            self.states[name].update(status=READY, loaded_at=time.time(), error=None)
+
+    def unload(self, name: str, reason: str = "manual") -> bool:
+        """
+        모델을 레지스트리에서 내린다. 이미 get() 으로 꺼내 간 요청은 참조가 남아 있으므로 끝까지 처리되고,
+        참조가 모두 사라지면 메모리가 해제된다. 로드 중인 모델은 건드리지 않는다.
+        """
+        lock = self.locks[name]
+        if not lock.acquire(blocking=False):
+            return False
+        try:
+            if self.models.pop(name, None) is None:
+                return False
+            state = self.states[name]
+            state["status"] = UNLOADED
+            if reason in ("idle", "budget"):
+                state[f"{reason}_evictions"] += 1
+        finally:
+            lock.release()
+
+        _release_memory()
+        print(f"[ModelRegistry] unloaded {name} ({reason})")
+        return True
+
+    def preload(self, names: Iterable[str], warmup: bool = True) -> None:
+        for name in names:
+            try:
+                self._load(name, warmup=warmup)
+            except Exception as e:
+                # 한 모델이 실패해도 나머지는 계속 로드 (상태는 failed 로 남음)
+                print(f"[ModelRegistry] failed to load {name}: {e}")
+
+    def fork_safe_models(self, names: Iterable[str]) -> List[str]:
+        # preload-then-fork 모드에서 부모 프로세스가 미리 로드해도 되는 모델만 골라낸다
+        result = []
+        for name in names:
+            fork_safe = self.fork_safe.get(name, False)
+            if callable(fork_safe):
+                fork_safe = fork_safe()
+            if fork_safe:
+                result.append(name)
+        return result
+
+    def is_ready(self, names: Iterable[str]) -> bool:
+        return all(self.states.get(name, {}).get("status") in (READY, UNLOADED) for name in names)
+
+    def status(self) -> Dict[str, dict]:
+        return {name: dict(state) for name, state in self.states.items()}
+
+    def memory(self) -> dict:
+        # 로드된 모델의 추정 RSS 합과 예산 설정 (메트릭 노출용)
+        return dict(
+            loaded_models=sorted(self.models),
+            loaded_rss_mb=round(self._loaded_rss_mb(), 1),
+            memory_budget_mb=self.memory_budget_mb or None,
+            idle_unload_sec=self.idle_unload_sec or None,
+            pinned=sorted(self.pinned),
+        )
+
+    def evict_idle(self) -> List[str]:
+        if not self.idle_unload_sec:
+            return []
+        now = time.monotonic()
+        idle = [
+            name for name in list(self.models)
+            if name not in self.pinned and now - self.last_used.get(name, now) >= self.idle_unload_sec
+        ]
+        return [name for name in idle if self.unload(name, reason="idle")]
+
+    def enforce_budget(self, keep: Optional[str] = None) -> List[str]:
+        # 예산을 넘는 동안 가장 오래 사용되지 않은 모델부터 언로드 (방금 요청된 모델은 제외)
+        evicted = []
+        if not self.memory_budget_mb:
+            return evicted
+
+        candidates = sorted(
+            (name for name in self.models if name != keep and name not in self.pinned),
+            key=lambda name: self.last_used.get(name, 0.0)
+        )
+        for name in candidates:
+            if self._loaded_rss_mb() <= self.memory_budget_mb:
+                break
+            if self.unload(name, reason="budget"):
+                evicted.append(name)
+        return evicted
+
+    def _loaded_rss_mb(self) -> float:
+        return sum(self.states[name]["rss_mb"] or 0.0 for name in list(self.models))
+
+    def _start_reaper(self) -> None:
+        if not self.idle_unload_sec and not self.memory_budget_mb:
+            return
+        self.reaper = threading.Thread(target=self._reap, name="model-reaper", daemon=True)
+        self.reaper.start()
+
+    def _reap(self) -> None:
+        interval = MODEL_REAPER_INTERVAL_SEC
+        if self.idle_unload_sec:
+            interval = min(interval, max(self.idle_unload_sec / 2, 1.0))
+        while True:
+            time.sleep(interval)
+            try:
+                self.evict_idle()
+                self.enforce_budget()
+            except Exception as e:
+                print(f"[ModelRegistry] reaper error: {e}")
+
+    def _load(self, name: str, warmup: bool) -> Any:
+        if name not in self.loaders:
+            raise KeyError(f"등록되지 않은 모델입니다: {name}")
+
+        state = self.states[name]
+        with self.locks[name]:
+            # 같은 모델을 동시에 요청한 스레드는 락에서 기다렸다가 먼저 로드한 결과를 그대로 쓴다 (single-flight)
+            model = self.models.get(name)
+            loaded_now = model is None
+            if loaded_now:
+                is_reload = state["loads"] > 0
+                state.update(status=LOADING, error=None)
+                rss_before = _current_rss_mb()
+                start = time.perf_counter()
+                try:
+                    model = self.loaders[name]()
+                except Exception as e:
+                    state.update(status=FAILED, error=f"{type(e).__name__}: {e}")
+                    raise
+                elapsed = time.perf_counter() - start
+                # 로드 전후 RSS 차이로 모델 메모리를 추정 (동시에 다른 모델이 로드되면 과대 추정될 수 있음)
+                state.update(
+                    load_time_sec=elapsed, loaded_at=time.time(), loads=state["loads"] + 1,
+                    rss_mb=round(max(_current_rss_mb() - rss_before, 0.0), 1)
+                )
+                if is_reload:
+                    state["reloads"] += 1
+                    state["last_reload_sec"] = elapsed
+                    state["total_reload_sec"] += elapsed
+                    print(f"[ModelRegistry] reloaded {name} in {elapsed:.2f}s")
+                self.models[name] = model
+                self.last_used[name] = time.monotonic()
+
+            # 커널/토크나이저 캐시를 데우기 위한 더미 추론 (프리로드 시에만, 한 번만)
+            warmup_fn = self.warmups.get(name)
+            if warmup and warmup_fn is not None and state["warmup_time_sec"] is None:
+                start = time.perf_counter()
+                try:
+                    warmup_fn(model)
+                    state["warmup_time_sec"] = time.perf_counter() - start
+                except Exception as e:
+                    # 워밍업 실패는 서비스 불가 사유가 아니므로 기록만 남긴다
+                    print(f"[ModelRegistry] warmup failed for {name}: {e}")
+                    state["error"] = f"warmup {type(e).__name__}: {e}"
+
+            state["status"] = READY
+
+        if loaded_now:
+            self.enforce_budget(keep=name)
+        return model
+
+    def _reinit_after_fork(self) -> None:
+        # fork 시점에 다른 스레드가 잡고 있던 락은 자식에서 영원히 풀리지 않으므로 새로 만든다.
+        # 로드 중이던 모델은 자식에 로드 스레드가 없으므로 다시 로드하도록 되돌린다.
+        self.locks = {name: threading.Lock() for name in self.loaders}
+        for name, state in self.states.items():
+            if state["status"] == LOADING and name not in self.models:
+                state.update(status=NOT_LOADED)
+        # 부모가 로드한 모델은 부모가 계속 들고 있으므로 자식에서 언로드하면 공유만 깨진다
+        self.pinned = set(self.models)
+        # 유휴 모델 정리 스레드도 자식에는 없으므로 다시 띄운다
+        self._start_reaper()
+
+
+def _current_rss_mb() -> float:
+    return read_memory_usage().get("rss_mb", 0.0)
+
+
+def _release_memory() -> None:
+    # 참조가 끊긴 모델을 즉시 회수하고, 해제된 힙을 OS 에 돌려준다 (glibc)
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
@@ -0,0 +1,34 @@
+import os
+from typing import Union
+
+
+def read_memory_usage(pid: Union[int, str] = "self") -> dict:
+    """
+    /proc/<pid>/smaps_rollup 기준 메모리 사용량(MB).
+    - rss: 공유 페이지 포함 전체 상주 메모리
+    - pss: 공유 페이지를 공유 프로세스 수로 나눠 더한 값
+    - uss: 이 프로세스만 가진 페이지 (Private_Clean + Private_Dirty) - 워커를 하나 더 띄울 때 실제로 늘어나는 양
+    - shared: 다른 프로세스와 공유 중인 페이지 (fork 후 copy-on-write 로 공유되는 모델 가중치 등)
+    Linux 가 아니면 빈 dict 를 반환한다.
+    """
+    path = f"/proc/{pid}/smaps_rollup"
+    if not os.path.exists(path):
+        return {}
+
+    fields = {}
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])  # kB
+
+    def mb(*names: str) -> float:
+        return round(sum(fields.get(name, 0) for name in names) / 1024, 1)
+
+    return dict(
+        pid=os.getpid() if pid == "self" else int(pid),
+        rss_mb=mb("Rss"),
+        pss_mb=mb("Pss"),
+        uss_mb=mb("Private_Clean", "Private_Dirty"),
+        shared_mb=mb("Shared_Clean", "Shared_Dirty"),
+    )
@@ -1,7 +1,12 @@
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from ai_summary.adapter.input.web.request.summary_request import SummaryRequest
 from ai_summary.adapter.input.web.response.summary_response import SummaryResponse  # 추가
 from ai_summary.application.factory.summarize_news_usecase_factory import SummarizeNewsUseCaseFactory
+from ai_summary.infrastructure.cache.summary_cache import SummaryCache, SUMMARY_CACHE_ENABLED
 
 ai_summary_router = APIRouter(tags=["AI Summary"])
 
@@ -10,7 +15,49 @@ ai_summary_router = APIRouter(tags=["AI Summary"])
 async def summarize_news(request: SummaryRequest):
     usecase = SummarizeNewsUseCaseFactory.create()
 
-    # UseCase가 문자열(str)을 반환한다고 가정했을 때
-    summary_text = usecase.execute(request.content, request.keywords)
+    # 비동기 LLM 호출 (응답을 기다리는 동안 다른 요청이 막히지 않음)
+    summary_text = await usecase.execute_async(request.content, request.keywords)
+
+    return SummaryResponse(summary=summary_text)
+
+
+def _sse(data: dict, event: str = None) -> str:
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _summary_events(request: SummaryRequest) -> AsyncIterator[str]:
+    """
+    SSE 이벤트 순서
+    - data: {"delta": "..."}            토큰이 생성될 때마다
+    - event: done  data: {"summary": ...} 완료 시 전체 요약 (앞뒤 공백 제거)
+    - event: error data: {"detail": ...}  도중에 실패하면 (이미 보낸 델타는 버리면 됨)
+    """
+    usecase = SummarizeNewsUseCaseFactory.create()
+    parts = []
+    try:
+        async for delta in usecase.stream(request.content, request.keywords):
+            parts.append(delta)
+            yield _sse({"delta": delta})
+    except Exception as e:
+        yield _sse({"detail": f"{type(e).__name__}: {e}"}, event="error")
+        return
+    yield _sse({"summary": "".join(parts).strip()}, event="done")
+
+
+@ai_summary_router.post("/summarize/stream")
+async def summarize_news_stream(request: SummaryRequest):
+    # 첫 토큰이 나오는 즉시 전송 (프록시 버퍼링 비활성화)
+    return StreamingResponse(
+        _summary_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
-    return SummaryResponse(summary=summary_text)
\ No newline at end of file
+@ai_summary_router.get("/cache/stats")
+async def get_summary_cache_stats():
+    # 적중률(합류 포함)과 캐시 덕분에 아낀 토큰 수
+    if not SUMMARY_CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **SummaryCache.getInstance().stats()}
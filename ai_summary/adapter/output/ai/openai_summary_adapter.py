@@ -1,8 +1,15 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from ai_summary.application.port.llm_summary_port import LLMSummaryPort
+from ai_summary.domain.value_object.summary_result_vo import SummaryResultVO
+
+# [변경] 이미 설정된 openai client를 가져옵니다. (처음 사용할 때 생성)
+from config.openai.config import get_openai_client
+from config.openai.llm_gateway import LLMGateway
+
+SUMMARY_MODEL = "gpt-4o-mini"  # gpt-3.5-turbo 등 사용 가능 모델 지정
+# 프롬프트 문구를 바꾸면 올려서 기존 요약 캐시를 무효화
+PROMPT_TEMPLATE_VERSION = "v1"
 
-# [변경] 이미 설정된 openai client를 가져옵니다.
-from config.openai.config import client as openai_client
 
 class OpenAISummaryAdapter(LLMSummaryPort):
     __instance = None
@@ -11,7 +18,9 @@ class OpenAISummaryAdapter(LLMSummaryPort):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
             # [변경] 외부에서 생성된 client 주입
-            cls.__instance.client = openai_client
+            cls.__instance.client = get_openai_client()
+            # 비동기 호출은 공용 LLM 게이트웨이를 통해 (동시성/레이트 리밋/재시도/서킷 브레이커 공유)
+            cls.__instance.gateway = LLMGateway.getInstance()
         return cls.__instance
 
     @classmethod
@@ -20,7 +29,13 @@ class OpenAISummaryAdapter(LLMSummaryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def summarize(self, text: str, keywords: List[str]) -> str:
+    @classmethod
+    def cache_signature(cls) -> str:
+        # 요약 캐시 키에 사용 (모델/프롬프트가 바뀌면 캐시도 달라짐)
+        return f"{SUMMARY_MODEL}:{PROMPT_TEMPLATE_VERSION}"
+
+    @staticmethod
+    def _messages(text: str, keywords: List[str]) -> List[dict]:
         keyword_str = ", ".join(keywords)
         prompt = (
             f"다음 금융 뉴스 기사를 요약해줘. "
@@ -28,13 +43,45 @@ class OpenAISummaryAdapter(LLMSummaryPort):
             f"투자자에게 도움이 되도록 3문장 이내로 핵심만 간결하게 요약해.\n\n"
             f"기사 내용:\n{text}"
         )
+        return [
+            {"role": "system", "content": "You are a helpful financial news assistant."},
+            {"role": "user", "content": prompt}
+        ]
 
+    def summarize(self, text: str, keywords: List[str]) -> str:
         # 동기(sync) 방식 호출
         response = self.client.chat.completions.create(
-            model="gpt-4o-mini",  # gpt-3.5-turbo 등 사용 가능 모델 지정
-            messages=[
-                {"role": "system", "content": "You are a helpful financial news assistant."},
-                {"role": "user", "content": prompt}
-            ]
+            model=SUMMARY_MODEL,
+            messages=self._messages(text, keywords)
+        )
+        return response.choices[0].message.content.strip()
+
+    async def summarize_async(self, text: str, keywords: List[str]) -> SummaryResultVO:
+        # 비동기 호출 - 응답을 기다리는 동안 이벤트 루프는 다른 요청을 처리
+        response = await self.gateway.chat(
+            model=SUMMARY_MODEL,
+            messages=self._messages(text, keywords)
+        )
+        return SummaryResultVO(
+            summary_text=response.choices[0].message.content.strip(),
+            model=SUMMARY_MODEL,
+            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+            completion_tokens=response.usage.completion_tokens if response.usage else 0
+        )
+
+    async def stream_summary(self, text: str, keywords: List[str], usage: Optional[dict] = None) -> AsyncIterator[str]:
+        # stream=True: 토큰이 생성되는 대로 델타를 받아 바로 내보낸다
+        # usage 를 넘기면 스트림이 끝날 때 토큰 사용량을 채워 준다
+        stream = self.gateway.stream_chat(
+            model=SUMMARY_MODEL,
+            messages=self._messages(text, keywords)
         )
-        return response.choices[0].message.content.strip()
\ No newline at end of file
+        async for chunk in stream:
+            if chunk.usage is not None and usage is not None:
+                usage.update(
+                    model=SUMMARY_MODEL,
+                    prompt_tokens=chunk.usage.prompt_tokens,
+                    completion_tokens=chunk.usage.completion_tokens
+                )
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
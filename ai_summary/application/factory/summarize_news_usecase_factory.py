@@ -1,9 +1,12 @@
 from ai_summary.application.usecase.summarize_news_usecase import SummarizeNewsUseCase
 from ai_summary.adapter.output.ai.openai_summary_adapter import OpenAISummaryAdapter
+from ai_summary.infrastructure.cache.summary_cache import SummaryCache, SUMMARY_CACHE_ENABLED
 
 class SummarizeNewsUseCaseFactory:
     @staticmethod
     def create() -> SummarizeNewsUseCase:
         return SummarizeNewsUseCase(
-            llm_port=OpenAISummaryAdapter.getInstance()
-        )
\ No newline at end of file
+            llm_port=OpenAISummaryAdapter.getInstance(),
+            cache_port=SummaryCache.getInstance() if SUMMARY_CACHE_ENABLED else None,
+            signature=OpenAISummaryAdapter.cache_signature()
+        )
@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional
+
+from ai_summary.domain.value_object.summary_result_vo import SummaryResultVO
 
 class LLMSummaryPort(ABC):
     @abstractmethod
     def summarize(self, text: str, keywords: List[str]) -> str:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def summarize_async(self, text: str, keywords: List[str]) -> SummaryResultVO:
+        pass
+
+    @abstractmethod
+    def stream_summary(self, text: str, keywords: List[str], usage: Optional[dict] = None) -> AsyncIterator[str]:
+        # 요약 토큰(델타 문자열)을 생성되는 대로 내보내는 async generator
+        # usage dict 를 넘기면 끝날 때 model / prompt_tokens / completion_tokens 를 채운다
+        pass
@@ -0,0 +1,39 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+from ai_summary.domain.value_object.summary_result_vo import SummaryResultVO
+
+class SummaryCachePort(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[SummaryResultVO]:
+        pass
+
+    @abstractmethod
+    def join(self, key: str) -> Optional[asyncio.Future]:
+        # 같은 키로 이미 진행 중인 요약이 있으면 그 Future 를 반환 (없으면 None)
+        pass
+
+    @abstractmethod
+    async def wait(self, future: asyncio.Future) -> SummaryResultVO:
+        # join 으로 얻은 Future 의 결과를 기다린다
+        pass
+
+    @abstractmethod
+    def lead(self, key: str) -> asyncio.Future:
+        # 이 키의 요약을 직접 수행하겠다고 등록 (이후 같은 키 요청은 join 으로 기다림)
+        pass
+
+    @abstractmethod
+    async def complete(self, key: str, result: Optional[SummaryResultVO] = None,
+                       error: Optional[BaseException] = None, store: bool = True) -> None:
+        # lead 한 요약이 끝났을 때 호출 - 성공하면(store=True) 캐시에 저장하고, 기다리던 요청들에 결과/에러 전달
+        pass
+
+    @abstractmethod
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[SummaryResultVO]]) -> SummaryResultVO:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
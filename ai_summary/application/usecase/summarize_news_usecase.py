@@ -1,10 +1,85 @@
-from typing import List
+import hashlib
+import re
+import unicodedata
+from typing import AsyncIterator, List, Optional
 from ai_summary.application.port.llm_summary_port import LLMSummaryPort
+from ai_summary.application.port.summary_cache_port import SummaryCachePort
+from ai_summary.domain.value_object.summary_result_vo import SummaryResultVO
+from config.singleflight import SingleFlightCancelledError
 
 class SummarizeNewsUseCase:
-    def __init__(self, llm_port: LLMSummaryPort):
+    def __init__(self, llm_port: LLMSummaryPort, cache_port: Optional[SummaryCachePort] = None, signature: str = ""):
         self.llm_port = llm_port
+        # 캐시 키에 모델 이름 + 프롬프트 템플릿 버전을 포함시켜 바뀌면 자동으로 무효화
+        self.cache_port = cache_port
+        self.signature = signature
 
     def execute(self, content: str, keywords: List[str]) -> str:
         # 5. 키워드 기반 GPT 요약
-        return self.llm_port.summarize(content, keywords)
\ No newline at end of file
+        return self.llm_port.summarize(content, keywords)
+
+    async def execute_async(self, content: str, keywords: List[str]) -> str:
+        if self.cache_port is None:
+            return (await self.llm_port.summarize_async(content, keywords)).summary_text
+
+        # 같은 기사+키워드 요약은 캐시에서, 동시에 들어온 같은 요청은 하나의 LLM 호출로 합친다
+        result = await self.cache_port.get_or_compute(
+            self._cache_key(content, keywords),
+            lambda: self.llm_port.summarize_async(content, keywords)
+        )
+        return result.summary_text
+
+    async def stream(self, content: str, keywords: List[str]) -> AsyncIterator[str]:
+        # 요약 토큰을 생성되는 대로 전달 (SSE 스트리밍용)
+        if self.cache_port is None:
+            async for delta in self.llm_port.stream_summary(content, keywords):
+                yield delta
+            return
+
+        # 같은 요약이 진행 중이면 그 결과를, 캐시에 있으면 캐시 값을 한 번에 전달
+        cache_key = self._cache_key(content, keywords)
+        while (future := self.cache_port.join(cache_key)) is not None:
+            try:
+                result = await self.cache_port.wait(future)
+            except SingleFlightCancelledError:
+                # 진행 중이던 요청이 취소됨 - 다시 확인해서 아무도 맡지 않았으면 이 요청이 직접 요약
+                continue
+            yield result.summary_text
+            return
+
+        # 캐시 조회 중에 들어온 같은 요청도 합류할 수 있도록 먼저 등록
+        self.cache_port.lead(cache_key)
+        try:
+            cached = await self.cache_port.get(cache_key)
+        except BaseException as e:
+            await self.cache_port.complete(cache_key, error=e)
+            raise
+        if cached is not None:
+            await self.cache_port.complete(cache_key, result=cached, store=False)
+            yield cached.summary_text
+            return
+
+        # 직접 스트리밍하고, 끝나면 캐시에 저장
+        parts, usage = [], {}
+        try:
+            async for delta in self.llm_port.stream_summary(content, keywords, usage=usage):
+                parts.append(delta)
+                yield delta
+        except BaseException as e:
+            # 클라이언트 연결 종료(GeneratorExit/취소) 포함 - 합류한 요청들에 에러 전달, 캐시에는 저장하지 않음
+            # (취소는 합류한 요청에 SingleFlightCancelledError 로 전달되어 그 요청이 이어서 요약한다)
+            await self.cache_port.complete(cache_key, error=e)
+            raise
+        await self.cache_port.complete(cache_key, result=SummaryResultVO(
+            summary_text="".join(parts).strip(),
+            model=usage.get("model", ""),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0)
+        ))
+
+    def _cache_key(self, content: str, keywords: List[str]) -> str:
+        # 유니코드 정규화 + 공백 정리 후 해시 (키워드는 순서 무관)
+        normalized = re.sub(r'\s+', ' ', unicodedata.normalize("NFC", content)).strip()
+        keyword_part = "\x1f".join(sorted(keyword.strip() for keyword in keywords))
+        key_source = f"{self.signature}\n{keyword_part}\n{normalized}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
@@ -2,6 +2,10 @@ from pydantic import BaseModel
 
 class SummaryResultVO(BaseModel):
     summary_text: str
+    # 요약에 사용한 모델과 토큰 사용량 (캐시 적중 시 절약한 토큰 계산용)
+    model: str = ""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
 
     class Config:
-        frozen = True  # 불변 객체로 설정 (Value Object 특성)
\ No newline at end of file
+        frozen = True  # 불변 객체로 설정 (Value Object 특성)
@@ -0,0 +1,143 @@
+import asyncio
+import os
+import threading
+from typing import Awaitable, Callable, Optional
+
+import redis
+from pydantic import ValidationError
+
+from ai_summary.application.port.summary_cache_port import SummaryCachePort
+from ai_summary.domain.value_object.summary_result_vo import SummaryResultVO
+from config.redis_config import get_redis
+from config.singleflight import SingleFlight
+
+# 요약 캐시 설정 (환경변수로 조정 가능)
+SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+SUMMARY_CACHE_TTL_SEC = int(os.getenv("SUMMARY_CACHE_TTL_SEC", "86400"))
+SUMMARY_CACHE_REDIS_PREFIX = "ai_summary:summary:"
+
+
+class SummaryCache(SummaryCachePort):
+    """
+    LLM 요약 결과 캐시 (Redis, TTL).
+    - 같은 키의 요약이 진행 중이면 새로 LLM 을 호출하지 않고 그 결과를 기다린다 (single-flight, 프로세스 단위)
+    - 캐시 적중/합류 시 원래 요약에 쓰인 토큰 수만큼 절약 토큰으로 집계
+    - Redis 장애 시에는 캐시 없이 동작한다 (합류는 계속 동작)
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.redis = get_redis()
+            cls.__instance.flight = SingleFlight()
+            cls.__instance.counters = dict(
+                hits=0, coalesced=0, misses=0, redis_errors=0, invalid_entries=0,
+                saved_prompt_tokens=0, saved_completion_tokens=0
+            )
+            cls.__instance.counter_lock = threading.Lock()
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def get(self, key: str) -> Optional[SummaryResultVO]:
+        try:
+            # redis 클라이언트는 동기식이므로 이벤트 루프를 막지 않도록 스레드에서 호출
+            raw = await asyncio.to_thread(self.redis.get, SUMMARY_CACHE_REDIS_PREFIX + key)
+        except redis.RedisError as e:
+            print(f"[SummaryCache] redis get failed: {e}")
+            self._count("redis_errors")
+            raw = None
+
+        if raw is None:
+            self._count("misses")
+            return None
+        try:
+            result = SummaryResultVO.model_validate_json(raw)
+        except ValidationError as e:
+            # 깨졌거나 예전 스키마로 저장된 값은 없는 것으로 보고 지운다 (다시 요약해서 덮어씀)
+            print(f"[SummaryCache] invalid cached value, dropping: {e.error_count()} errors")
+            self._count("invalid_entries")
+            self._count("misses")
+            await self._delete(key)
+            return None
+        self._count("hits")
+        self._count_saved(result)
+        return result
+
+    def join(self, key: str) -> Optional[asyncio.Future]:
+        future = self.flight.join(key)
+        if future is not None:
+            self._count("coalesced")
+        return future
+
+    def lead(self, key: str) -> asyncio.Future:
+        return self.flight.lead(key)
+
+    async def complete(self, key: str, result: Optional[SummaryResultVO] = None,
+                       error: Optional[BaseException] = None, store: bool = True) -> None:
+        if result is not None and store:
+            await self._set(key, result)
+        # 취소로 끝난 경우 기다리던 요청에는 SingleFlightCancelledError 가 전달된다 (다시 시도 가능)
+        self.flight.complete(key, result=result, error=error)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[SummaryResultVO]]) -> SummaryResultVO:
+        # 캐시 조회부터 lead 가 맡는다 (동시에 들어온 같은 요청은 조회/LLM 호출 모두 한 번만)
+        async def load_or_compute() -> SummaryResultVO:
+            result = await self.get(key)
+            if result is None:
+                result = await compute()
+                await self._set(key, result)
+            return result
+
+        result, joined = await self.flight.run(key, load_or_compute)
+        if joined:
+            self._count("coalesced")
+            self._count_saved(result)
+        return result
+
+    async def wait(self, future: asyncio.Future) -> SummaryResultVO:
+        result = await self.flight.wait(future)
+        # 합류한 요청은 LLM 을 부르지 않았으므로 절약 토큰으로 집계
+        self._count_saved(result)
+        return result
+
+    async def _set(self, key: str, result: SummaryResultVO) -> None:
+        try:
+            await asyncio.to_thread(
+                self.redis.set, SUMMARY_CACHE_REDIS_PREFIX + key, result.model_dump_json(), ex=SUMMARY_CACHE_TTL_SEC
+            )
+        except redis.RedisError as e:
+            print(f"[SummaryCache] redis set failed: {e}")
+            self._count("redis_errors")
+
+    async def _delete(self, key: str) -> None:
+        try:
+            await asyncio.to_thread(self.redis.delete, SUMMARY_CACHE_REDIS_PREFIX + key)
+        except redis.RedisError as e:
+            print(f"[SummaryCache] redis delete failed: {e}")
+            self._count("redis_errors")
+
+    def stats(self) -> dict:
+        with self.counter_lock:
+            counters = dict(self.counters)
+        served = counters["hits"] + counters["coalesced"]
+        lookups = served + counters["misses"]
+        return dict(
+            **counters,
+            hit_rate=(served / lookups) if lookups else 0.0,
+            inflight=len(self.flight),
+            ttl_sec=SUMMARY_CACHE_TTL_SEC,
+        )
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self.counter_lock:
+            self.counters[name] += amount
+
+    def _count_saved(self, result: SummaryResultVO) -> None:
+        self._count("saved_prompt_tokens", result.prompt_tokens)
+        self._count("saved_completion_tokens", result.completion_tokens)
@@ -1,7 +1,10 @@
+import importlib
 import os
+import threading
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
-from ai_summary.adapter.input.web.ai_summary_router import ai_summary_router
 from config.database.session import Base, engine
 
 load_dotenv()
@@ -9,14 +12,54 @@ load_dotenv()
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from documents.adapter.input.web.documents_router import router as documents_router
-from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
-from pdf_analyzer.adapter.input.web.pdf_analyzer_router import pdf_analyzer_router
-from account.adapter.input.web.accounts_router import router as accounts_router
-from ai_analyzer.adapter.input.web.ai_analyzer_router import ai_analyzer_router
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry, PRELOAD_MODELS
+from health.adapter.input.web.health_router import health_router
+
+# 배포 역할별로 올릴 라우터 (module, 라우터 변수명, prefix)
+# 라우터 모듈은 역할이 켜져 있을 때만 import 되므로, 예를 들어 APP_ROLES=auth,documents 워커는
+# torch / transformers / openai 등을 전혀 import 하지 않는다.
+ROLE_ROUTERS = {
+    "auth": [
+        ("social_oauth.adapter.input.web.google_oauth2_router", "authentication_router", "/authentication"),
+        ("account.adapter.input.web.accounts_router", "router", "/accounts"),
+    ],
+    "documents": [
+        ("documents.adapter.input.web.documents_router", "router", "/documents"),
+    ],
+    "pdf": [
+        ("pdf_analyzer.adapter.input.web.pdf_analyzer_router", "pdf_analyzer_router", "/pdf-analyzer"),
+    ],
+    "ai": [
+        ("ai_analyzer.adapter.input.web.ai_analyzer_router", "ai_analyzer_router", "/ai-analyzer"),
+        ("ai_summary.adapter.input.web.ai_summary_router", "ai_summary_router", "/ai-summary"),
+    ],
+}
+
+# APP_ROLES: 콤마로 구분한 역할 목록 (기본값 all = 전체)
+APP_ROLES = [role.strip() for role in os.getenv("APP_ROLES", "all").split(",") if role.strip()]
+if "all" in APP_ROLES:
+    APP_ROLES = list(ROLE_ROUTERS)
+unknown_roles = set(APP_ROLES) - set(ROLE_ROUTERS)
+if unknown_roles:
+    raise ValueError(f"알 수 없는 APP_ROLES: {', '.join(sorted(unknown_roles))} (사용 가능: all, {', '.join(ROLE_ROUTERS)})")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 모델 프리로드 + 워밍업은 백그라운드 스레드에서 수행 (ai 역할일 때만)
+    # (/health/live 는 바로 응답하고, /health/ready 는 로드가 끝난 뒤 200)
+    app.state.required_models = PRELOAD_MODELS if "ai" in APP_ROLES else []
+    if "ai" in APP_ROLES:
+        threading.Thread(
+            target=ModelRegistry.getInstance().preload,
+            args=(PRELOAD_MODELS,),
+            name="model-preload",
+            daemon=True
+        ).start()
+    yield
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:3000",
@@ -30,16 +73,20 @@ app.add_middleware(
     allow_headers=["*"],         # 모든 헤더 허용
 )
 
-app.include_router(authentication_router, prefix="/authentication")
-app.include_router(accounts_router, prefix="/accounts")
-app.include_router(documents_router, prefix="/documents")
-app.include_router(pdf_analyzer_router, prefix="/pdf-analyzer")
-app.include_router(ai_analyzer_router, prefix="/ai-analyzer")
-app.include_router(ai_summary_router, prefix="/ai-summary")
+for role in APP_ROLES:
+    for module_name, router_name, prefix in ROLE_ROUTERS[role]:
+        app.include_router(getattr(importlib.import_module(module_name), router_name), prefix=prefix)
+app.include_router(health_router, prefix="/health")
 
 if __name__ == "__main__":
     import uvicorn
     host = os.getenv("APP_HOST")
     port = int(os.getenv("APP_PORT"))
+    # APP_WORKERS > 1 이면 모델을 한 번만 로드한 뒤 fork 하는 멀티 워커 모드로 실행
+    workers = int(os.getenv("APP_WORKERS", "1"))
     Base.metadata.create_all(bind=engine)
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    if workers > 1:
+        from app.prefork import serve
+        serve(app, host=host, port=port, workers=workers, models=PRELOAD_MODELS if "ai" in APP_ROLES else [])
+    else:
+        uvicorn.run(app, host=host, port=port)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional
+
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry, PRELOAD_MODELS
+from ai_analyzer.infrastructure.registry.process_memory import read_memory_usage
+
+# preload-then-fork 워커 모드
+# 1. 부모 프로세스가 fork 해도 안전한 모델(FinBERT, MiniLM)을 한 번만 로드
+# 2. gc.freeze() 후 워커 수만큼 fork -> 자식들은 가중치 페이지를 copy-on-write 로 공유
+# 3. 각 자식은 같은 리스닝 소켓으로 uvicorn 서버를 실행하고, lifespan 에서 워밍업/나머지 모델 로드
+# uvicorn --workers 는 워커마다 앱을 새로 import 하므로 모델이 워커 수만큼 중복 로드된다.
+
+
+def _load_shared_models(models: List[str]) -> Optional[int]:
+    registry = ModelRegistry.getInstance()
+    names = registry.fork_safe_models(models)
+
+    # 부모에서 OpenMP/MKL 스레드 풀이 만들어지면 fork 된 자식에서 멈출 수 있으므로
+    # 로드 중에는 단일 스레드로 제한하고, 워밍업(실제 추론)은 자식에서만 수행한다.
+    try:
+        import torch
+        num_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+    except ImportError:
+        torch, num_threads = None, None
+
+    start = time.perf_counter()
+    registry.preload(names, warmup=False)
+    print(f"[prefork] shared models loaded in {time.perf_counter() - start:.1f}s: {names}")
+
+    return num_threads
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, worker_id: int, torch_threads: Optional[int]) -> None:
+    import uvicorn
+
+    # 부모의 시그널 핸들러는 쓰지 않고 uvicorn 이 직접 설치하도록 기본값으로 되돌린다
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    if torch_threads is not None:
+        import torch
+        torch.set_num_threads(torch_threads)
+
+    # 부모가 만든 DB 커넥션을 자식끼리 공유하지 않도록 풀만 비운다 (연결은 닫지 않음)
+    if "config.database.session" in sys.modules:
+        sys.modules["config.database.session"].engine.dispose(close=False)
+
+    print(f"[prefork] worker {worker_id} started (pid {os.getpid()})")
+    config = uvicorn.Config(app, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def report_worker_memory(workers: Dict[int, int]) -> List[dict]:
+    """
+    워커별 메모리 사용량. uss_mb 가 워커 하나를 추가할 때 실제로 늘어나는 메모리이고,
+    shared_mb 는 부모와 copy-on-write 로 공유 중인 페이지(모델 가중치 등)이다.
+    """
+    rows = []
+    for pid, worker_id in sorted(workers.items(), key=lambda item: item[1]):
+        usage = read_memory_usage(pid)
+        if usage:
+            rows.append(dict(worker=worker_id, **usage))
+
+    for row in rows:
+        print(
+            f"[prefork] worker {row['worker']} pid={row['pid']} "
+            f"rss={row['rss_mb']}MB pss={row['pss_mb']}MB uss={row['uss_mb']}MB shared={row['shared_mb']}MB"
+        )
+    return rows
+
+
+def serve(app, host: str, port: int, workers: int, models: List[str] = PRELOAD_MODELS) -> None:
+    torch_threads = _load_shared_models(models)
+    sock = _bind_socket(host, port)
+
+    # 지금까지 만든 객체를 GC 추적 대상에서 빼서, 자식의 GC 가 이 객체들의 헤더를 건드려
+    # 공유 페이지가 복사되는 것을 막는다.
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}  # pid -> worker id
+    stopping = False
+
+    def spawn(worker_id: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(app, sock, worker_id, torch_threads)
+            finally:
+                os._exit(0)
+        children[pid] = worker_id
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    # kill -USR1 <부모 pid> 로 워커별 메모리 사용량 출력
+    signal.signal(signal.SIGUSR1, lambda signum, frame: report_worker_memory(children))
+
+    for worker_id in range(workers):
+        spawn(worker_id)
+    print(f"[prefork] {workers} workers listening on {host}:{port} (parent pid {os.getpid()})")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        worker_id = children.pop(pid, None)
+        if worker_id is not None and not stopping:
+            # 비정상 종료된 워커는 다시 fork (모델은 부모에 있으므로 재로드 없이 공유)
+            print(f"[prefork] worker {worker_id} (pid {pid}) exited with status {status}, respawning")
+            spawn(worker_id)
+
+    sock.close()
+    sys.exit(0)
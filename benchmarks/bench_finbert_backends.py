@@ -0,0 +1,115 @@
+"""
+FinBERT 추론 백엔드 비교 (torch / torch_int8 / onnx / onnx_int8).
+
+각 백엔드를 별도 프로세스에서 로드해 고정 코퍼스에 대해
+- 라벨 일치율 (torch 백엔드 기준 parity)
+- 단건 지연시간 p50 / p95, 배치 처리량
+- 최대 RSS
+를 보고한다. 일치율이 --min-agreement 보다 낮으면 exit code 1 로 종료한다.
+
+실행:
+    python -m benchmarks.bench_finbert_backends --backends torch torch_int8 onnx onnx_int8
+"""
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_finbert_batching import SAMPLE_TEXTS
+
+PARITY_CORPUS = SAMPLE_TEXTS + [
+    "현대차는 미국 관세 부담에도 하이브리드 판매 호조로 수익성을 방어했다.",
+    "금융당국은 가계부채 증가세를 억제하기 위해 대출 규제를 강화하기로 했다.",
+    "LG에너지솔루션의 수주 잔고가 줄어들며 주가가 52주 신저가를 기록했다.",
+    "네이버는 AI 검색 서비스 출시 이후 광고 클릭률이 개선됐다고 밝혔다.",
+    "중국 경기 둔화 우려에 철강·화학 업종 주가가 일제히 약세를 보였다.",
+    "코스닥 바이오 기업이 임상 3상 실패를 공시하면서 하한가로 직행했다.",
+    "국민연금은 국내 주식 비중을 유지하기로 결정했다.",
+    "외국인 투자자가 5거래일 연속 순매수하며 지수 상승을 이끌었다.",
+]
+
+
+def run_worker(backend_name: str, batch_size: int) -> None:
+    # 백엔드 선택은 모듈 로드 시점에 읽히므로 환경변수 대신 직접 생성한다
+    from transformers import AutoTokenizer
+    from ai_analyzer.adapter.output.ai.finbert_backend import create_finbert_backend
+    from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
+
+    load_start = time.perf_counter()
+    tokenizer = AutoTokenizer.from_pretrained(FinbertSentimentAdapter.MODEL_NAME)
+    backend = create_finbert_backend(FinbertSentimentAdapter.MODEL_NAME, backend_name)
+    load_sec = time.perf_counter() - load_start
+
+    def predict(texts):
+        batch = tokenizer(texts, truncation=True, max_length=512, padding=True, return_tensors=backend.tensor_type)
+        return backend.predict_logits(batch).argmax(dim=-1).tolist()
+
+    predict(PARITY_CORPUS[:1])  # 워밍업
+
+    latencies = []
+    labels = []
+    for text in PARITY_CORPUS:
+        start = time.perf_counter()
+        labels.extend(predict([text]))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for i in range(0, len(PARITY_CORPUS), batch_size):
+        predict(PARITY_CORPUS[i:i + batch_size])
+    batch_sec = time.perf_counter() - start
+
+    latencies.sort()
+    print(json.dumps(dict(
+        backend=backend_name,
+        labels=[backend.config.id2label[label_id] for label_id in labels],
+        load_sec=load_sec,
+        p50_ms=statistics.median(latencies),
+        p95_ms=latencies[int(len(latencies) * 0.95) - 1],
+        batch_texts_per_sec=len(PARITY_CORPUS) / batch_sec,
+        max_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch_int8", "onnx", "onnx_int8"])
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--min-agreement", type=float, default=0.9)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.batch_size)
+        return
+
+    backends = args.backends if "torch" in args.backends else ["torch"] + args.backends
+    reports = {}
+    for backend_name in backends:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_finbert_backends",
+             "--worker", backend_name, "--batch-size", str(args.batch_size)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        reports[backend_name] = json.loads(output.strip().splitlines()[-1])
+
+    reference = reports["torch"]["labels"]
+    failed = False
+    print(f"{'backend':>10} | {'agree':>6} | {'load s':>7} | {'p50 ms':>7} | {'p95 ms':>7} | {'batch t/s':>9} | {'RSS MB':>7}")
+    for backend_name, report in reports.items():
+        agreement = sum(a == b for a, b in zip(reference, report["labels"])) / len(reference)
+        failed |= agreement < args.min_agreement
+        print(
+            f"{backend_name:>10} | {agreement:>6.1%} | {report['load_sec']:>7.2f} | {report['p50_ms']:>7.2f} | "
+            f"{report['p95_ms']:>7.2f} | {report['batch_texts_per_sec']:>9.1f} | {report['max_rss_mb']:>7.0f}"
+        )
+
+    if failed:
+        print(f"label agreement below {args.min_agreement:.0%} for at least one backend")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+FinBERT 마이크로 배치 벤치마크.
+
+배치 크기별 처리량(texts/sec)과, 동시 요청을 MicroBatcher 로 모았을 때의 처리량을 비교한다.
+
+실행:
+    python -m benchmarks.bench_finbert_batching --num-texts 256 --concurrency 32
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import FinbertSentimentAdapter
+
+SAMPLE_TEXTS = [
+    "삼성전자가 3분기 영업이익이 시장 전망치를 크게 웃돌았다고 발표했다.",
+    "미국 연준의 금리 인상 우려로 코스피가 2% 넘게 하락 마감했다.",
+    "한국은행은 기준금리를 동결하고 물가 흐름을 지켜보겠다고 밝혔다.",
+    "SK하이닉스는 HBM 수요 증가에 힘입어 사상 최대 매출을 기록했다.",
+    "원·달러 환율이 1,400원을 돌파하며 외국인 자금 이탈이 이어지고 있다.",
+    "카카오는 신사업 투자 확대에도 불구하고 광고 매출 둔화로 실적이 부진했다.",
+    "정부는 반도체 산업 지원을 위해 세액공제 확대 방안을 검토 중이다.",
+    "국제유가 급등으로 항공사와 해운사의 비용 부담이 커질 것으로 보인다.",
+]
+
+
+def _texts(n: int) -> list:
+    return [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + f" ({i})" for i in range(n)]
+
+
+def bench_batch_sizes(adapter: FinbertSentimentAdapter, texts: list, batch_sizes: list) -> None:
+    model = adapter._model()
+    encodings = model.tokenizer(texts, truncation=True, max_length=512)
+    features = [{key: encodings[key][i] for key in encodings.keys()} for i in range(len(texts))]
+
+    print(f"{'batch_size':>10} | {'texts/sec':>10} | {'ms/text':>8}")
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        for i in range(0, len(features), batch_size):
+            adapter._forward(model, features[i:i + batch_size])
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>10} | {len(texts) / elapsed:>10.1f} | {elapsed * 1000 / len(texts):>8.2f}")
+
+
+def bench_concurrent(adapter: FinbertSentimentAdapter, texts: list, concurrency: int) -> None:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(adapter.analyze, texts))
+        elapsed = time.perf_counter() - start
+    print(f"concurrent analyze() x{concurrency}: {len(texts) / elapsed:.1f} texts/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-texts", type=int, default=256)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    adapter = FinbertSentimentAdapter.getInstance()
+    texts = _texts(args.num_texts)
+
+    # 워밍업
+    adapter.analyze_batch(texts[:8])
+
+    bench_batch_sizes(adapter, texts, args.batch_sizes)
+    bench_concurrent(adapter, texts, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+키워드 추출 백필 벤치마크.
+
+같은 기사 묶음에 대해 extract_keywords 단건 반복과 extract_keywords_batch 를 비교하고,
+Kiwi 워커 수별 배치 처리량을 보고한다.
+
+실행:
+    python -m benchmarks.bench_keyword_backfill --num-texts 10000 --chunk-size 256 --workers 1 2 4 8
+"""
+import argparse
+import time
+
+from kiwipiepy import Kiwi
+
+from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+from benchmarks.bench_finbert_batching import SAMPLE_TEXTS
+
+
+def _articles(n: int) -> list:
+    # 문장 몇 개를 이어 붙여 실제 기사 길이와 비슷하게 만든다
+    return [
+        " ".join(SAMPLE_TEXTS[(i + j) % len(SAMPLE_TEXTS)] for j in range(1 + i % 6))
+        for i in range(n)
+    ]
+
+
+def bench_single(adapter: KeybertKeywordAdapter, texts: list) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        adapter.extract_keywords(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def bench_batch(adapter: KeybertKeywordAdapter, texts: list, chunk_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), chunk_size):
+        adapter.extract_keywords_batch(texts[i:i + chunk_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-texts", type=int, default=10000)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--single-sample", type=int, default=500, help="단건 반복은 일부만 측정")
+    args = parser.parse_args()
+
+    adapter = KeybertKeywordAdapter.getInstance()
+    texts = _articles(args.num_texts)
+    adapter.extract_keywords_batch(texts[:8])  # 워밍업 (임베딩 캐시도 채워짐)
+
+    print(f"single extract_keywords: {bench_single(adapter, texts[:args.single_sample]):.1f} texts/sec")
+    for num_workers in args.workers:
+        ModelRegistry.getInstance().put("kiwi", Kiwi(num_workers=num_workers))
+        throughput = bench_batch(adapter, texts, args.chunk_size)
+        print(f"batch kiwi_workers={num_workers:>2}: {throughput:.1f} texts/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+길이 버킷 스케줄링 벤치마크.
+
+짧은 헤드라인과 긴 기사 본문이 섞인 입력에 대해
+- 도착 순서(FIFO)대로 토큰 상한 안에서 묶은 경우
+- 길이순으로 버킷팅해서 묶은 경우
+의 패딩 낭비 비율과 (선택) 실제 FinBERT 추론 시간을 비교한다.
+
+실행:
+    python -m benchmarks.bench_length_bucketing --num-texts 512 --headline-ratio 0.7 --run-model
+"""
+import argparse
+import random
+import time
+
+from transformers import AutoTokenizer
+
+from ai_analyzer.adapter.output.ai.finbert_sentiment_adapter import (
+    FinbertSentimentAdapter, FINBERT_MAX_BATCH_SIZE, FINBERT_MAX_BATCH_TOKENS, FINBERT_MAX_LENGTH
+)
+from ai_analyzer.infrastructure.batching.length_bucket_scheduler import plan_length_bucketed_batches, padding_stats
+from ai_analyzer.infrastructure.batching.micro_batcher import split_by_token_budget
+from benchmarks.bench_finbert_batching import SAMPLE_TEXTS
+
+
+def _mixed_corpus(n: int, headline_ratio: float, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        if rng.random() < headline_ratio:
+            # 헤드라인: 문장 앞부분만
+            texts.append(rng.choice(SAMPLE_TEXTS)[:rng.randint(15, 40)])
+        else:
+            # 본문: 문장 여러 개
+            texts.append(" ".join(rng.choice(SAMPLE_TEXTS) for _ in range(rng.randint(5, 40))))
+    return texts
+
+
+def _run(adapter: FinbertSentimentAdapter, features: list, batches: list) -> float:
+    model = adapter._model()
+    start = time.perf_counter()
+    for batch in batches:
+        adapter._forward(model, [features[i] for i in batch])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-texts", type=int, default=512)
+    parser.add_argument("--headline-ratio", type=float, default=0.7)
+    parser.add_argument("--run-model", action="store_true", help="실제 FinBERT 추론 시간도 측정")
+    args = parser.parse_args()
+
+    texts = _mixed_corpus(args.num_texts, args.headline_ratio)
+    tokenizer = AutoTokenizer.from_pretrained(FinbertSentimentAdapter.MODEL_NAME)
+    encodings = tokenizer(texts, truncation=True, max_length=FINBERT_MAX_LENGTH)
+    lengths = [len(ids) for ids in encodings["input_ids"]]
+
+    plans = {
+        "fifo": split_by_token_budget(lengths, FINBERT_MAX_BATCH_TOKENS, FINBERT_MAX_BATCH_SIZE),
+        "bucketed": plan_length_bucketed_batches(lengths, FINBERT_MAX_BATCH_TOKENS, FINBERT_MAX_BATCH_SIZE),
+    }
+
+    adapter = FinbertSentimentAdapter.getInstance() if args.run_model else None
+    features = [{key: encodings[key][i] for key in encodings.keys()} for i in range(len(texts))]
+    if adapter is not None:
+        _run(adapter, features, plans["bucketed"][:1])  # 워밍업
+
+    print(f"{'plan':>9} | {'batches':>7} | {'real tok':>9} | {'padded tok':>10} | {'waste':>6} | {'sec':>6}")
+    for name, batches in plans.items():
+        stats = padding_stats(lengths, batches)
+        elapsed = f"{_run(adapter, features, batches):.2f}" if adapter is not None else "-"
+        print(
+            f"{name:>9} | {stats['batches']:>7} | {stats['real_tokens']:>9} | "
+            f"{stats['padded_tokens']:>10} | {stats['waste_ratio']:>6.1%} | {elapsed:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+LLM 게이트웨이 부하 테스트 (로컬 stub LLM 사용, 네트워크 불필요).
+
+stub 이 일부 요청에 429/500 을 돌려주는 상태에서 N 건을 동시에 보내고
+- 성공/실패 건수, 재시도 횟수
+- stub 이 본 최대 동시 요청 수 (LLM_MAX_CONCURRENCY 를 넘지 않아야 함)
+- 지연 p50/p95
+를 출력한다.
+
+실행:
+    python -m benchmarks.bench_llm_gateway --requests 200 --fail-rate 0.2 --max-concurrency 8
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+STUB_PORT = 18082
+
+
+async def _one(gateway, index: int, stream: bool) -> tuple:
+    messages = [{"role": "user", "content": f"요청 {index}: 금융 뉴스 요약 테스트 문장입니다."}]
+    start = time.perf_counter()
+    try:
+        if stream:
+            async for _ in gateway.stream_chat(model="gpt-4o-mini", messages=messages, max_tokens=20):
+                pass
+        else:
+            await gateway.chat(model="gpt-4o-mini", messages=messages, max_tokens=20)
+        return True, time.perf_counter() - start, None
+    except Exception as e:
+        return False, time.perf_counter() - start, type(e).__name__
+
+
+async def run(args) -> None:
+    from benchmarks.stub_llm_server import start_stub
+    from config.openai.llm_gateway import LLMGateway
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.first_token_ms, token_ms=args.token_ms,
+                                    tokens=20, fail_rate=args.fail_rate)
+    gateway = LLMGateway.getInstance()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[_one(gateway, i, args.stream) for i in range(args.requests)])
+    wall = time.perf_counter() - start
+
+    latencies = sorted(r[1] for r in results if r[0])
+    errors = {}
+    for ok, _, name in results:
+        if not ok:
+            errors[name] = errors.get(name, 0) + 1
+
+    print(f"requests: {args.requests}  ok: {len(latencies)}  failed: {sum(errors.values())} {errors or ''}")
+    print(f"wall: {wall * 1000:.0f}ms", end="")
+    if latencies:
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"  p50: {statistics.median(latencies) * 1000:.0f}ms  p95: {p95 * 1000:.0f}ms")
+    else:
+        print()
+    print(f"stub requests: {stub.stats['requests']}  injected failures: {stub.stats['failures']}  "
+          f"max in-flight: {stub.stats['max_in_flight']} (cap {args.max_concurrency})")
+    print(f"gateway: {gateway.stats()}")
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--first-token-ms", type=float, default=100.0)
+    parser.add_argument("--token-ms", type=float, default=2.0)
+    parser.add_argument("--stream", action="store_true")
+    args = parser.parse_args()
+
+    # config.openai.* 가 import 되기 전에 stub 서버와 게이트웨이 설정을 지정
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["LLM_MAX_CONCURRENCY"] = str(args.max_concurrency)
+    os.environ.setdefault("LLM_RETRY_BASE_MS", "50")
+    # 주입된 장애로 서킷이 열리는 것은 이 벤치마크의 관심사가 아니므로 임계값을 높인다
+    os.environ.setdefault("LLM_BREAKER_FAILURES", "1000")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
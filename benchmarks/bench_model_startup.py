@@ -0,0 +1,75 @@
+"""
+모델 콜드 스타트 비교: 허브 이름으로 로드 vs 오프라인 아티팩트 번들(safetensors, mmap)에서 로드.
+
+모드마다 새 프로세스에서 ModelRegistry 로 finbert / minilm 을 로드하고
+- 모델별 로드 시간
+- import 포함 전체 시간
+- 최대 RSS
+를 보고한다. 번들은 model_artifacts build 로 미리 만들어 둔다.
+
+실행:
+    python -m ai_analyzer.infrastructure.registry.model_artifacts build --output /tmp/models
+    python -m benchmarks.bench_model_startup --bundle /tmp/models/current
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+MODELS = ["finbert", "minilm"]
+
+
+def run_worker() -> None:
+    start = time.perf_counter()
+    from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+
+    registry = ModelRegistry.getInstance()
+    registry.preload(MODELS, warmup=False)
+    status = registry.status()
+
+    print(json.dumps(dict(
+        load_sec={name: status[name]["load_time_sec"] for name in MODELS},
+        errors={name: status[name]["error"] for name in MODELS if status[name]["error"]},
+        total_sec=time.perf_counter() - start,
+        max_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundle", required=True, help="MODEL_ARTIFACT_DIR 로 쓸 번들 경로")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker()
+        return
+
+    modes = {
+        "hub": {key: value for key, value in os.environ.items() if key != "MODEL_ARTIFACT_DIR"},
+        "bundle": dict(os.environ, MODEL_ARTIFACT_DIR=args.bundle),
+    }
+
+    print(f"{'mode':>8} | {'run':>3} | {'finbert s':>9} | {'minilm s':>8} | {'total s':>7} | {'RSS MB':>7}")
+    for mode, env in modes.items():
+        for run in range(args.repeat):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_model_startup", "--bundle", args.bundle, "--worker"],
+                check=True, capture_output=True, text=True, env=env
+            ).stdout
+            report = json.loads(output.strip().splitlines()[-1])
+            if report["errors"]:
+                print(f"{mode:>8} | {run:>3} | errors: {report['errors']}")
+                continue
+            print(
+                f"{mode:>8} | {run:>3} | {report['load_sec']['finbert']:>9.2f} | {report['load_sec']['minilm']:>8.2f} | "
+                f"{report['total_sec']:>7.2f} | {report['max_rss_mb']:>7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
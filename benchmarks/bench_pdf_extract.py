@@ -0,0 +1,103 @@
+"""
+PDF 텍스트 추출 벤치마크: 기존 방식(이벤트 루프에서 페이지 순차 추출) vs PDFTextExtractor (페이지 구간 병렬).
+
+합성 PDF(페이지 수 지정)로
+- 전체 시간 / 초당 페이지 수
+- 첫 페이지가 나오기까지 시간 (iter_pages 스트리밍)
+- 추출 중 이벤트 루프 최대 지연 (10ms 주기 ticker 기준, 루프를 막으면 크게 늘어남)
+을 출력한다. 프로세스 풀 속도 향상은 CPU 코어 수만큼이 상한이다.
+
+실행:
+    python -m benchmarks.bench_pdf_extract --pages 100 300 600 --workers 1 2 4
+"""
+import argparse
+import asyncio
+import io
+import os
+import re
+import time
+
+
+def legacy_extract(file_bytes: bytes) -> str:
+    # 변경 전 extract_text_from_pdf_clean 과 같은 방식 (비교 기준)
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(file_bytes))
+    texts = []
+    for page in reader.pages:
+        t = page.extract_text() or ""
+        t = re.sub(r'\s+', ' ', t)
+        t = re.sub(r'\d+\s*$', '', t)
+        if t.strip():
+            texts.append(t.strip())
+    return "\n".join(texts)
+
+
+async def _ticker(lags: list, stop: asyncio.Event) -> None:
+    interval = 0.01
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _measure(run) -> tuple:
+    lags, stop = [], asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    first, pages = await run(start)
+    wall = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return wall, first, pages, max(lags) if lags else 0.0
+
+
+async def run(args) -> None:
+    from benchmarks.synthetic_pdf import make_pdf
+    from pdf_analyzer.infrastucture.extraction import pdf_text_extractor as extractor_module
+    from pdf_analyzer.infrastucture.extraction.pdf_text_extractor import PDFTextExtractor
+
+    extractor = PDFTextExtractor.getInstance()
+    print(f"cpu_count={os.cpu_count()}")
+    print(f"{'pages':>5} | {'mode':>10} | {'wall ms':>8} | {'pages/s':>7} | {'first page ms':>13} | {'max loop lag ms':>15}")
+    for pages in args.pages:
+        content = make_pdf(pages)
+
+        async def legacy(start):
+            text = legacy_extract(content)  # 이벤트 루프에서 그대로 실행 (기존 동작)
+            return time.perf_counter() - start, text.count("\n") + 1
+
+        wall, first, count, lag = await _measure(legacy)
+        print(f"{pages:>5} | {'legacy':>10} | {wall * 1000:>8.0f} | {count / wall:>7.0f} | {first * 1000:>13.0f} | "
+              f"{lag * 1000:>15.1f}")
+
+        for workers in args.workers:
+            extractor_module.PDF_EXTRACT_WORKERS = workers
+            extractor.pool = None
+            # 풀 기동 비용은 서버 수명 동안 한 번이므로 측정에서 제외
+            await extractor.extract_text(make_pdf(extractor_module.PDF_PARALLEL_MIN_PAGES))
+
+            async def engine(start):
+                first, count = None, 0
+                async for _ in extractor.iter_pages(content, max_pages=0):
+                    if first is None:
+                        first = time.perf_counter() - start
+                    count += 1
+                return first, count
+
+            wall, first, count, lag = await _measure(engine)
+            print(f"{pages:>5} | {f'workers={workers}':>10} | {wall * 1000:>8.0f} | {count / wall:>7.0f} | "
+                  f"{first * 1000:>13.0f} | {lag * 1000:>15.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 300, 600])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+PDF summarize_document map 단계 병렬화 벤치마크 (로컬 stub LLM 사용, 네트워크 불필요).
+
+청크 N 개를 동시 실행 수별로 요약하고, 전체 시간이 LLM 왕복 몇 번에 해당하는지 출력한다.
+기대값은 ceil(N / 동시 실행 수) + 1 (마지막 +1 은 전체 요약 reduce 호출).
+--fail-rate 를 주면 게이트웨이 재시도를 1 회로 줄여 청크 단위 재시도가 실제로 동작하는지 확인한다.
+
+실행:
+    python -m benchmarks.bench_pdf_map --chunks 30 --latency-ms 300
+    python -m benchmarks.bench_pdf_map --chunks 30 --fail-rate 0.2
+"""
+import argparse
+import asyncio
+import math
+import os
+import time
+
+STUB_PORT = 18083
+
+# 라우터 import 시 설정 모듈이 읽는 환경변수 (연결은 하지 않음)
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+
+async def run(args) -> None:
+    from benchmarks.stub_llm_server import start_stub
+    from pdf_analyzer.adapter.input.web import pdf_analyzer_router as pdf
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.latency_ms, token_ms=0, tokens=20,
+                                    fail_rate=args.fail_rate)
+    chunks = [f"섹션 {i}: 회사는 매출이 증가했다고 발표했다. " * 20 for i in range(args.chunks)]
+    await pdf.ask_gpt("warmup", max_tokens=1)  # 클라이언트 생성 제외
+
+    print(f"chunks={args.chunks}  latency={args.latency_ms:.0f}ms  fail_rate={args.fail_rate}")
+    print(f"{'conc':>4} | {'wall ms':>8} | {'round trips':>11} | {'expected':>8} | {'LLM requests':>12}")
+    for concurrency in args.concurrency:
+        before = stub.stats["requests"]
+        start = time.perf_counter()
+        await pdf.summarize_document(chunks, concurrency=concurrency)
+        wall = time.perf_counter() - start
+        expected = math.ceil(args.chunks / concurrency) + 1
+        print(f"{concurrency:>4} | {wall * 1000:>8.0f} | {wall * 1000 / args.latency_ms:>11.1f} | "
+              f"{expected:>8} | {stub.stats['requests'] - before:>12}")
+
+    print(f"stub max in-flight: {stub.stats['max_in_flight']}  injected failures: {stub.stats['failures']}")
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["PDF_STAGE_CACHE_BACKEND"] = "none"  # 같은 청크를 반복 요약하므로 단계 캐시는 끈다
+    os.environ["LLM_MAX_CONCURRENCY"] = str(max(args.concurrency))
+    if args.fail_rate:
+        # 게이트웨이 재시도를 줄여 청크 단위 재시도까지 내려오게 한다
+        os.environ["LLM_MAX_RETRIES"] = "1"
+        os.environ["LLM_BREAKER_FAILURES"] = "1000"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+추출 -> 청킹 -> 섹션 요약 스트리밍 파이프라인 벤치마크 (로컬 stub LLM + 합성 PDF/DOCX, 네트워크 불필요).
+
+문서 크기를 늘려 가며
+- 첫 LLM 호출까지 시간 (스트리밍이면 문서 크기와 무관해야 함)
+- 전체 요약 완료 시간
+을 기존 방식(전체 추출 -> 전체 청킹 -> 섹션 요약)과 비교한다.
+
+실행:
+    python -m benchmarks.bench_pdf_pipeline --pages 50 200 600
+    python -m benchmarks.bench_pdf_pipeline --pages 50 200 --docx
+"""
+import argparse
+import asyncio
+import io
+import os
+import time
+
+STUB_PORT = 18087
+
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+
+def make_docx(pages: int) -> bytes:
+    # 합성 PDF 와 비슷한 분량의 DOCX (페이지당 문단 50개)
+    from docx import Document
+    from benchmarks.synthetic_pdf import SENTENCES
+
+    document = Document()
+    for page_no in range(1, pages + 1):
+        for i in range(50):
+            document.add_paragraph(f"Section {page_no}.{i + 1}: {SENTENCES[(page_no + i) % len(SENTENCES)]}")
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+async def run(args) -> None:
+    from benchmarks.stub_llm_server import start_stub
+    from benchmarks.synthetic_pdf import make_pdf
+    from pdf_analyzer.adapter.input.web import pdf_analyzer_router as pdf
+    from pdf_analyzer.infrastucture.extraction.pdf_text_extractor import PDFTextExtractor
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.latency_ms, token_ms=0, tokens=40)
+    await pdf.ask_gpt("warmup", max_tokens=1)
+    await PDFTextExtractor.getInstance().extract_text(make_pdf(64))  # 프로세스 풀 기동 제외
+
+    async def legacy(content: bytes, document_type: str) -> None:
+        text = "\n".join([p async for p in pdf.iter_document_paragraphs(content, document_type)])
+        await pdf.summarize_document(pdf.chunk_text(text))
+
+    async def streaming(content: bytes, document_type: str) -> None:
+        await pdf.extract_and_summarize(content, document_type)
+
+    document_type = "docx" if args.docx else "pdf"
+    print(f"type={document_type}  latency={args.latency_ms:.0f}ms  cpu_count={os.cpu_count()}")
+    print(f"{'pages':>5} | {'mode':>9} | {'first LLM call ms':>17} | {'total ms':>8} | {'LLM calls':>9}")
+    for pages in args.pages:
+        content = make_docx(pages) if args.docx else make_pdf(pages)
+        for mode, func in (("legacy", legacy), ("streaming", streaming)):
+            stub.first_request_at = None
+            before = stub.stats["requests"]
+            start = time.perf_counter()
+            await func(content, document_type)
+            total = time.perf_counter() - start
+            first = (stub.first_request_at - start) if stub.first_request_at else float("nan")
+            print(f"{pages:>5} | {mode:>9} | {first * 1000:>17.0f} | {total * 1000:>8.0f} | "
+                  f"{stub.stats['requests'] - before:>9}")
+
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 200, 600])
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--docx", action="store_true")
+    args = parser.parse_args()
+
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["PDF_STAGE_CACHE_BACKEND"] = "none"  # 같은 문서를 두 방식으로 반복 처리하므로 단계 캐시는 끈다
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
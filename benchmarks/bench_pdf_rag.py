@@ -0,0 +1,151 @@
+"""
+PDF QA 방식 비교: summary (전체 요약 기반) vs rag (문서 청크 인덱스 top-k 기반).
+로컬 stub LLM + 디스크 단계 캐시 + 임시 인덱스 디렉터리를 쓰므로 네트워크/Redis 불필요.
+
+같은 합성 PDF 에 질문만 바꿔 여러 번 요청하고, 요청마다
+- 시간 / LLM 호출 수 / 프롬프트 토큰 (stub 기준)
+- rag: 답변 근거 청크에 질문이 가리키는 줄("Section <page>.<line>")이 들어 있는지
+를 출력한다. 인덱스는 첫 rag 요청에서 한 번만 만들어지고, 이후 질문은 임베딩 1회 + LLM 1회여야 한다.
+
+sentence-transformers 가 없는 환경에서도 돌 수 있도록 기본값은 글자 3-gram 해시 임베딩(--embedder hash)을
+모델 레지스트리 "minilm" 자리에 넣는다 (비용/흐름 측정용, 검색 품질 측정용 아님).
+실제 MiniLM 으로 재려면 --embedder minilm.
+
+실행:
+    python -m benchmarks.bench_pdf_rag --pages 40 --questions 4
+    python -m benchmarks.bench_pdf_rag --embedder minilm --search-rows 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import time
+import zlib
+
+import numpy as np
+
+STUB_PORT = 18086
+
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+
+class _CharTokenizer:
+    # 토크나이저 흉내 (2글자 = 1토큰, 앞뒤 특수 토큰 2개)
+    def __call__(self, text, add_special_tokens=True):
+        ids = list(range((len(text) + 1) // 2))
+        return {"input_ids": [0] + ids + [0] if add_special_tokens else ids}
+
+    def num_special_tokens_to_add(self) -> int:
+        return 2
+
+
+class _HashSentenceEncoder:
+    # SentenceTransformer.encode 와 같은 모양의 인터페이스 (글자 3-gram 을 해시해 384 차원에 누적)
+    dim = 384
+    max_seq_length = 128
+
+    def __init__(self, ms_per_text: float):
+        self.ms_per_text = ms_per_text
+        self.tokenizer = _CharTokenizer()
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        time.sleep(self.ms_per_text * len(texts) / 1000)  # 모델 추론 시간 흉내
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            text = text.lower()
+            for i in range(len(text) - 2):
+                vectors[row, zlib.crc32(text[i:i + 3].encode("utf-8")) % self.dim] += 1.0
+        return vectors
+
+
+class _HashKeyBERT:
+    # 레지스트리의 "minilm" 은 KeyBERT 객체이므로 kw_model.model.embedding_model 경로를 맞춘다
+    def __init__(self, ms_per_text: float):
+        self.model = type("Backend", (), {})()
+        self.model.embedding_model = _HashSentenceEncoder(ms_per_text)
+        self.tokenizer_lock = threading.Lock()
+
+
+async def run(args) -> None:
+    from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+    from benchmarks.stub_llm_server import start_stub
+    from benchmarks.synthetic_pdf import make_pdf
+    from pdf_analyzer.adapter.input.web import pdf_analyzer_router as pdf
+    from pdf_analyzer.infrastucture.retrieval.chunk_index import ChunkIndex, ChunkIndexStore, embed_texts
+
+    if args.embedder == "hash":
+        ModelRegistry.getInstance().put("minilm", _HashKeyBERT(args.embed_ms))
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.latency_ms, token_ms=0, tokens=40)
+    await pdf.ask_gpt("warmup", max_tokens=1)
+    content = make_pdf(args.pages)
+    rng = random.Random(0)
+
+    print(f"pages={args.pages}  latency={args.latency_ms:.0f}ms  embedder={args.embedder}  "
+          f"index_dir={os.environ['PDF_RAG_INDEX_DIR']}")
+    print(f"{'mode':>7} | {'request':>7} | {'wall ms':>8} | {'LLM calls':>9} | {'prompt tokens':>13} | {'needle in sources':>17}")
+    for mode in ("summary", "rag"):
+        for i in range(args.questions):
+            page, line = rng.randint(1, args.pages), rng.randint(1, 50)
+            needle = f"Section {page}.{line}:"
+            before = dict(stub.stats)
+            start = time.perf_counter()
+            response = await pdf.analyze_pdf_bytes(content, f"What does {needle[:-1]} say?", qa_mode=mode)
+            wall = time.perf_counter() - start
+            found = "-"
+            if mode == "rag":
+                index = next(iter(ChunkIndexStore.getInstance().opened.values()))
+                found = any(needle in index.chunks[source["chunk"]] for source in response["sources"])
+            print(f"{mode:>7} | {i + 1:>7} | {wall * 1000:>8.0f} | {stub.stats['requests'] - before['requests']:>9} | "
+                  f"{stub.stats['prompt_tokens'] - before['prompt_tokens']:>13} | {str(found):>17}")
+
+    store = ChunkIndexStore.getInstance()
+    index = next(iter(store.opened.values()))
+    print(f"index: {len(index.chunks)} chunks, vectors {index.vectors.shape} {index.vectors.dtype}")
+    print(f"chunk_index: {store.stats()}")
+    await runner.cleanup()
+
+    if args.search_rows:
+        # 큰 인덱스에서 memmap 검색 비용 (질문 임베딩 제외, 내적 + top-k 만)
+        directory = tempfile.mkdtemp(prefix="pdf_rag_search_")
+        dim = embed_texts(["dim"]).shape[1]
+        vectors = np.random.default_rng(0).standard_normal((args.search_rows, dim)).astype(np.float32)
+        np.save(os.path.join(directory, "vectors.npy"), vectors / np.linalg.norm(vectors, axis=1, keepdims=True))
+        with open(os.path.join(directory, "chunks.json"), "w", encoding="utf-8") as f:
+            f.write("[" + ",".join('""' for _ in range(args.search_rows)) + "]")
+        big = ChunkIndex(directory)
+        query = embed_texts(["What does Section 1.1 say?"])[0]
+        big.top_k(query, 6)
+        start = time.perf_counter()
+        for _ in range(20):
+            big.top_k(query, 6)
+        print(f"search {args.search_rows} rows x {dim}: {(time.perf_counter() - start) / 20 * 1000:.1f} ms/query")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--questions", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--embedder", choices=("hash", "minilm"), default="hash")
+    parser.add_argument("--embed-ms", type=float, default=2.0, help="hash 임베더의 텍스트당 추론 시간 흉내 (ms)")
+    parser.add_argument("--search-rows", type=int, default=0)
+    args = parser.parse_args()
+
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["PDF_STAGE_CACHE_BACKEND"] = "disk"
+    os.environ["PDF_STAGE_CACHE_DIR"] = tempfile.mkdtemp(prefix="pdf_stage_cache_")
+    os.environ["PDF_RAG_INDEX_DIR"] = tempfile.mkdtemp(prefix="pdf_chunk_index_")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
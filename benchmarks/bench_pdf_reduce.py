@@ -0,0 +1,75 @@
+"""
+PDF summarize_document reduce 단계 비교: 한 번에 합치기(flat) vs 단계별 통합(tree) (로컬 stub LLM 사용).
+
+청크 수를 늘려 가며
+- 전체 시간 / LLM 호출 수
+- 가장 긴 프롬프트 토큰 수 (tree 는 PDF_REDUCE_TOKEN_BUDGET 근처에서 멈춰야 함)
+를 출력한다. flat 은 reduce 예산을 무한대로 줘서 기존 동작(요약문 전부를 한 프롬프트에)을 재현한다.
+stub 은 프롬프트 길이에 비례하는 prefill 지연(--prefill-ms-per-1k)을 준다.
+
+실행:
+    python -m benchmarks.bench_pdf_reduce --chunks 16 64 256 1024 --budget 6000
+"""
+import argparse
+import asyncio
+import os
+import time
+
+STUB_PORT = 18084
+
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+
+async def run(args) -> None:
+    from benchmarks.stub_llm_server import start_stub
+    from pdf_analyzer.adapter.input.web import pdf_analyzer_router as pdf
+
+    # 섹션 요약 응답이 실제처럼 수백 토큰이 되도록 응답 토큰 수를 크게 준다
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.latency_ms, token_ms=0, tokens=args.reply_words,
+                                    prefill_ms_per_1k=args.prefill_ms_per_1k)
+    await pdf.ask_gpt("warmup", max_tokens=1)
+
+    print(f"{'chunks':>6} | {'mode':>4} | {'wall ms':>8} | {'LLM calls':>9} | {'max prompt tok':>14}")
+    for n in args.chunks:
+        chunks = [f"섹션 {i}: 회사는 {i}분기 매출이 전년 대비 증가했다고 발표했다. " * 30 for i in range(n)]
+        for mode, budget in (("flat", 10 ** 9), ("tree", args.budget)):
+            before = stub.stats["requests"]
+            stub.stats["max_prompt_tokens"] = 0
+            start = time.perf_counter()
+            try:
+                await pdf.summarize_document(chunks, concurrency=args.concurrency, reduce_budget=budget)
+            except Exception as e:
+                # flat 은 문서가 크면 프롬프트가 한도를 넘어 실패한다
+                print(f"{n:>6} | {mode:>4} | failed: {type(e).__name__}: {str(e)[:60]}")
+                continue
+            wall = time.perf_counter() - start
+            print(f"{n:>6} | {mode:>4} | {wall * 1000:>8.0f} | {stub.stats['requests'] - before:>9} | "
+                  f"{stub.stats['max_prompt_tokens']:>14}")
+
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, nargs="+", default=[16, 64, 256, 1024])
+    parser.add_argument("--budget", type=int, default=6000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=50.0)
+    parser.add_argument("--reply-words", type=int, default=120)
+    args = parser.parse_args()
+
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["PDF_STAGE_CACHE_BACKEND"] = "none"  # 같은 청크를 반복 요약하므로 단계 캐시는 끈다
+    os.environ["LLM_MAX_CONCURRENCY"] = str(args.concurrency)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+PDF 단계 캐시 효과 측정 (로컬 stub LLM + 디스크 캐시, 네트워크/Redis 불필요).
+
+같은 합성 PDF 에 질문만 바꿔 analyze_pdf_bytes 를 여러 번 호출하고
+요청마다 LLM 호출 수와 시간을 출력한다. 첫 요청 이후에는 QA 1 회만 호출되어야 한다.
+
+실행:
+    python -m benchmarks.bench_pdf_stage_cache --pages 40 --questions 3
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+STUB_PORT = 18085
+
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+
+async def run(args) -> None:
+    from benchmarks.stub_llm_server import start_stub
+    from benchmarks.synthetic_pdf import make_pdf
+    from pdf_analyzer.adapter.input.web import pdf_analyzer_router as pdf
+    from pdf_analyzer.infrastucture.cache.stage_cache import StageCache
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.latency_ms, token_ms=0, tokens=40)
+    await pdf.ask_gpt("warmup", max_tokens=1)
+    content = make_pdf(args.pages)
+
+    print(f"pages={args.pages}  latency={args.latency_ms:.0f}ms  cache_dir={os.environ['PDF_STAGE_CACHE_DIR']}")
+    print(f"{'request':>7} | {'wall ms':>8} | {'LLM calls':>9}")
+    for i in range(args.questions):
+        before = stub.stats["requests"]
+        start = time.perf_counter()
+        await pdf.analyze_pdf_bytes(content, f"질문 {i + 1}: 배당 정책은 어떻게 바뀌었나?")
+        wall = time.perf_counter() - start
+        print(f"{i + 1:>7} | {wall * 1000:>8.0f} | {stub.stats['requests'] - before:>9}")
+
+    print(f"cache: {StageCache.getInstance().stats()}")
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--questions", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["PDF_STAGE_CACHE_BACKEND"] = "disk"
+    os.environ["PDF_STAGE_CACHE_DIR"] = tempfile.mkdtemp(prefix="pdf_stage_cache_")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+/ai-summary/summarize vs /ai-summary/summarize/stream 비교 (로컬 stub LLM 사용, 네트워크 불필요).
+
+- 단건: 첫 바이트까지 시간(TTFB) / 전체 완료 시간
+- 동시 N건: 전체 wall time (이벤트 루프가 막히지 않으면 단건 시간과 비슷해야 함)
+
+실행:
+    python -m benchmarks.bench_summary_stream --first-token-ms 300 --token-ms 20 --concurrency 16
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+STUB_PORT = 18080
+APP_PORT = 18081
+PAYLOAD = {
+    "content": "삼성전자가 3분기 영업이익이 시장 전망치를 크게 웃돌았다고 발표했다. " * 10,
+    "keywords": ["삼성전자", "영업이익"],
+}
+
+
+async def _post(client, path: str) -> tuple:
+    start = time.perf_counter()
+    response = await client.post(path, json=PAYLOAD)
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+async def _post_stream(client, path: str) -> tuple:
+    start = time.perf_counter()
+    first = None
+    async with client.stream("POST", path, json=PAYLOAD) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if first is None and line.startswith("data:"):
+                first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+async def run(args) -> None:
+    import httpx
+    import uvicorn
+    from fastapi import FastAPI
+    from benchmarks.stub_llm_server import start_stub
+
+    stub, runner = await start_stub(STUB_PORT, first_token_ms=args.first_token_ms, token_ms=args.token_ms,
+                                    tokens=args.tokens)
+
+    from ai_summary.adapter.input.web.ai_summary_router import ai_summary_router
+    app = FastAPI()
+    app.include_router(ai_summary_router, prefix="/ai-summary")
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=APP_PORT, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{APP_PORT}", timeout=60) as client:
+        await _post(client, "/ai-summary/summarize")  # openai SDK import / 클라이언트 생성 제외
+        print(f"{'mode':>8} | {'conc':>4} | {'TTFB p50 ms':>11} | {'total p50 ms':>12} | {'wall ms':>8}")
+        for mode, call, path in (("blocking", _post, "/ai-summary/summarize"),
+                                 ("stream", _post_stream, "/ai-summary/summarize/stream")):
+            for concurrency in (1, args.concurrency):
+                start = time.perf_counter()
+                results = await asyncio.gather(*[call(client, path) for _ in range(concurrency)])
+                wall = time.perf_counter() - start
+                ttfb = statistics.median(r[0] for r in results) * 1000
+                total = statistics.median(r[1] for r in results) * 1000
+                print(f"{mode:>8} | {concurrency:>4} | {ttfb:>11.0f} | {total:>12.0f} | {wall * 1000:>8.0f}")
+
+    print(f"stub max in-flight: {stub.stats['max_in_flight']}")
+    server.should_exit = True
+    await server_task
+    await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    # config.openai.config 가 import 되기 전에 stub 서버를 가리키도록 설정
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
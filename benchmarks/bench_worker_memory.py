@@ -0,0 +1,128 @@
+"""
+preload-then-fork 워커 모드의 워커별 메모리 사용량 측정.
+
+ai-analyzer / health 라우터만 올린 앱을 app.prefork.serve 로 N 개 워커로 띄운 뒤
+- /health/ready 가 200 이 될 때까지 대기
+- 각 워커가 실제 추론을 하도록 /ai-analyzer/analyze 요청을 보냄
+- /proc/<pid>/smaps_rollup 으로 워커별 RSS / PSS / USS / 공유 메모리를 보고
+워커를 하나 늘릴 때 드는 메모리는 USS 이며, 모델 가중치는 shared 쪽에 잡혀야 한다.
+
+실행:
+    python -m benchmarks.bench_worker_memory --workers 4
+"""
+import argparse
+import json
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry, PRELOAD_MODELS
+from ai_analyzer.infrastructure.registry.process_memory import read_memory_usage
+from benchmarks.bench_finbert_batching import SAMPLE_TEXTS
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    from fastapi import FastAPI
+    from ai_analyzer.adapter.input.web.ai_analyzer_router import ai_analyzer_router
+    from app.prefork import serve as prefork_serve
+    from health.adapter.input.web.health_router import health_router
+
+    # app.main 과 같은 lifespan (DB/OAuth 설정 없이 실행하기 위해 앱을 따로 구성)
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        threading.Thread(
+            target=ModelRegistry.getInstance().preload, args=(PRELOAD_MODELS,), name="model-preload", daemon=True
+        ).start()
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(ai_analyzer_router, prefix="/ai-analyzer")
+    app.include_router(health_router, prefix="/health")
+    prefork_serve(app, host=host, port=port, workers=workers)
+
+
+def _request(url: str, payload: dict = None, timeout: float = 60.0):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status, json.loads(response.read())
+
+
+def _wait_ready(base_url: str, timeout: float) -> float:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            status, _ = _request(f"{base_url}/health/ready", timeout=2.0)
+            if status == 200:
+                return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"{timeout}s 안에 /health/ready 가 200 이 되지 않았습니다.")
+
+
+def _children(pid: int) -> list:
+    path = f"/proc/{pid}/task/{pid}/children"
+    with open(path) as f:
+        return [int(child) for child in f.read().split()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18765)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--serve", action="store_true", help="(내부용) 서버 프로세스로 실행")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.host, args.port, args.workers)
+        return
+
+    server = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.bench_worker_memory", "--serve",
+        "--workers", str(args.workers), "--host", args.host, "--port", str(args.port)
+    ])
+    base_url = f"http://{args.host}:{args.port}"
+    try:
+        ready_sec = _wait_ready(base_url, args.timeout)
+        print(f"ready after {ready_sec:.1f}s")
+
+        # 요청이 여러 워커로 분산되도록 동시에 보낸다 (모든 워커가 추론 경로를 한 번 이상 타도록)
+        texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(args.requests)]
+        with ThreadPoolExecutor(max_workers=args.workers * 4) as pool:
+            list(pool.map(lambda text: _request(f"{base_url}/ai-analyzer/analyze", {"content": text}), texts))
+
+        parent = read_memory_usage(server.pid)
+        workers = [read_memory_usage(pid) for pid in _children(server.pid)]
+
+        print(f"\n{'process':>10} {'pid':>8} {'rss_mb':>10} {'pss_mb':>10} {'uss_mb':>10} {'shared_mb':>10}")
+        for name, usage in [("parent", parent)] + [(f"worker{i}", w) for i, w in enumerate(workers)]:
+            print(
+                f"{name:>10} {usage['pid']:>8} {usage['rss_mb']:>10} {usage['pss_mb']:>10} "
+                f"{usage['uss_mb']:>10} {usage['shared_mb']:>10}"
+            )
+
+        total_pss = parent["pss_mb"] + sum(w["pss_mb"] for w in workers)
+        naive = sum(w["rss_mb"] for w in workers)
+        print(f"\ntotal PSS (실제 사용량): {total_pss:.1f}MB")
+        print(f"sum of worker RSS (워커마다 따로 로드했을 때의 근사치): {naive:.1f}MB")
+        print(f"mean worker USS (워커 1개 추가 비용): {sum(w['uss_mb'] for w in workers) / max(len(workers), 1):.1f}MB")
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+if __name__ == "__main__":
+    main()
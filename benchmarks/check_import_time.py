@@ -0,0 +1,95 @@
+"""
+import 시간 예산 검사 (python -X importtime 기반).
+
+라우터/앱 모듈을 새 프로세스에서 import 하면서
+- 누적 import 시간이 예산(ms)을 넘는지
+- import 되면 안 되는 무거운 패키지(torch, transformers, openai 등)가 딸려 오는지
+를 확인한다. 하나라도 어기면 exit code 1 로 종료하므로 CI 에서 회귀를 잡을 수 있다.
+
+실행:
+    python -m benchmarks.check_import_time
+    python -m benchmarks.check_import_time --scale 2.0   # 느린 CI 머신에서는 예산을 배수로 늘림
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ML_STACK = ["torch", "transformers", "sentence_transformers", "keybert", "kiwipiepy", "onnxruntime"]
+LLM_SDK = ["openai"]
+HEAVY_IO = ["boto3", "botocore", "pypdf"]
+
+# (모듈, import 되면 안 되는 패키지, 누적 import 예산 ms)
+TARGETS: List[Tuple[str, List[str], float]] = [
+    ("ai_analyzer.adapter.input.web.ai_analyzer_router", ML_STACK + LLM_SDK, 1500),
+    ("ai_summary.adapter.input.web.ai_summary_router", ML_STACK + LLM_SDK, 1000),
+    ("pdf_analyzer.adapter.input.web.pdf_analyzer_router", ML_STACK + LLM_SDK + HEAVY_IO, 1500),
+    ("health.adapter.input.web.health_router", ML_STACK + LLM_SDK, 1000),
+    ("app.main", ML_STACK + LLM_SDK + HEAVY_IO, 3000),
+]
+
+# 설정 모듈이 import 시점에 읽는 환경변수 (값 자체는 쓰이지 않음 - 연결은 하지 않는다)
+DUMMY_ENV = dict(
+    MYSQL_USER="user", MYSQL_PASSWORD="password", MYSQL_HOST="localhost", MYSQL_PORT="3306",
+    MYSQL_DATABASE="db", REDIS_HOST="localhost", REDIS_PORT="6379", REDIS_DB="0",
+)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(module: str) -> Tuple[float, Dict[str, int]]:
+    """module 의 누적 import 시간(ms)과 import 된 모듈별 self 시간(us)을 반환."""
+    env = dict(DUMMY_ENV, **os.environ)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} 실패:\n{result.stderr.strip().splitlines()[-1]}")
+
+    cumulative_us = 0
+    self_us: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_time, cumulative, _, name = match.groups()
+        self_us[name] = int(self_time)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, self_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="예산 배수")
+    parser.add_argument("--top", type=int, default=5, help="모듈마다 출력할 가장 느린 import 수")
+    args = parser.parse_args()
+
+    failed = False
+    for module, forbidden, budget_ms in TARGETS:
+        try:
+            total_ms, self_us = measure(module)
+        except RuntimeError as e:
+            print(f"[SKIP] {e}")
+            continue
+
+        budget_ms *= args.scale
+        leaked = sorted({name.split(".")[0] for name in self_us} & set(forbidden))
+        ok = total_ms <= budget_ms and not leaked
+        failed |= not ok
+
+        print(f"[{'OK' if ok else 'FAIL'}] {module}: {total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+        if leaked:
+            print(f"    forbidden imports: {', '.join(leaked)}")
+        for name, us in sorted(self_us.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {us / 1000:>7.1f}ms  {name}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+청커 비교 리포트: 기존 글자 수 기준 청커 vs TokenChunker (Kiwi 문장 단위 + 토큰 예산 + 겹침).
+
+같은 문서에 대해
+- 청크 수 (= 섹션 요약 LLM 호출 수)
+- 청크 평균/최소/최대 토큰, 채움 비율(청크 토큰 / 예산, 마지막 청크 제외)
+- 예산 초과 청크 수, 청크 사이 실제 겹침 토큰
+을 출력한다. 어긋나면(예산 초과, 겹침 없음) exit code 1.
+
+실행:
+    python -m benchmarks.report_chunking                        # 합성 한국어 문서 (페이지 길이 제각각)
+    python -m benchmarks.report_chunking --pdf /path/report.pdf  # 실제 PDF (PDFTextExtractor 로 추출)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+from typing import List
+
+SENTENCES = [
+    "삼성전자는 3분기 연결 기준 매출 79조원, 영업이익 9조 1천억원을 기록했다고 밝혔다.",
+    "메모리 반도체 가격 회복과 고대역폭 메모리 판매 확대가 실적 개선을 이끌었다.",
+    "회사는 내년 설비 투자를 올해와 비슷한 수준으로 유지하되 첨단 패키징 비중을 늘릴 계획이다.",
+    "다만 환율 변동성과 미국의 수출 규제는 여전히 주요 위험 요인으로 꼽혔다.",
+    "이사회는 분기 배당을 주당 361원으로 결정하고 추가 자사주 매입 계획도 승인했다.",
+    "증권가는 데이터센터 수요가 공급을 웃도는 흐름이 내년 상반기까지 이어질 것으로 내다봤다.",
+    "파운드리 사업부는 2나노 공정 수율 개선에 따라 대형 고객사 수주를 기대하고 있다.",
+    "스마트폰 사업은 신제품 출시 효과가 줄면서 전 분기 대비 수익성이 다소 낮아졌다.",
+]
+
+
+def legacy_chunk_text(text: str, chunk_size=3500) -> List[str]:
+    # 변경 전 chunk_text (글자 수 기준, 줄 단위로 묶고 겹침 없음)
+    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+    chunks, cur = [], ""
+    for p in paragraphs:
+        if len(cur) + len(p) <= chunk_size:
+            cur += " " + p
+        else:
+            chunks.append(cur.strip())
+            cur = p
+    if cur:
+        chunks.append(cur.strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def synthetic_text(pages: int, seed: int = 0) -> str:
+    # 추출 후 형태처럼 페이지마다 공백이 정리된 한 줄, 페이지 길이는 800~2600 글자로 제각각
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(pages):
+        target = rng.randint(800, 2600)
+        page = ""
+        while len(page) < target:
+            page += rng.choice(SENTENCES) + " "
+        lines.append(page.strip())
+    return "\n".join(lines)
+
+
+def overlap_tokens(previous: str, current: str, count_tokens) -> int:
+    # current 의 앞부분 중 previous 의 끝부분과 같은 가장 긴 접두사
+    for size in range(min(len(previous), len(current)), 0, -1):
+        if previous.endswith(current[:size]):
+            return count_tokens(current[:size])
+    return 0
+
+
+def report(name: str, chunks: List[str], budget: int, count_tokens) -> bool:
+    tokens = [count_tokens(chunk) for chunk in chunks]
+    body = tokens[:-1] or tokens
+    fills = [t / budget for t in body]
+    overlaps = [overlap_tokens(a, b, count_tokens) for a, b in zip(chunks, chunks[1:])]
+    over_budget = sum(1 for t in tokens if t > budget)
+    print(f"[{name}] chunks={len(chunks)}  total_tokens={sum(tokens)}")
+    print(f"    tokens mean={statistics.mean(tokens):.0f} min={min(tokens)} max={max(tokens)}  budget={budget}")
+    print(f"    fill ratio mean={statistics.mean(fills):.2f} min={min(fills):.2f} (마지막 청크 제외)")
+    print(f"    overlap tokens mean={statistics.mean(overlaps) if overlaps else 0:.0f}  over budget={over_budget}")
+    return over_budget == 0 and (not overlaps or min(overlaps) > 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=120)
+    parser.add_argument("--pdf", help="실제 PDF 경로 (없으면 합성 문서)")
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--overlap-tokens", type=int, default=None)
+    args = parser.parse_args()
+
+    from config.openai.token_counter import count_tokens
+    from pdf_analyzer.infrastucture.chunking.token_chunker import TokenChunker
+
+    if args.pdf:
+        from pdf_analyzer.infrastucture.extraction.pdf_text_extractor import PDFTextExtractor
+        with open(args.pdf, "rb") as f:
+            text = asyncio.run(PDFTextExtractor.getInstance().extract_text(f.read()))
+    else:
+        text = synthetic_text(args.pages)
+
+    chunker = TokenChunker(args.max_tokens, args.overlap_tokens)
+    legacy = legacy_chunk_text(text)
+    chunks = chunker.chunk(p for p in text.split("\n") if p.strip())
+
+    print(f"document: {len(text)} chars, {count_tokens(text)} tokens")
+    report("legacy 3500 chars", legacy, chunker.max_tokens, count_tokens)
+    ok = report(f"token {chunker.max_tokens}/{chunker.overlap_tokens}", chunks, chunker.max_tokens, count_tokens)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
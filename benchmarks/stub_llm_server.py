@@ -0,0 +1,154 @@
+"""
+OpenAI Chat Completions 호환 로컬 stub 서버 (네트워크/API 키 없이 LLM 경로 테스트용).
+
+- POST /v1/chat/completions : stream=true 면 SSE 청크, 아니면 한 번에 응답
+- 첫 토큰까지 지연(--first-token-ms)과 토큰당 지연(--token-ms)을 주입할 수 있다
+- --prefill-ms-per-1k 를 주면 프롬프트 1000 토큰마다 첫 토큰 지연이 그만큼 늘어난다 (긴 프롬프트 비용 재현)
+- --fail-rate 로 일부 요청에 429/500 을 돌려준다 (재시도 로직 테스트용)
+- GET /stats : 받은 요청 수, 동시 처리 최대치, 가장 긴 프롬프트 토큰 수
+
+단독 실행:
+    python -m benchmarks.stub_llm_server --port 18080 --first-token-ms 300 --token-ms 20
+    OPENAI_BASE_URL=http://127.0.0.1:18080/v1 OPENAI_API_KEY=stub python -m app.main
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+from aiohttp import web
+
+
+class StubLLM:
+    def __init__(self, first_token_ms: float = 300.0, token_ms: float = 20.0, tokens: int = 40,
+                 fail_rate: float = 0.0, seed: int = 0, prefill_ms_per_1k: float = 0.0):
+        self.first_token = first_token_ms / 1000
+        self.prefill_per_token = prefill_ms_per_1k / 1000 / 1000
+        self.token_delay = token_ms / 1000
+        self.tokens = tokens
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        # 첫 요청을 받은 시점 (perf_counter, 벤치마크에서 None 으로 되돌려 다시 측정)
+        self.first_request_at = None
+        self.stats = dict(requests=0, failures=0, in_flight=0, max_in_flight=0, prompt_tokens=0, completion_tokens=0,
+                          max_prompt_tokens=0)
+
+    def _reply_tokens(self, messages: list) -> list:
+        # 프롬프트 앞부분을 잘라 응답 토큰처럼 쓴다 (결정적 출력)
+        prompt = messages[-1]["content"] if messages else ""
+        if '"sentiment"' in prompt:
+            # 감성 분석 프롬프트에는 JSON 형식으로 응답 (파싱 가능해야 캐시/후처리 경로를 탄다)
+            reply = json.dumps(dict(sentiment="neutral", key_actors=["stub"], key_issues=["stub"]))
+            return [reply[i:i + 8] for i in range(0, len(reply), 8)]
+        words = prompt.split() or ["요약"]
+        return [f"{words[i % len(words)]} " for i in range(self.tokens)]
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.stats["requests"] += 1
+        if self.first_request_at is None:
+            self.first_request_at = time.perf_counter()
+
+        if self.fail_rate and self.random.random() < self.fail_rate:
+            self.stats["failures"] += 1
+            status = self.random.choice([429, 500])
+            return web.json_response(
+                {"error": {"message": "stub failure", "type": "rate_limit" if status == 429 else "server_error"}},
+                status=status, headers={"retry-after-ms": "50"} if status == 429 else None
+            )
+
+        self.stats["in_flight"] += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            tokens = self._reply_tokens(body.get("messages", []))
+            max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+            if max_tokens:
+                tokens = tokens[:max_tokens]
+            prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 2
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["max_prompt_tokens"] = max(self.stats["max_prompt_tokens"], prompt_tokens)
+            self.stats["completion_tokens"] += len(tokens)
+            usage = dict(prompt_tokens=prompt_tokens, completion_tokens=len(tokens),
+                         total_tokens=prompt_tokens + len(tokens))
+
+            first_token = self.first_token + self.prefill_per_token * prompt_tokens
+            if body.get("stream"):
+                return await self._stream(request, body, tokens, usage, first_token)
+
+            await asyncio.sleep(first_token + self.token_delay * len(tokens))
+            return web.json_response(self._completion(body, "".join(tokens), usage))
+        finally:
+            self.stats["in_flight"] -= 1
+
+    async def _stream(self, request: web.Request, body: dict, tokens: list, usage: dict,
+                      first_token: float) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        await asyncio.sleep(first_token)
+        for i, token in enumerate(tokens):
+            if i:
+                await asyncio.sleep(self.token_delay)
+            chunk = self._chunk(completion_id, body, {"content": token}, None)
+            await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+        final = self._chunk(completion_id, body, {}, "stop")
+        if (body.get("stream_options") or {}).get("include_usage"):
+            final["usage"] = usage
+        await response.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _completion(body: dict, content: str, usage: dict) -> dict:
+        return dict(
+            id=f"chatcmpl-{uuid.uuid4().hex}", object="chat.completion", created=int(time.time()),
+            model=body.get("model", "stub"),
+            choices=[dict(index=0, message=dict(role="assistant", content=content), finish_reason="stop")],
+            usage=usage,
+        )
+
+    @staticmethod
+    def _chunk(completion_id: str, body: dict, delta: dict, finish_reason) -> dict:
+        return dict(
+            id=completion_id, object="chat.completion.chunk", created=int(time.time()),
+            model=body.get("model", "stub"),
+            choices=[dict(index=0, delta=delta, finish_reason=finish_reason)],
+        )
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle)
+        app.router.add_get("/stats", lambda request: web.json_response(self.stats))
+        return app
+
+
+async def start_stub(port: int, **kwargs) -> tuple:
+    """이벤트 루프 안에서 stub 서버를 띄우고 (StubLLM, AppRunner) 를 반환. 벤치마크에서 사용."""
+    stub = StubLLM(**kwargs)
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return stub, runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=40)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=0.0)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.first_token_ms, args.token_ms, args.tokens, args.fail_rate,
+                   prefill_ms_per_1k=args.prefill_ms_per_1k)
+    web.run_app(stub.app(), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
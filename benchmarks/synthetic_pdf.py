@@ -0,0 +1,78 @@
+"""
+벤치마크용 합성 PDF 생성기 (외부 라이브러리 없이 PDF 1.4 를 직접 작성).
+
+Helvetica 기본 폰트를 쓰므로 본문은 ASCII 문장이다. 페이지마다 하단에 페이지 번호를 찍어
+추출 후 페이지 번호 제거 규칙도 함께 확인할 수 있다.
+
+단독 실행:
+    python -m benchmarks.synthetic_pdf --pages 300 --output /tmp/report.pdf
+"""
+import argparse
+
+SENTENCES = [
+    "The company reported that quarterly revenue increased compared with the same period last year.",
+    "Operating margin improved as memory prices recovered and inventory levels normalized.",
+    "Management expects capital expenditure to remain elevated to expand advanced packaging capacity.",
+    "Analysts noted that currency movements and export regulations remain the main risks.",
+    "The board approved a dividend increase and an additional share buyback program.",
+    "Demand from data center customers continued to outpace supply during the period.",
+]
+
+
+def _page_stream(page_no: int, lines: int) -> bytes:
+    rows = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+    for i in range(lines):
+        sentence = SENTENCES[(page_no + i) % len(SENTENCES)]
+        rows.append(f"(Section {page_no}.{i + 1}: {sentence}) Tj T*")
+    rows.append("ET")
+    rows.append(f"BT /F1 9 Tf 290 30 Td ({page_no}) Tj ET")
+    return "\n".join(rows).encode("latin-1")
+
+
+def make_pdf(pages: int, lines_per_page: int = 50) -> bytes:
+    # 객체 번호: 1 Catalog, 2 Pages, 3 Font, 이후 페이지마다 (Page, Contents) 두 개씩
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for page_no in range(1, pages + 1):
+        page_id, content_id = 2 + page_no * 2, 3 + page_no * 2
+        stream = _page_stream(page_no, lines_per_page)
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode("latin-1")
+        objects[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        kids.append(f"{page_id} 0 R")
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode("latin-1")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n" % obj_id + objects[obj_id] + b"\nendobj\n"
+
+    xref = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for obj_id in range(1, size):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref)
+    return bytes(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--output", default="/tmp/synthetic.pdf")
+    args = parser.parse_args()
+
+    with open(args.output, "wb") as f:
+        f.write(make_pdf(args.pages, args.lines))
+    print(f"wrote {args.output} ({args.pages} pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,41 @@
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # .env 파일 자동 로딩
 load_dotenv()
 
 # 환경변수에서 API 키 읽기
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY environment variable not set!")
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=OPENAI_API_KEY)
+# OpenAI 클라이언트 (Singleton) - openai SDK import 와 클라이언트 생성은 처음 사용할 때 수행
+# OPENAI_BASE_URL 을 지정하면 SDK 가 그 주소로 요청한다 (로컬 stub 서버 테스트용)
+_openai_client = None
+_async_openai_client = None
+
+
+def get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        if not OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY environment variable not set!")
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
+
+
+def get_async_openai_client():
+    # 비동기 라우트에서 이벤트 루프를 막지 않도록 AsyncOpenAI 사용 (HTTP 커넥션 풀 재사용)
+    global _async_openai_client
+    if _async_openai_client is None:
+        if not OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY environment variable not set!")
+        from openai import AsyncOpenAI
+        _async_openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    return _async_openai_client
+
+
+def __getattr__(name: str):
+    # 기존 코드 호환: from config.openai.config import client
+    if name == "client":
+        return get_openai_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
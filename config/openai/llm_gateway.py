@@ -0,0 +1,376 @@
+import asyncio
+import os
+import random
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from config.openai.config import get_async_openai_client
+
+# 모든 LLM 호출이 거쳐 가는 공용 게이트웨이 설정 (환경변수로 조정 가능, 0 이면 제한 없음)
+# - LLM_MAX_CONCURRENCY: 프로세스 전체 동시 호출 수
+# - LLM_GLOBAL_RPM / LLM_GLOBAL_TPM: 전체 분당 요청 수 / 토큰 수
+# - LLM_MODEL_LIMITS: 모델별 분당 요청:토큰 (예: "gpt-4o-mini=500:200000,gpt-4.1=100:30000")
+# - LLM_MAX_RETRIES, LLM_RETRY_BASE_MS, LLM_RETRY_MAX_SEC: 429/5xx/연결 오류 재시도 (지수 백오프 + full jitter)
+# - LLM_CALL_DEADLINE_SEC: 재시도를 포함한 호출 1건의 기본 마감 시간
+# - LLM_BREAKER_FAILURES, LLM_BREAKER_RESET_SEC: 모델별 연속 실패 N 회면 차단, 일정 시간 뒤 1건만 시험 호출
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_GLOBAL_RPM = int(os.getenv("LLM_GLOBAL_RPM", "0"))
+LLM_GLOBAL_TPM = int(os.getenv("LLM_GLOBAL_TPM", "0"))
+LLM_MODEL_LIMITS = os.getenv("LLM_MODEL_LIMITS", "")
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+LLM_RETRY_BASE_MS = float(os.getenv("LLM_RETRY_BASE_MS", "500"))
+LLM_RETRY_MAX_SEC = float(os.getenv("LLM_RETRY_MAX_SEC", "20"))
+LLM_CALL_DEADLINE_SEC = float(os.getenv("LLM_CALL_DEADLINE_SEC", "120"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_RESET_SEC = float(os.getenv("LLM_BREAKER_RESET_SEC", "30"))
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMGatewayError(Exception):
+    """LLM 게이트웨이에서 호출을 진행할 수 없을 때의 기본 예외."""
+    pass
+
+
+class LLMCircuitOpenError(LLMGatewayError):
+    """모델의 서킷 브레이커가 열려 있어 호출하지 않고 바로 실패."""
+    pass
+
+
+class LLMDeadlineExceededError(LLMGatewayError, TimeoutError):
+    """재시도를 포함한 호출 마감 시간을 넘김."""
+    pass
+
+
+def _parse_model_limits(spec: str) -> Dict[str, tuple]:
+    limits = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        model, values = item.split("=", 1)
+        rpm, _, tpm = values.partition(":")
+        limits[model.strip()] = (int(rpm or 0), int(tpm or 0))
+    return limits
+
+
+class AsyncTokenBucket:
+    """
+    분당 rate 만큼 채워지는 토큰 버킷 (asyncio 용). rate 가 0 이면 제한 없음.
+    한 번에 capacity 보다 많이 요청하면 capacity 만큼만 기다린다 (큰 요청이 영원히 막히지 않도록).
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.tokens = float(rate_per_minute)
+        self.refill_per_sec = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        if not self.capacity:
+            return
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.refill_per_sec)
+
+    def adjust(self, delta: float) -> None:
+        # 실제 사용량이 추정치와 다르면 차이만큼 되돌리거나 더 차감 (음수가 되면 다음 요청이 기다림)
+        if self.capacity:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+
+
+class CircuitBreaker:
+    """연속 실패가 threshold 번이면 열림 -> reset_sec 후 반열림(시험 호출 1건) -> 성공하면 닫힘."""
+
+    def __init__(self, threshold: int, reset_sec: float):
+        self.threshold = threshold
+        self.reset_sec = reset_sec
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_sec:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "open" or (state == "half_open" and self.probing):
+            raise LLMCircuitOpenError("LLM 호출이 일시적으로 차단되었습니다 (연속 실패).")
+        if state == "half_open":
+            self.probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probing = False
+        if self.threshold and (self.failures >= self.threshold or self.opened_at is not None):
+            self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        # 시험 호출이 성공/실패 판정 없이 끝난 경우(취소, 429, 로컬 대기 초과 등) 다음 호출이 다시 시험할 수 있게 한다
+        self.probing = False
+
+
+class LLMGateway:
+    """
+    요약/PDF 분석 등 모든 LLM 호출이 공유하는 비동기 게이트웨이.
+    - AsyncOpenAI 클라이언트 하나를 공유 (HTTP 커넥션 재사용), SDK 자체 재시도는 끄고 여기서 처리
+    - 전체 동시 호출 수 제한 + 전체/모델별 요청·토큰 버킷
+    - 429/5xx/연결 오류는 지수 백오프(full jitter)로 재시도, retry-after 헤더가 있으면 따름
+    - 호출마다 마감 시간(재시도 포함), 모델별 서킷 브레이커
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.client = get_async_openai_client().with_options(max_retries=0)
+            cls.__instance.semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY) if LLM_MAX_CONCURRENCY > 0 else None
+            cls.__instance.global_requests = AsyncTokenBucket(LLM_GLOBAL_RPM)
+            cls.__instance.global_tokens = AsyncTokenBucket(LLM_GLOBAL_TPM)
+            cls.__instance.model_limits = _parse_model_limits(LLM_MODEL_LIMITS)
+            cls.__instance.model_buckets: Dict[str, tuple] = {}
+            cls.__instance.breakers: Dict[str, CircuitBreaker] = {}
+            cls.__instance.counters = dict(
+                calls=0, successes=0, failures=0, retries=0, rejected_open_circuit=0, deadline_exceeded=0,
+                prompt_tokens=0, completion_tokens=0
+            )
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def chat(
+        self,
+        model: str,
+        messages: List[dict],
+        max_tokens: Optional[int] = None,
+        deadline_sec: Optional[float] = None,
+        **kwargs
+    ):
+        """chat.completions.create 와 같은 응답 객체를 반환한다."""
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        estimated = _estimate_tokens(messages, max_tokens)
+
+        async def attempt(timeout: float):
+            return await self.client.chat.completions.create(
+                model=model, messages=messages, timeout=timeout, **kwargs
+            )
+
+        response = await self._call(model, estimated, deadline_sec, attempt)
+        self._settle(model, estimated, response.usage)
+        return response
+
+    async def stream_chat(
+        self,
+        model: str,
+        messages: List[dict],
+        max_tokens: Optional[int] = None,
+        deadline_sec: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator:
+        """
+        stream=True 청크를 그대로 내보낸다. 재시도는 첫 청크를 받기 전까지만 한다
+        (이미 일부를 보낸 뒤에는 다시 시작할 수 없으므로).
+        """
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        estimated = _estimate_tokens(messages, max_tokens)
+
+        async def attempt(timeout: float):
+            stream = await self.client.chat.completions.create(
+                model=model, messages=messages, stream=True, timeout=timeout, **kwargs
+            )
+            iterator = stream.__aiter__()
+            try:
+                first = await iterator.__anext__()
+            except StopAsyncIteration:
+                first = None
+            return stream, iterator, first
+
+        # 스트림이 끝날 때까지 동시 호출 슬롯을 유지한다
+        stream, iterator, chunk = await self._call(model, estimated, deadline_sec, attempt, keep_slot=True)
+        usage = None
+        try:
+            while chunk is not None:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                yield chunk
+                try:
+                    chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+        finally:
+            self._release()
+            await stream.close()
+            self._settle(model, estimated, usage)
+
+    def stats(self) -> dict:
+        return dict(
+            **self.counters,
+            in_flight=(LLM_MAX_CONCURRENCY - self.semaphore._value) if self.semaphore else None,
+            max_concurrency=LLM_MAX_CONCURRENCY or None,
+            breakers={model: breaker.state for model, breaker in self.breakers.items()},
+        )
+
+    async def _call(self, model: str, estimated: int, deadline_sec: Optional[float], attempt, keep_slot: bool = False):
+        from openai import APIConnectionError, APIStatusError, APITimeoutError
+
+        deadline = time.monotonic() + (deadline_sec or LLM_CALL_DEADLINE_SEC)
+        breaker = self.breakers.setdefault(model, CircuitBreaker(LLM_BREAKER_FAILURES, LLM_BREAKER_RESET_SEC))
+        self.counters["calls"] += 1
+
+        for retry in range(LLM_MAX_RETRIES + 1):
+            try:
+                breaker.before_call()
+            except LLMCircuitOpenError:
+                self.counters["rejected_open_circuit"] += 1
+                raise
+
+            try:
+                try:
+                    await asyncio.wait_for(self._admit(model, estimated), timeout=_remaining(deadline))
+                except (asyncio.TimeoutError, LLMDeadlineExceededError) as e:
+                    # 동시 호출 슬롯/토큰 버킷 대기(로컬 부하)로 넘긴 마감 시간은 모델 장애가 아니므로 브레이커에 반영하지 않는다
+                    self.counters["deadline_exceeded"] += 1
+                    raise LLMDeadlineExceededError("LLM 호출 마감 시간을 넘겼습니다.") from e
+
+                try:
+                    try:
+                        result = await attempt(_remaining(deadline))
+                    except BaseException:
+                        self._release()
+                        raise
+                    if not keep_slot:
+                        self._release()
+                except LLMDeadlineExceededError:
+                    # 슬롯을 얻었을 때 이미 마감 시간이 지남 (로컬 대기) - 브레이커에 반영하지 않는다
+                    self.counters["deadline_exceeded"] += 1
+                    raise
+                except asyncio.TimeoutError as e:
+                    breaker.record_failure()
+                    self.counters["deadline_exceeded"] += 1
+                    raise LLMDeadlineExceededError("LLM 호출 마감 시간을 넘겼습니다.") from e
+                except (APIConnectionError, APITimeoutError, APIStatusError) as e:
+                    status = getattr(e, "status_code", None)
+                    retryable = status is None or status in RETRYABLE_STATUS
+                    # 429 는 요청이 거절된 것이지 모델 장애가 아니므로 브레이커에 반영하지 않는다
+                    if status != 429:
+                        breaker.record_failure()
+                    if not retryable or retry >= LLM_MAX_RETRIES:
+                        self.counters["failures"] += 1
+                        raise
+                    delay = _backoff(retry, e)
+                    if time.monotonic() + delay >= deadline:
+                        self.counters["deadline_exceeded"] += 1
+                        raise LLMDeadlineExceededError("재시도 대기 중 LLM 호출 마감 시간을 넘깁니다.") from e
+                    self.counters["retries"] += 1
+                    await asyncio.sleep(delay)
+                    continue
+
+                breaker.record_success()
+                self.counters["successes"] += 1
+                return result
+            finally:
+                # 취소/예상 밖의 예외로 끝난 시험 호출이 반열림 상태를 영원히 붙잡지 않도록
+                breaker.release_probe()
+
+    async def _admit(self, model: str, estimated: int) -> None:
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        try:
+            requests, tokens = self._model_buckets(model)
+            await self.global_requests.acquire(1)
+            await requests.acquire(1)
+            await self.global_tokens.acquire(estimated)
+            await tokens.acquire(estimated)
+        except BaseException:
+            self._release()
+            raise
+
+    def _release(self) -> None:
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def _model_buckets(self, model: str) -> tuple:
+        buckets = self.model_buckets.get(model)
+        if buckets is None:
+            rpm, tpm = self.model_limits.get(model, (0, 0))
+            buckets = self.model_buckets[model] = (AsyncTokenBucket(rpm), AsyncTokenBucket(tpm))
+        return buckets
+
+    def _settle(self, model: str, estimated: int, usage) -> None:
+        # 토큰 버킷을 실제 사용량 기준으로 보정하고 사용량 집계
+        if usage is None:
+            return
+        actual = usage.prompt_tokens + usage.completion_tokens
+        self.counters["prompt_tokens"] += usage.prompt_tokens
+        self.counters["completion_tokens"] += usage.completion_tokens
+        self.global_tokens.adjust(actual - estimated)
+        self._model_buckets(model)[1].adjust(actual - estimated)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    잠시 뒤 다시 시도하면 성공할 수 있는 오류인지 (연결 오류/타임아웃/429/5xx).
+    서킷 열림, 마감 시간 초과, 그 밖의 4xx(컨텍스트 길이 초과 등)는 다시 시도해도 같은 결과이므로 False.
+    """
+    if isinstance(error, LLMGatewayError):
+        return False
+    from openai import APIConnectionError, APIStatusError
+
+    if isinstance(error, APIStatusError):
+        return error.status_code in RETRYABLE_STATUS
+    return isinstance(error, APIConnectionError)  # APITimeoutError 포함
+
+
+def _estimate_tokens(messages: List[dict], max_tokens: Optional[int]) -> int:
+    # 한국어 기준 대략 2글자 = 1토큰으로 추정 (응답 후 실제 사용량으로 보정)
+    prompt_chars = sum(len(message.get("content") or "") for message in messages)
+    return prompt_chars // 2 + (max_tokens or 500)
+
+
+def _remaining(deadline: float) -> float:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise LLMDeadlineExceededError("LLM 호출 마감 시간을 넘겼습니다.")
+    return remaining
+
+
+def _backoff(retry: int, error: Exception) -> float:
+    # 서버가 알려준 retry-after 가 있으면 우선 사용, 없으면 지수 백오프 + full jitter
+    response = getattr(error, "response", None)
+    headers = response.headers if response is not None else {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return random.uniform(0, min(LLM_RETRY_MAX_SEC, LLM_RETRY_BASE_MS / 1000 * (2 ** retry)))
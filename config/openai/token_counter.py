@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+# 프롬프트/청크 크기를 모델 토큰 단위로 계산
+# tiktoken 이 설치되어 있으면 실제 토크나이저를, 없으면 한국어 기준 대략 2글자 = 1토큰 추정치를 사용
+DEFAULT_MODEL = "gpt-4.1"
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return (len(text) + 1) // 2
+    return len(encoding.encode(text, disallowed_special=()))
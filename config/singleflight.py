@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlightCancelledError(Exception):
+    """같은 키를 계산하던 요청이 취소되어 결과를 넘겨주지 못함 (다시 시도하면 되는 오류)."""
+    pass
+
+
+class SingleFlight:
+    """
+    같은 키의 비동기 계산을 프로세스 안에서 한 번만 수행한다 (요약 캐시, PDF 단계 캐시, 청크 인덱스 등에서 공유).
+    - 먼저 온 요청(lead)이 계산하고, 같은 키로 들어온 요청은 그 결과를 기다린다 (join)
+    - lead 가 취소되면 기다리던 요청 중 하나가 이어서 계산을 맡는다 (취소가 다른 요청으로 번지지 않음)
+    - lead 의 일반 예외는 기다리던 요청에도 그대로 전달된다
+    """
+
+    def __init__(self):
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self.inflight)
+
+    def join(self, key: str) -> Optional[asyncio.Future]:
+        return self.inflight.get(key)
+
+    def lead(self, key: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        return future
+
+    def complete(self, key: str, result: Any = None, error: Optional[BaseException] = None) -> None:
+        future = self.inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is None:
+            future.set_result(result)
+            return
+        if not isinstance(error, Exception):
+            # 취소(CancelledError)/GeneratorExit 는 기다리던 요청의 실패가 아니므로 다시 시도할 수 있는 오류로 바꿔 전달
+            error = SingleFlightCancelledError(f"in-flight computation for {key[:16]} was cancelled")
+        future.set_exception(error)
+        future.exception()  # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록
+
+    @staticmethod
+    async def wait(future: asyncio.Future) -> Any:
+        # 한 요청이 취소되어도 공유 Future 는 취소되지 않도록 shield
+        return await asyncio.shield(future)
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """(결과, 다른 요청의 계산에 합류했는지) 를 반환."""
+        while True:
+            future = self.join(key)
+            if future is None:
+                break
+            try:
+                return await self.wait(future), True
+            except SingleFlightCancelledError:
+                # lead 가 취소됨 - 먼저 깨어난 요청이 새 lead 가 되고 나머지는 거기에 합류
+                continue
+
+        self.lead(key)
+        try:
+            result = await compute()
+        except BaseException as e:
+            self.complete(key, error=e)
+            raise
+        self.complete(key, result=result)
+        return result, False
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry, PRELOAD_MODELS
+from ai_analyzer.infrastructure.registry.process_memory import read_memory_usage
+
+health_router = APIRouter(tags=["health"])
+
+
+@health_router.get("/live")
+async def live():
+    # 프로세스가 살아서 이벤트 루프가 응답하는지만 확인
+    return {"status": "ok"}
+
+
+@health_router.get("/ready")
+async def ready(request: Request):
+    """
+    PRELOAD_MODELS 에 지정된 모델이 모두 로드(+워밍업)되었으면 200, 아니면 503.
+    모델별 로드 상태와 로드/워밍업 시간, 로드/재로드/언로드 횟수를 함께 반환한다.
+    (유휴/메모리 예산으로 언로드된 모델은 요청 시 다시 로드되므로 ready 로 본다)
+    """
+    # ai 역할이 꺼진 워커는 app.state.required_models 가 빈 목록 (모델 없이 ready)
+    required_models = getattr(request.app.state, "required_models", PRELOAD_MODELS)
+    registry = ModelRegistry.getInstance()
+    is_ready = registry.is_ready(required_models)
+
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "not_ready",
+            "required_models": required_models,
+            "models": registry.status(),
+            "memory": registry.memory(),
+        }
+    )
+
+
+@health_router.get("/memory")
+async def memory():
+    # 요청을 처리한 워커 프로세스의 메모리 사용량 (uss_mb: 이 워커만 가진 메모리)
+    return read_memory_usage()
@@ -1,79 +1,219 @@
 from urllib.parse import urlparse
 
-import boto3
-from botocore.exceptions import NoCredentialsError
 from fastapi import APIRouter, Form, HTTPException
 from fastapi.params import Depends
 from fastapi.responses import JSONResponse
-from openai import OpenAI
-from pypdf import PdfReader
 import asyncio
-import io
-import re
-from typing import List
+import os
+from typing import AsyncIterable, AsyncIterator, List, Tuple, Union
 
 from account.adapter.input.web.session_helper import get_current_user
+from ai_analyzer.infrastructure.executor.inference_executor import InferenceQueueFullError
+from config.openai.llm_gateway import LLMGateway, is_transient_error
+from config.openai.token_counter import count_tokens
+from pdf_analyzer.infrastucture.cache.stage_cache import StageCache, content_hash
+from pdf_analyzer.infrastucture.chunking.token_chunker import TokenChunker, iter_token_chunks
+from pdf_analyzer.infrastucture.extraction.docx_text_extractor import iter_docx_paragraphs
+from pdf_analyzer.infrastucture.extraction.pdf_text_extractor import PDFExtractionError, PDFTextExtractor
+from pdf_analyzer.infrastucture.pipeline.stage_dag import StageDAG, record_llm_usage
+from pdf_analyzer.infrastucture.pipeline.streaming import aclose, aiter_items, bounded
+from pdf_analyzer.infrastucture.retrieval.chunk_index import ChunkIndexStore, embedding_chunker
 
 pdf_analyzer_router = APIRouter(tags=["pdf-analyzer"])
 
-client = OpenAI()
-
-# PDF 텍스트 추출
-def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
+# 섹션 요약(map 단계) 동시 실행 수 / 실패한 청크만 다시 시도하는 횟수
+PDF_MAP_CONCURRENCY = int(os.getenv("PDF_MAP_CONCURRENCY", "8"))
+PDF_CHUNK_RETRIES = int(os.getenv("PDF_CHUNK_RETRIES", "2"))
+# 한 번의 통합(reduce) 프롬프트에 넣을 요약문 토큰 상한 - 넘으면 여러 단계로 나눠 통합 (tree reduce)
+PDF_REDUCE_TOKEN_BUDGET = int(os.getenv("PDF_REDUCE_TOKEN_BUDGET", "6000"))
+SECTION_SUMMARY_MAX_TOKENS = 400
+# 추출 -> 청킹 -> 섹션 요약 사이 큐 크기 (뒤 단계가 밀리면 앞 단계가 기다림)
+PDF_PIPELINE_QUEUE_SIZE = int(os.getenv("PDF_PIPELINE_QUEUE_SIZE", "32"))
+
+# 단계 캐시 버전 - 프롬프트나 처리 방식을 바꾸면 해당 단계 버전을 올려 기존 캐시를 무효화
+STAGE_VERSIONS = dict(text="v1", chunk_summary="v1", summary="v1", opinions="v1", rag_index="v2")
+
+# QA 방식 - summary: 전체 요약을 근거로 답변 / rag: 질문과 가까운 원문 청크(top-k)를 근거로 답변
+QA_MODES = ("summary", "rag")
+# RAG 인덱스 청크 크기/겹침 (MiniLM 토크나이저 기준) - 모델 입력 상한(max_seq_length)을 넘지 않도록 자동으로 줄인다
+PDF_RAG_CHUNK_TOKENS = int(os.getenv("PDF_RAG_CHUNK_TOKENS", "128"))
+PDF_RAG_CHUNK_OVERLAP_TOKENS = int(os.getenv("PDF_RAG_CHUNK_OVERLAP_TOKENS", "16"))
+PDF_RAG_TOP_K = int(os.getenv("PDF_RAG_TOP_K", "6"))
+
+# boto3 / pypdf 는 무거우므로 실제로 쓰는 함수 안에서 import (다른 라우터만 쓰는 워커의 기동 시간 단축)
+
+# 문서 종류 판별 (파일 앞부분 기준, 판별이 안 되면 URL 확장자)
+def detect_document_type(content: bytes, file_url: str = "") -> str:
+    if content[:5] == b"%PDF-":
+        return "pdf"
+    if content[:4] == b"PK\x03\x04":
+        return "docx"
+    extension = os.path.splitext(urlparse(file_url).path)[1].lower()
+    if extension in (".pdf", ".docx"):
+        return extension[1:]
+    raise HTTPException(400, "Unsupported file type (PDF, DOCX only)")
+
+# 문서 텍스트 스트림 - PDF 는 페이지 단위(페이지 구간별 프로세스 풀 병렬 추출), DOCX 는 문단 단위
+async def iter_document_paragraphs(content: bytes, document_type: str) -> AsyncIterator[str]:
+    if document_type == "docx":
+        source = iter_docx_paragraphs(content)
+    else:
+        source = PDFTextExtractor.getInstance().iter_pages(content)
     try:
-        reader = PdfReader(io.BytesIO(file_bytes))
-        texts = []
-        for page in reader.pages:
-            t = page.extract_text() or ""
-            t = re.sub(r'\s+', ' ', t)                # 공백 정리
-            t = re.sub(r'\d+\s*$', '', t)            # 페이지 번호 제거
-            if t.strip():
-                texts.append(t.strip())
-        return "\n".join(texts)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
-
-# 텍스트 청킹
-def chunk_text(text: str, chunk_size=3500, overlap=300) -> List[str]:
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    chunks, cur = [], ""
-    for p in paragraphs:
-        if len(cur) + len(p) <= chunk_size:
-            cur += " " + p
-        else:
-            chunks.append(cur.strip())
-            cur = p
-    if cur:
-        chunks.append(cur.strip())
-    return chunks
-
-# GPT 호출 래퍼
+        async for item in source:
+            paragraph = item if document_type == "docx" else item[1]
+            if paragraph:
+                yield paragraph
+    except PDFExtractionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        await aclose(source)
+
+# 텍스트 청킹 (Kiwi 문장 단위, 모델 토큰 예산에 맞춰 채우고 앞 청크 끝 문장을 겹쳐 넣음)
+def chunk_text(text: str, max_tokens: int = None, overlap_tokens: int = None) -> List[str]:
+    return TokenChunker(max_tokens, overlap_tokens).chunk(p for p in text.split("\n") if p.strip())
+
+# GPT 호출 래퍼 (공용 LLM 게이트웨이: 동시성/레이트 리밋/재시도/마감 시간/서킷 브레이커)
 async def ask_gpt(prompt: str, max_tokens=500):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda:
-        client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0
-        ).choices[0].message.content
+    response = await LLMGateway.getInstance().chat(
+        model="gpt-4.1",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=0
     )
-
-# 문서 요약 에이전트 (섹션 요약 후 전체 요약)
-async def summarize_document(chunks: List[str]) -> str:
-    partial_summaries = []
-
-    for idx, chunk in enumerate(chunks):
-        # 1. 섹션 요약 프롬프트 수정
-        prompt = f"""
+    record_llm_usage(response.usage)  # 단계별 토큰 사용량 집계
+    return response.choices[0].message.content
+
+# 단일 호출 재시도 래퍼 (일시적인 오류로 실패하면 이 호출만 다시 시도)
+# 게이트웨이가 이미 재시도한 뒤이므로, 서킷 열림/마감 초과/4xx 처럼 다시 해도 같은 결과인 오류는 바로 실패
+async def ask_gpt_with_retry(prompt: str, max_tokens: int, semaphore: asyncio.Semaphore, label: str) -> str:
+    for attempt in range(PDF_CHUNK_RETRIES + 1):
+        try:
+            async with semaphore:
+                return await ask_gpt(prompt, max_tokens=max_tokens)
+        except Exception as e:
+            if attempt == PDF_CHUNK_RETRIES or not is_transient_error(e):
+                raise
+            print(f"[pdf_analyzer] {label} 실패, 재시도 {attempt + 1}/{PDF_CHUNK_RETRIES}: {type(e).__name__}: {e}")
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+# 섹션 요약
+async def summarize_chunk(idx: int, chunk: str, semaphore: asyncio.Semaphore) -> str:
+    # 1. 섹션 요약 프롬프트 수정
+    prompt = f"""
 다음은 뉴스 기사의 일부 문단이다. 이 문단의 **핵심 사실(육하원칙)**과 **주요 주장**을 간결하게 요약해라.
 
 문단({idx+1}):
 {chunk}
 """
-        summary = await ask_gpt(prompt, max_tokens=400)
-        partial_summaries.append(summary)
+    # 같은 내용의 청크는 문서가 달라도 요약을 재사용 (청크 내용 해시 기준)
+    return await StageCache.getInstance().get_or_compute(
+        "chunk_summary", STAGE_VERSIONS["chunk_summary"], content_hash(chunk),
+        lambda: ask_gpt_with_retry(prompt, SECTION_SUMMARY_MAX_TOKENS, semaphore, f"섹션 {idx + 1} 요약")
+    )
 
+# 중간 통합 요약 (연속된 섹션 요약 묶음 -> 요약 하나)
+async def summarize_group(level: int, idx: int, summaries: List[str], semaphore: asyncio.Semaphore) -> str:
+    merged = "\n".join(summaries)
+    prompt = f"""
+다음은 문서의 연속된 여러 섹션 요약이다. 핵심 사실(육하원칙)과 주요 주장을 빠뜨리지 말고, 중복을 없애 하나의 요약으로 통합해라.
+
+섹션 요약:
+{merged}
+"""
+    return await ask_gpt_with_retry(prompt, SECTION_SUMMARY_MAX_TOKENS, semaphore, f"통합 {level}-{idx + 1}")
+
+# 순서를 유지하면서 토큰 예산 안에 들어가도록 요약문을 묶는다
+def pack_by_token_budget(summaries: List[str], budget: int) -> List[List[str]]:
+    groups, cur, cur_tokens = [], [], 0
+    for summary in summaries:
+        tokens = count_tokens(summary) + 1
+        if cur and cur_tokens + tokens > budget:
+            groups.append(cur)
+            cur, cur_tokens = [], 0
+        cur.append(summary)
+        cur_tokens += tokens
+    if cur:
+        groups.append(cur)
+    return groups
+
+# 요약문 합계가 예산 안에 들어올 때까지 단계별로 통합 (같은 단계의 묶음은 병렬 실행)
+async def reduce_summaries(summaries: List[str], semaphore: asyncio.Semaphore, budget: int = None) -> List[str]:
+    # 한 묶음에 요약문이 최소 2개는 들어가야 단계마다 개수가 줄어든다
+    budget = max(budget or PDF_REDUCE_TOKEN_BUDGET, 3 * SECTION_SUMMARY_MAX_TOKENS)
+    level = 0
+    while len(summaries) > 1 and count_tokens("\n".join(summaries)) > budget:
+        level += 1
+        groups = pack_by_token_budget(summaries, budget)
+        if len(groups) == len(summaries):
+            # 토큰 추정치가 실제보다 커서 한 묶음에 하나씩만 들어가면 개수가 줄지 않아 끝나지 않으므로 두 개씩 묶는다
+            groups = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+        summaries = list(await asyncio.gather(
+            *[summarize_group(level, idx, group, semaphore) for idx, group in enumerate(groups)]
+        ))
+        print(f"[pdf_analyzer] reduce 단계 {level}: {sum(len(g) for g in groups)}개 -> {len(summaries)}개")
+    return summaries
+
+# 섹션 요약(map) - 청크가 들어오는 대로 요약을 시작한다 (리스트 또는 스트림)
+async def map_chunks(chunks: Union[List[str], AsyncIterable[str]], semaphore: asyncio.Semaphore,
+                     max_pending: int) -> Tuple[List[str], list]:
+    collected, tasks = [], []
+    # 끝나지 않은 섹션 요약이 max_pending 개면 다음 청크를 당겨오지 않는다 (backpressure)
+    pending = asyncio.Semaphore(max_pending)
+
+    async def run(idx: int, chunk: str) -> str:
+        try:
+            return await summarize_chunk(idx, chunk, semaphore)
+        finally:
+            pending.release()
+
+    stream = aiter_items(chunks)
+    try:
+        async for chunk in stream:
+            await pending.acquire()
+            tasks.append(asyncio.create_task(run(len(collected), chunk)))
+            collected.append(chunk)
+        # 결과 순서는 청크 순서 유지
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    except BaseException:
+        # 추출 실패 등으로 스트림이 끊기면 진행 중인 섹션 요약도 취소
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        await aclose(stream)
+    return collected, results
+
+# 문서 요약 에이전트 (섹션 요약을 동시에 돌린 뒤 단계별 통합, 마지막에 전체 요약)
+async def summarize_document(chunks: Union[List[str], AsyncIterable[str]], concurrency: int = None,
+                             reduce_budget: int = None) -> str:
+    cache = StageCache.getInstance()
+    budget = reduce_budget or PDF_REDUCE_TOKEN_BUDGET
+    if isinstance(chunks, list):
+        # 청크를 미리 알면 섹션 요약 전에 전체 요약 캐시부터 확인 (스트림이면 다 받은 뒤 키가 정해짐)
+        cached = await cache.get("summary", STAGE_VERSIONS["summary"], content_hash(budget, *chunks))
+        if cached is not None:
+            return cached
+
+    # 청크 수 / 동시 실행 수 만큼의 왕복 시간만 걸리도록 섹션 요약을 병렬로 실행
+    concurrency = concurrency or PDF_MAP_CONCURRENCY
+    semaphore = asyncio.Semaphore(concurrency)
+    chunks, results = await map_chunks(chunks, semaphore, max_pending=2 * concurrency)
+    if not chunks:
+        raise HTTPException(400, "No text extracted")
+    summary_key = content_hash(budget, *chunks)
+
+    partial_summaries = [r for r in results if not isinstance(r, BaseException)]
+    failed = [idx + 1 for idx, r in enumerate(results) if isinstance(r, BaseException)]
+    if not partial_summaries:
+        raise results[0]
+    if failed:
+        # 일부 섹션만 실패하면 나머지로 전체 요약을 계속 진행
+        print(f"[pdf_analyzer] 섹션 요약 {len(failed)}/{len(chunks)}개 실패 (제외하고 진행): {failed}")
+
+    # 전체 요약 프롬프트가 예산을 넘지 않도록 필요한 만큼만 tree reduce
+    partial_summaries = await reduce_summaries(partial_summaries, semaphore, reduce_budget)
     merged = "\n".join(partial_summaries)
 
     # 2. 전체 요약 프롬프트 수정
@@ -87,8 +227,11 @@ async def summarize_document(chunks: List[str]) -> str:
 1.  **제목 (Headline):** 뉴스 기사의 핵심을 담은 한 문장 제목.
 2.  **본문 (Summary):** 누가, 언제, 어디서, 무엇을, 왜, 어떻게 했는지(육하원칙)를 포함하는 2~3문단의 통합 요약.
 """
-    final_summary = await ask_gpt(final_prompt, max_tokens=500)
-    return final_summary.strip()
+    final_summary = (await ask_gpt(final_prompt, max_tokens=500)).strip()
+    if not failed:
+        # 일부 섹션이 빠진 요약은 캐시하지 않는다 (다음 요청에서 다시 시도)
+        await cache.set("summary", STAGE_VERSIONS["summary"], summary_key, final_summary)
+    return final_summary
 
 # QA 에이전트 (프롬프트 규칙 강화)
 async def qa_on_document(summary: str, question: str) -> str:
@@ -108,6 +251,45 @@ async def qa_on_document(summary: str, question: str) -> str:
 """
     return (await ask_gpt(prompt, max_tokens=300)).strip()
 
+# RAG QA 에이전트 (문서 청크 인덱스에서 질문과 가까운 청크만 골라 답변)
+# 인덱스는 문서당 한 번 만들어 디스크에 두므로, 같은 문서의 다음 질문은 질문 임베딩 1회 + 작은 LLM 호출 1회
+async def qa_with_retrieval(content: bytes, text: str, question: str, top_k: int = None) -> dict:
+    from ai_analyzer.adapter.output.ai.keybert_keyword_adapter import KeybertKeywordAdapter
+
+    store = ChunkIndexStore.getInstance()
+    # 임베딩 모델이나 청크 설정이 바뀌면 다른 인덱스가 되도록 키에 포함
+    index_key = content_hash(content, STAGE_VERSIONS["rag_index"], KeybertKeywordAdapter.MODEL_NAME,
+                             PDF_RAG_CHUNK_TOKENS, PDF_RAG_CHUNK_OVERLAP_TOKENS)
+
+    def split() -> List[str]:
+        chunker = embedding_chunker(PDF_RAG_CHUNK_TOKENS, PDF_RAG_CHUNK_OVERLAP_TOKENS)
+        return chunker.chunk(p for p in text.split("\n") if p.strip())
+
+    async def build_chunks() -> List[str]:
+        return await asyncio.to_thread(split)
+
+    index = await store.get_or_build(index_key, build_chunks)
+    hits = await store.search(index, question, top_k or PDF_RAG_TOP_K)
+    # 발췌는 문서 순서대로 보여 준다
+    hits = sorted(hits, key=lambda hit: hit[0])
+    excerpts = "\n\n".join(f"[{n}] {chunk}" for n, (_, _, chunk) in enumerate(hits, start=1))
+    prompt = f"""
+다음은 문서에서 질문과 관련된 부분을 발췌한 것이다. 이 발췌 내의 정보만 사용하여 질문에 답해라.
+
+발췌:
+{excerpts}
+
+질문:
+{question}
+
+규칙:
+- **정보 출처 명확화:** 답의 근거가 된 발췌 번호를 [1] 처럼 함께 적어라.
+- **추론 금지:** 발췌에 없는 내용은 절대 추론하여 답하지 말 것.
+- **답변 불가 시:** 없으면 "문서에서 해당 정보를 찾을 수 없습니다."라고 답해라.
+"""
+    answer = (await ask_gpt(prompt, max_tokens=300)).strip()
+    return dict(answer=answer, sources=[dict(chunk=idx, score=round(score, 4)) for idx, score, _ in hits])
+
 # 감성 분석 + 키포인트 에이전트 (뉴스에 맞게 키포인트 정의 변경)
 async def analyze_opinions(summary: str) -> dict:
     prompt = f"""
@@ -136,10 +318,98 @@ async def analyze_opinions(summary: str) -> dict:
     except:
         return {"sentiment": "unknown", "key_actors": [], "key_issues": []}
 
+# 감성 분석 (요약 내용 해시 기준 캐시)
+async def analyze_opinions_cached(summary: str) -> dict:
+    cache = StageCache.getInstance()
+    summary_hash = content_hash(summary)
+    analysis = await cache.get("opinions", STAGE_VERSIONS["opinions"], summary_hash)
+    if analysis is None:
+        analysis = await analyze_opinions(summary)
+        if isinstance(analysis, dict) and analysis.get("sentiment") != "unknown":  # JSON 파싱 실패 결과는 캐시하지 않음
+            await cache.set("opinions", STAGE_VERSIONS["opinions"], summary_hash, analysis)
+    return analysis
+
+# 추출 -> 청킹 -> 섹션 요약 스트리밍 파이프라인
+# 페이지(문단)가 추출되는 대로 청크를 만들고 바로 섹션 요약을 시작하므로, 첫 LLM 호출 시점이 문서 크기와 무관하다
+async def extract_and_summarize(content: bytes, document_type: str) -> dict:
+    cache = StageCache.getInstance()
+    document_hash = content_hash(content)
+
+    # 같은 문서(내용 해시)면 추출 결과와 요약을 캐시에서 읽는다
+    text = await cache.get("text", STAGE_VERSIONS["text"], document_hash)
+    if text is not None:
+        # 문서 전체의 문장 분리/토큰 세기(첫 호출 시 Kiwi 로드 포함)는 CPU 작업이므로 이벤트 루프 밖에서
+        chunks = await asyncio.to_thread(chunk_text, text)
+        if not chunks:
+            raise HTTPException(400, "No text extracted")
+        return dict(text=text, summary=await summarize_document(chunks))
+
+    paragraphs = []
+
+    async def collect() -> AsyncIterator[str]:
+        source = iter_document_paragraphs(content, document_type)
+        try:
+            async for paragraph in source:
+                paragraphs.append(paragraph)
+                yield paragraph
+        finally:
+            await aclose(source)
+
+    chunks = bounded(iter_token_chunks(bounded(collect(), PDF_PIPELINE_QUEUE_SIZE)), PDF_PIPELINE_QUEUE_SIZE)
+    summary = await summarize_document(chunks)
+    text = "\n".join(paragraphs)
+    await cache.set("text", STAGE_VERSIONS["text"], document_hash, text)
+    return dict(text=text, summary=summary)
+
+# 문서 분석 파이프라인 (추출/청킹/요약 스트리밍 -> QA / 감성 분석)
+# 단계 DAG 로 실행하므로 요약이 끝나면 QA 와 감성 분석은 동시에 돈다. 단계를 추가할 때는 실제 의존 단계만 deps 로 준다
+def build_analysis_dag(content: bytes, question: str, document_type: str = "pdf",
+                       qa_mode: str = "summary") -> StageDAG:
+    async def document(results: dict) -> dict:
+        return await extract_and_summarize(content, document_type)
+
+    async def qa(results: dict) -> str:
+        return await qa_on_document(results["document"]["summary"], question)
+
+    async def rag_qa(results: dict) -> dict:
+        return await qa_with_retrieval(content, results["document"]["text"], question)
+
+    async def opinions(results: dict) -> dict:
+        return await analyze_opinions_cached(results["document"]["summary"])
+
+    return (
+        StageDAG()
+        .add("document", document)
+        .add("qa", rag_qa if qa_mode == "rag" else qa, deps=("document",))
+        .add("opinions", opinions, deps=("document",))
+    )
+
+async def analyze_pdf_bytes(content: bytes, question: str, include_timings: bool = False,
+                            document_type: str = None, qa_mode: str = "summary") -> dict:
+    if qa_mode not in QA_MODES:
+        raise HTTPException(400, f"Unsupported qa_mode: {qa_mode} ({', '.join(QA_MODES)})")
+    document_type = document_type or detect_document_type(content)
+    results, timings = await build_analysis_dag(content, question, document_type, qa_mode).run()
+    response = {
+        "parsed_text": results["document"]["text"],
+        "summary": results["document"]["summary"],
+        "answer": results["qa"]["answer"] if qa_mode == "rag" else results["qa"],
+        "analysis": results["opinions"]
+    }
+    if qa_mode == "rag":
+        # 답변 근거 청크 번호와 유사도
+        response["sources"] = results["qa"]["sources"]
+    if include_timings:
+        # 단계별 시작 시점/소요 시간(ms)과 LLM 호출 수/토큰 사용량
+        response["timings"] = timings
+    return response
+
 @pdf_analyzer_router.post("/analyze")
 async def analyze_document(
         file_url: str = Form(...),
         question: str = Form(...),
+        timings: bool = Form(False),
+        qa_mode: str = Form("summary"),
         user_id: int = Depends(get_current_user)
 ):
     try:
@@ -147,34 +417,25 @@ async def analyze_document(
         if not content:
             raise HTTPException(400, "Empty file upload")
 
-        text = extract_text_from_pdf_clean(content)
-        if not text:
-            raise HTTPException(400, "No text extracted")
-
-        chunks = chunk_text(text)
-        if not chunks:
-            raise HTTPException(500, "Chunking failed")
-
-        # 1. 요약
-        summary = await summarize_document(chunks)
-
-        # 2. QA
-        answer = await qa_on_document(summary, question)
-
-        # 3. 감성 분석 + 키포인트
-        analysis = await analyze_opinions(summary)
-
-        return JSONResponse({
-            "parsed_text": text,
-            "summary": summary,
-            "answer": answer,
-            "analysis": analysis
-        })
+        document_type = detect_document_type(content, file_url)
+        return JSONResponse(await analyze_pdf_bytes(content, question, include_timings=timings,
+                                                    document_type=document_type, qa_mode=qa_mode))
 
+    except InferenceQueueFullError:
+        # rag 인덱스/질문 임베딩은 뉴스 분석과 같은 추론 풀을 쓰므로 대기열이 차면 같은 429 로 알린다
+        raise HTTPException(status_code=429, detail="분석 요청이 많아 잠시 후 다시 시도해주세요.",
+                            headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+@pdf_analyzer_router.get("/cache/stats")
+async def stage_cache_stats():
+    return dict(**StageCache.getInstance().stats(), chunk_index=ChunkIndexStore.getInstance().stats())
+
 def download_s3_file(file_url: str) -> bytes:
+    import boto3
+    from botocore.exceptions import NoCredentialsError
+
     parsed = urlparse(file_url)
     bucket_name = parsed.netloc.split('.')[0]
     object_key = parsed.path.lstrip('/')
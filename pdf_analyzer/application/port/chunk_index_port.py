@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, List, Tuple
+
+
+class ChunkIndexPort(ABC):
+    """
+    문서별 청크 임베딩 인덱스 (질문과 가까운 청크 검색용).
+    키는 문서 내용 해시 + 인덱스 설정(임베딩 모델, 청크 크기) - 한 번 만든 인덱스는 같은 문서의 다음 질문에서 재사용한다.
+    """
+
+    @abstractmethod
+    async def get_or_build(self, key: str, build_chunks: Callable[[], Awaitable[List[str]]]):
+        # 인덱스가 있으면 열고, 없으면 build_chunks 로 청크를 받아 임베딩 후 저장 (같은 키 동시 요청은 한 번만 생성)
+        pass
+
+    @abstractmethod
+    async def search(self, index, query: str, top_k: int) -> List[Tuple[int, float, str]]:
+        # (청크 번호, 코사인 유사도, 청크) 를 유사도 순으로
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
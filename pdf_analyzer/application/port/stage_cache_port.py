@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional
+
+
+class StageCachePort(ABC):
+    """
+    PDF 분석 파이프라인 단계별 결과 캐시.
+    키는 (단계 이름, 단계 버전, 입력 내용 해시) - 프롬프트/처리 방식을 바꾸면 단계 버전을 올려 무효화한다.
+    값은 JSON 으로 직렬화 가능한 값(str/dict/list)이어야 한다.
+    """
+
+    @abstractmethod
+    async def get(self, stage: str, version: str, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, stage: str, version: str, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def get_or_compute(self, stage: str, version: str, key: str,
+                             compute: Callable[[], Awaitable[Any]]) -> Any:
+        # 캐시에 있으면 반환, 없으면 compute 결과를 저장 후 반환 (같은 키 동시 요청은 한 번만 계산)
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from config.singleflight import SingleFlight
+from pdf_analyzer.application.port.stage_cache_port import StageCachePort
+
+# 단계 캐시 설정 (환경변수로 조정 가능)
+# redis: TTL 로 만료 / disk: 용량 상한을 넘으면 오래 안 쓴 파일부터 삭제 / none: 캐시 사용 안 함
+PDF_STAGE_CACHE_BACKEND = os.getenv("PDF_STAGE_CACHE_BACKEND", "redis").lower()
+PDF_STAGE_CACHE_TTL_SEC = int(os.getenv("PDF_STAGE_CACHE_TTL_SEC", str(7 * 86400)))
+PDF_STAGE_CACHE_DIR = os.getenv("PDF_STAGE_CACHE_DIR", "/tmp/pdf_stage_cache")
+PDF_STAGE_CACHE_MAX_MB = int(os.getenv("PDF_STAGE_CACHE_MAX_MB", "1024"))
+PDF_STAGE_CACHE_REDIS_PREFIX = "pdf_analyzer:stage:"
+
+
+def content_hash(*parts) -> str:
+    # 단계 입력의 내용 해시 (bytes 는 그대로, 나머지는 문자열로 바꿔 구분자와 함께 해시)
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class RedisStageStore:
+    def __init__(self):
+        from config.redis_config import get_redis
+        self.redis = get_redis()
+
+    def get(self, name: str) -> Optional[str]:
+        return self.redis.get(PDF_STAGE_CACHE_REDIS_PREFIX + name)
+
+    def set(self, name: str, raw: str) -> None:
+        self.redis.set(PDF_STAGE_CACHE_REDIS_PREFIX + name, raw, ex=PDF_STAGE_CACHE_TTL_SEC)
+
+    def delete(self, name: str) -> None:
+        self.redis.delete(PDF_STAGE_CACHE_REDIS_PREFIX + name)
+
+
+class DiskStageStore:
+    """
+    로컬 디스크 저장소. 읽을 때 mtime 을 갱신하고, 전체 크기가 상한을 넘으면
+    mtime 이 오래된 파일부터 상한의 90% 아래가 될 때까지 지운다 (LRU).
+    """
+
+    def __init__(self, root: str = PDF_STAGE_CACHE_DIR, max_bytes: int = PDF_STAGE_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    def get(self, name: str) -> Optional[str]:
+        path = self._path(name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return raw
+
+    def set(self, name: str, raw: str) -> None:
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = raw.encode("utf-8")
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)  # 쓰는 도중의 파일을 다른 요청이 읽지 않도록
+
+        with self.lock:
+            self.total_bytes += len(data)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def delete(self, name: str) -> None:
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+        self.total_bytes = total
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _path(self, name: str) -> str:
+        # name = "<stage>:<version>:<hash>" -> <root>/<stage>/<version>/<hash 앞 2자리>/<hash>.json
+        stage, version, key = name.split(":", 2)
+        return os.path.join(self.root, stage, version, key[:2], f"{key}.json")
+
+
+class StageCache(StageCachePort):
+    """
+    PDF 분석 단계별 결과 캐시 (텍스트 추출, 섹션 요약, 전체 요약, 감성 분석 등).
+    - 같은 문서에 질문만 바꿔 다시 요청하면 앞 단계는 모두 캐시에서 읽는다
+    - 같은 키를 동시에 계산하려는 요청은 하나만 계산하고 나머지는 결과를 기다린다 (프로세스 단위)
+    - 저장소 장애 시에는 캐시 없이 동작한다
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.store = cls._create_store()
+            cls.__instance.flight = SingleFlight()
+            cls.__instance.counters: Dict[str, Dict[str, int]] = {}
+            cls.__instance.counter_lock = threading.Lock()
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    @staticmethod
+    def _create_store():
+        if PDF_STAGE_CACHE_BACKEND == "redis":
+            return RedisStageStore()
+        if PDF_STAGE_CACHE_BACKEND == "disk":
+            return DiskStageStore()
+        if PDF_STAGE_CACHE_BACKEND == "none":
+            return None
+        raise ValueError(f"unknown PDF_STAGE_CACHE_BACKEND: {PDF_STAGE_CACHE_BACKEND}")
+
+    async def get(self, stage: str, version: str, key: str) -> Optional[Any]:
+        if self.store is None:
+            return None
+        try:
+            # redis 클라이언트/파일 IO 는 동기식이므로 이벤트 루프를 막지 않도록 스레드에서 호출
+            raw = await asyncio.to_thread(self.store.get, f"{stage}:{version}:{key}")
+        except Exception as e:
+            print(f"[StageCache] get failed ({stage}): {type(e).__name__}: {e}")
+            self._count(stage, "errors")
+            raw = None
+
+        if raw is None:
+            self._count(stage, "misses")
+            return None
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            # 깨진 값(쓰다 만 파일 등)은 없는 것으로 보고 지운다 (다시 계산해서 덮어씀)
+            print(f"[StageCache] invalid cached value ({stage}), dropping: {e}")
+            self._count(stage, "errors")
+            self._count(stage, "misses")
+            await self._delete(f"{stage}:{version}:{key}")
+            return None
+        self._count(stage, "hits")
+        return value
+
+    async def set(self, stage: str, version: str, key: str, value: Any) -> None:
+        if self.store is None:
+            return
+        try:
+            raw = json.dumps(value, ensure_ascii=False)
+            await asyncio.to_thread(self.store.set, f"{stage}:{version}:{key}", raw)
+        except Exception as e:
+            print(f"[StageCache] set failed ({stage}): {type(e).__name__}: {e}")
+            self._count(stage, "errors")
+
+    async def get_or_compute(self, stage: str, version: str, key: str,
+                             compute: Callable[[], Awaitable[Any]]) -> Any:
+        async def load_or_compute() -> Any:
+            value = await self.get(stage, version, key)
+            if value is None:
+                start = time.perf_counter()
+                value = await compute()
+                self._count(stage, "compute_ms", int((time.perf_counter() - start) * 1000))
+                await self.set(stage, version, key, value)
+            return value
+
+        # 계산하던 요청이 취소되면(예: 다른 문서의 섹션 요약 취소) 기다리던 요청이 이어서 계산한다
+        value, joined = await self.flight.run(f"{stage}:{version}:{key}", load_or_compute)
+        if joined:
+            self._count(stage, "coalesced")
+        return value
+
+    def stats(self) -> dict:
+        with self.counter_lock:
+            stages = {stage: dict(counters) for stage, counters in self.counters.items()}
+        return dict(backend=PDF_STAGE_CACHE_BACKEND, inflight=len(self.flight), stages=stages)
+
+    async def _delete(self, name: str) -> None:
+        try:
+            await asyncio.to_thread(self.store.delete, name)
+        except Exception as e:
+            print(f"[StageCache] delete failed: {type(e).__name__}: {e}")
+
+    def _count(self, stage: str, name: str, amount: int = 1) -> None:
+        with self.counter_lock:
+            counters = self.counters.setdefault(
+                stage, dict(hits=0, misses=0, coalesced=0, errors=0, compute_ms=0)
+            )
+            counters[name] += amount
@@ -0,0 +1,140 @@
+import asyncio
+import math
+import os
+import re
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, List, Tuple
+
+from config.openai.token_counter import count_tokens
+from pdf_analyzer.infrastucture.pipeline.streaming import aclose
+
+# 청크 크기/겹침은 모델 토큰 단위 (환경변수로 조정 가능)
+# 기존 3500 글자 청크와 비슷한 크기가 되도록 기본값을 잡았다 (한국어 대략 2글자 = 1토큰)
+PDF_CHUNK_TOKENS = int(os.getenv("PDF_CHUNK_TOKENS", "1800"))
+PDF_CHUNK_OVERLAP_TOKENS = int(os.getenv("PDF_CHUNK_OVERLAP_TOKENS", "150"))
+
+# Kiwi 를 쓸 수 없을 때의 문장 경계 (문장부호 뒤 공백)
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+_kiwi_unavailable = False
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    한국어 문장 단위로 나눈다. 모델 레지스트리의 Kiwi 를 쓰고 (뉴스 분석과 같은 인스턴스),
+    Kiwi 를 로드할 수 없는 환경이면 문장부호 기준으로 나눈다.
+    """
+    global _kiwi_unavailable
+    if not _kiwi_unavailable:
+        from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+
+        try:
+            kiwi = ModelRegistry.getInstance().get("kiwi")
+        except Exception as e:
+            _kiwi_unavailable = True
+            print(f"[TokenChunker] Kiwi 를 사용할 수 없어 문장부호 기준으로 문장을 나눕니다: {type(e).__name__}: {e}")
+        else:
+            return [sentence.text.strip() for sentence in kiwi.split_into_sents(text) if sentence.text.strip()]
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+class TokenChunker:
+    """
+    문장 단위 토큰 예산 청커.
+    - 문장을 순서대로 max_tokens 에 최대한 가깝게 채워 청크를 만든다
+    - 다음 청크는 이전 청크 끝 문장들(overlap_tokens 이내)로 시작해 경계 문맥을 잇는다
+    - max_tokens 보다 긴 문장은 토큰 예산에 맞게 잘라 넣는다
+    feed() 로 문장을 넣을 때마다 완성된 청크를 돌려주므로 스트리밍 파이프라인에서도 쓸 수 있다.
+    token_counter 를 주면 LLM 토큰 대신 그 기준으로 센다 (예: 임베딩 모델 토크나이저).
+    """
+
+    def __init__(self, max_tokens: int = None, overlap_tokens: int = None,
+                 token_counter: Callable[[str], int] = None):
+        self.max_tokens = max_tokens or PDF_CHUNK_TOKENS
+        self.count_tokens = token_counter or count_tokens
+        self.overlap_tokens = min(overlap_tokens if overlap_tokens is not None else PDF_CHUNK_OVERLAP_TOKENS,
+                                  self.max_tokens // 2)
+        self.sentences: List[Tuple[str, int]] = []
+        self.tokens = 0
+        # 현재 청크에서 앞 청크와 겹치는(overlap) 문장 수 - 새 문장 없이 겹침만으로는 청크를 만들지 않는다
+        self.carried = 0
+
+    def feed(self, sentences: Iterable[str]) -> List[str]:
+        chunks = []
+        for sentence in sentences:
+            tokens = self.count_tokens(sentence) + 1  # 문장 사이 공백 몫
+            if tokens > self.max_tokens:
+                for piece in self._split_long(sentence):
+                    chunks.extend(self._add(piece, self.count_tokens(piece) + 1))
+            else:
+                chunks.extend(self._add(sentence, tokens))
+        return chunks
+
+    def flush(self) -> List[str]:
+        if len(self.sentences) <= self.carried:
+            return []
+        chunk = self._join()
+        self.sentences, self.tokens, self.carried = [], 0, 0
+        return [chunk]
+
+    def chunk(self, paragraphs: Iterable[str]) -> List[str]:
+        chunks = []
+        for paragraph in paragraphs:
+            chunks.extend(self.feed(split_sentences(paragraph)))
+        chunks.extend(self.flush())
+        return chunks
+
+    def _add(self, sentence: str, tokens: int) -> List[str]:
+        chunks = []
+        if self.sentences and self.tokens + tokens > self.max_tokens:
+            if len(self.sentences) > self.carried:
+                chunks.append(self._join())
+            self._start_with_overlap(tokens)
+        self.sentences.append((sentence, tokens))
+        self.tokens += tokens
+        return chunks
+
+    def _start_with_overlap(self, incoming_tokens: int) -> None:
+        # 직전 청크의 끝 문장들을 겹침 예산 안에서 가져온다 (새 문장이 들어갈 자리는 남긴다)
+        carried, carried_tokens = [], 0
+        for sentence, tokens in reversed(self.sentences):
+            if carried_tokens + tokens > self.overlap_tokens or \
+                    carried_tokens + tokens + incoming_tokens > self.max_tokens:
+                break
+            carried.insert(0, (sentence, tokens))
+            carried_tokens += tokens
+        self.sentences, self.tokens, self.carried = carried, carried_tokens, len(carried)
+
+    def _join(self) -> str:
+        return " ".join(sentence for sentence, _ in self.sentences)
+
+    def _split_long(self, sentence: str) -> List[str]:
+        # 토큰 수에 비례해 글자 단위로 나눈 뒤, 그래도 넘치는 조각은 다시 나눈다
+        pieces = max(2, math.ceil((self.count_tokens(sentence) + 1) / self.max_tokens))
+        size = math.ceil(len(sentence) / pieces)
+        result = []
+        for start in range(0, len(sentence), size):
+            piece = sentence[start:start + size].strip()
+            if not piece:
+                continue
+            if self.count_tokens(piece) + 1 > self.max_tokens and len(piece) > 1:
+                result.extend(self._split_long(piece))
+            else:
+                result.append(piece)
+        return result
+
+
+async def iter_token_chunks(paragraphs: AsyncIterable[str], max_tokens: int = None,
+                            overlap_tokens: int = None) -> AsyncIterator[str]:
+    # 문단(페이지)이 들어오는 대로 문장 분리 -> 토큰 예산 청킹, 완성된 청크부터 바로 내보낸다
+    chunker = TokenChunker(max_tokens, overlap_tokens)
+    try:
+        async for paragraph in paragraphs:
+            if not paragraph.strip():
+                continue
+            # Kiwi 문장 분리는 CPU 작업이므로 이벤트 루프 밖에서
+            sentences = await asyncio.to_thread(split_sentences, paragraph)
+            for chunk in chunker.feed(sentences):
+                yield chunk
+    finally:
+        await aclose(paragraphs)
+    for chunk in chunker.flush():
+        yield chunk
@@ -0,0 +1,52 @@
+import asyncio
+import io
+import itertools
+import re
+import zipfile
+from typing import AsyncIterator, Iterator
+from xml.etree import ElementTree
+
+from pdf_analyzer.infrastucture.extraction.pdf_text_extractor import PDFExtractionError
+
+# 문단 정리 규칙 (PDF 와 달리 페이지 번호가 없으므로 공백만 정리)
+_WHITESPACE = re.compile(r"\s+")
+# 스레드에서 한 번에 읽어 오는 문단 수
+DOCX_PARAGRAPH_BATCH = 256
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _iter_paragraphs(file_bytes: bytes) -> Iterator[str]:
+    # python-docx 는 문서 전체를 DOM 으로 올린 뒤에야 문단을 주므로, 본문 XML 을 iterparse 로 앞에서부터 읽는다
+    # (표 안의 문단도 문서 순서대로 나온다)
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive, archive.open("word/document.xml") as xml:
+        for _, element in ElementTree.iterparse(xml, events=("end",)):
+            if element.tag != f"{_W}p":
+                continue
+            parts = []
+            for node in element.iter():
+                if node.tag == f"{_W}t":
+                    parts.append(node.text or "")
+                elif node.tag in (f"{_W}tab", f"{_W}br"):
+                    parts.append(" ")
+            element.clear()
+            yield "".join(parts)
+
+
+async def iter_docx_paragraphs(file_bytes: bytes) -> AsyncIterator[str]:
+    # 파싱은 스레드에서 DOCX_PARAGRAPH_BATCH 개씩 진행하고, 정리된 문단을 순서대로 내보낸다
+    paragraphs = _iter_paragraphs(file_bytes)
+    try:
+        while True:
+            try:
+                batch = await asyncio.to_thread(lambda: list(itertools.islice(paragraphs, DOCX_PARAGRAPH_BATCH)))
+            except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+                raise PDFExtractionError(f"DOCX parsing error: {e}") from e
+            if not batch:
+                break
+            for paragraph in batch:
+                text = _WHITESPACE.sub(" ", paragraph).strip()
+                if text:
+                    yield text
+    finally:
+        paragraphs.close()
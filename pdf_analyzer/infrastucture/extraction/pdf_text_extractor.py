@@ -0,0 +1,201 @@
+import asyncio
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Optional, Tuple
+
+# PDF 텍스트 추출 설정 (환경변수로 조정 가능)
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_EXTRACT_PAGES_PER_TASK = int(os.getenv("PDF_EXTRACT_PAGES_PER_TASK", "16"))
+# 이 페이지 수 미만이면 프로세스 풀 대신 스레드 하나에서 추출 (작은 문서는 프로세스 간 전달 비용이 더 큼)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "32"))
+# 앞에서부터 이 페이지 수까지만 추출 (0 이면 제한 없음)
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "1000"))
+PDF_EXTRACT_TIMEOUT_SEC = float(os.getenv("PDF_EXTRACT_TIMEOUT_SEC", "60"))
+
+# 페이지 정리 규칙 (모듈 로드 시 한 번만 컴파일, 순서대로 적용)
+CLEANING_RULES = [
+    (re.compile(r"\s+"), " "),      # 공백 정리
+    (re.compile(r"\d+\s*$"), ""),   # 페이지 번호 제거
+]
+
+
+class PDFExtractionError(Exception):
+    pass
+
+
+class PDFExtractionTimeoutError(PDFExtractionError, TimeoutError):
+    pass
+
+
+def clean_page_text(text: str) -> str:
+    for pattern, replacement in CLEANING_RULES:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+# 워커 프로세스마다 마지막으로 연 문서를 재사용 (같은 문서의 다음 페이지 구간에서 xref 를 다시 파싱하지 않도록)
+_worker_reader = (None, None)
+
+
+def _open_reader(doc_id: str, path: str):
+    global _worker_reader
+    if _worker_reader[0] != doc_id:
+        from pypdf import PdfReader
+        _worker_reader = (doc_id, PdfReader(path))
+    return _worker_reader[1]
+
+
+def _release_reader(doc_id: str) -> None:
+    # 스레드 모드에서는 서버 프로세스가 문서를 들고 있게 되므로 추출이 끝나면 놓아 준다
+    global _worker_reader
+    if _worker_reader[0] == doc_id:
+        _worker_reader = (None, None)
+
+
+def _extract_range(doc_id: str, path: str, start: int, end: int, deadline: float) -> Tuple[List[Tuple[int, str]], bool]:
+    """
+    [start, end) 페이지를 추출해 (페이지 번호, 정리된 텍스트) 목록과 마감 시간 초과 여부를 반환.
+    프로세스 풀 워커에서 실행된다 (deadline 은 time.time() 기준이라 프로세스 간에 그대로 쓸 수 있음).
+    """
+    reader = _open_reader(doc_id, path)
+    pages = []
+    for page_no in range(start, end):
+        if time.time() > deadline:
+            return pages, True
+        pages.append((page_no, clean_page_text(reader.pages[page_no].extract_text() or "")))
+    return pages, False
+
+
+def _count_pages(path: str) -> int:
+    from pypdf import PdfReader
+    return len(PdfReader(path).pages)
+
+
+def _write_temp(file_bytes: bytes) -> str:
+    # 워커에 PDF 바이트를 구간마다 pickle 해서 보내지 않도록 임시 파일 경로만 넘긴다
+    with tempfile.NamedTemporaryFile(prefix="pdf_extract_", suffix=".pdf", delete=False) as f:
+        f.write(file_bytes)
+        return f.name
+
+
+def _preload_worker() -> None:
+    # 워커가 처음 받는 구간에서 pypdf import 비용을 치르지 않도록 미리 로드
+    import pypdf  # noqa: F401
+
+
+class PDFTextExtractor:
+    """
+    페이지 병렬 PDF 텍스트 추출기.
+    - 페이지를 PDF_EXTRACT_PAGES_PER_TASK 단위 구간으로 나눠 프로세스 풀에서 추출
+    - 구간이 끝나는 대로 페이지 순서를 지켜 스트리밍 (iter_pages)
+    - 페이지 수 제한(PDF_MAX_PAGES)과 전체 시간 제한(PDF_EXTRACT_TIMEOUT_SEC) 적용
+    - 작은 문서는 프로세스 풀 없이 스레드 하나에서 추출 (어느 쪽이든 이벤트 루프는 막지 않음)
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.pool: Optional[ProcessPoolExecutor] = None
+            cls.__instance.pool_pid = None
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def iter_pages(self, file_bytes: bytes, max_pages: int = None,
+                         timeout_sec: float = None) -> AsyncIterator[Tuple[int, str]]:
+        max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+        deadline = time.time() + (timeout_sec or PDF_EXTRACT_TIMEOUT_SEC)
+        path = await asyncio.to_thread(_write_temp, file_bytes)
+        try:
+            try:
+                total = await asyncio.to_thread(_count_pages, path)
+            except Exception as e:
+                raise PDFExtractionError(f"PDF parsing error: {e}") from e
+            if max_pages and total > max_pages:
+                print(f"[PDFTextExtractor] {total}페이지 중 앞 {max_pages}페이지만 추출")
+                total = max_pages
+
+            doc_id = uuid.uuid4().hex
+            bounds = [(start, min(start + PDF_EXTRACT_PAGES_PER_TASK, total))
+                      for start in range(0, total, PDF_EXTRACT_PAGES_PER_TASK)]
+            threaded = total < PDF_PARALLEL_MIN_PAGES or PDF_EXTRACT_WORKERS <= 1
+            if threaded:
+                # 스레드 하나에서 구간을 차례로 추출 (PdfReader 는 스레드 안전하지 않으므로 한 번에 한 구간씩)
+                ranges = [None] * len(bounds)
+            else:
+                loop = asyncio.get_running_loop()
+                pool = self._get_pool()
+                ranges = [
+                    asyncio.wrap_future(pool.submit(_extract_range, doc_id, path, start, end, deadline), loop=loop)
+                    for start, end in bounds
+                ]
+
+            try:
+                # 구간은 끝나는 순서가 제각각이지만 페이지 순서대로 내보낸다
+                for i, future in enumerate(ranges):
+                    if future is None:
+                        start, end = bounds[i]
+                        future = ranges[i] = asyncio.ensure_future(
+                            asyncio.to_thread(_extract_range, doc_id, path, start, end, deadline)
+                        )
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise PDFExtractionTimeoutError("PDF 텍스트 추출 시간 제한을 넘겼습니다.")
+                    try:
+                        pages, timed_out = await asyncio.wait_for(asyncio.shield(future), remaining)
+                    except asyncio.TimeoutError:
+                        raise PDFExtractionTimeoutError("PDF 텍스트 추출 시간 제한을 넘겼습니다.")
+                    except BrokenProcessPool as e:
+                        # 워커가 죽으면(메모리 부족 등) 풀을 버리고 다음 요청에서 새로 만든다
+                        self.pool = None
+                        raise PDFExtractionError(f"PDF extraction worker crashed: {e}") from e
+                    except Exception as e:
+                        raise PDFExtractionError(f"PDF parsing error: {e}") from e
+                    for page in pages:
+                        yield page
+                    if timed_out:
+                        raise PDFExtractionTimeoutError("PDF 텍스트 추출 시간 제한을 넘겼습니다.")
+            finally:
+                # 아직 시작 안 한 구간은 취소 (이미 실행 중인 구간은 deadline 이 지나면 스스로 멈춘다)
+                for future in ranges:
+                    if future is not None:
+                        future.cancel()
+                if threaded:
+                    _release_reader(doc_id)
+        finally:
+            await asyncio.to_thread(_remove_quietly, path)
+
+    async def extract_text(self, file_bytes: bytes, max_pages: int = None, timeout_sec: float = None) -> str:
+        texts = [text async for _, text in self.iter_pages(file_bytes, max_pages, timeout_sec) if text]
+        return "\n".join(texts)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # prefork 워커에서는 각자 자기 풀을 만든다 (부모에서 만든 풀은 fork 후 쓸 수 없음)
+        if self.pool is None or self.pool_pid != os.getpid():
+            # forkserver: 스레드가 떠 있는 서버 프로세스를 그대로 fork 하지 않고 깨끗한 프로세스에서 워커를 만든다
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self.pool = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context(method),
+                initializer=_preload_worker
+            )
+            self.pool_pid = os.getpid()
+        return self.pool
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,80 @@
+import asyncio
+import contextvars
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# 현재 실행 중인 단계의 LLM 사용량 집계용 (단계마다 별도 Task 로 실행되므로 단계별로 분리된다)
+# 단계 안에서 만든 하위 Task(gather 등)도 컨텍스트를 물려받아 같은 집계에 더해진다
+_stage_usage: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("pdf_stage_usage", default=None)
+
+
+def record_llm_usage(usage) -> None:
+    # LLM 응답의 usage 를 현재 단계 집계에 더한다 (DAG 밖에서 호출되면 무시)
+    counters = _stage_usage.get()
+    if counters is None:
+        return
+    counters["llm_calls"] += 1
+    if usage is not None:
+        counters["prompt_tokens"] += usage.prompt_tokens or 0
+        counters["completion_tokens"] += usage.completion_tokens or 0
+
+
+class StageDAG:
+    """
+    의존 관계가 있는 비동기 단계 실행기.
+    - 각 단계는 의존하는 단계가 모두 끝나는 즉시 시작하므로, 서로 독립인 단계는 동시에 실행된다
+    - 단계 함수는 지금까지의 결과 dict 를 받아 자기 결과를 반환하는 async 함수
+    - 단계별 시작 시점/소요 시간/LLM 호출 수/토큰 사용량을 기록한다
+    - 한 단계가 실패하면 나머지 단계를 취소하고 그 예외를 그대로 올린다
+
+    의존 단계는 먼저 add 되어 있어야 하므로 순환은 만들 수 없다.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Tuple[Callable[[dict], Awaitable[Any]], Tuple[str, ...]]] = {}
+
+    def add(self, name: str, func: Callable[[dict], Awaitable[Any]], deps: Tuple[str, ...] = ()) -> "StageDAG":
+        if name in self.stages:
+            raise ValueError(f"duplicate stage: {name}")
+        unknown = [dep for dep in deps if dep not in self.stages]
+        if unknown:
+            raise ValueError(f"stage {name} depends on unknown stages: {unknown}")
+        self.stages[name] = (func, tuple(deps))
+        return self
+
+    async def run(self) -> Tuple[Dict[str, Any], Dict[str, dict]]:
+        results: Dict[str, Any] = {}
+        timings: Dict[str, dict] = {}
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        # add 순서가 곧 위상 정렬 순서이므로 의존 Task 는 항상 먼저 만들어져 있다
+        for name, (func, deps) in self.stages.items():
+            tasks[name] = asyncio.create_task(
+                self._run_stage(name, func, [tasks[dep] for dep in deps], results, timings, started),
+                name=f"stage:{name}"
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        timings["total"] = dict(duration_ms=round((time.perf_counter() - started) * 1000, 1))
+        return results, timings
+
+    @staticmethod
+    async def _run_stage(name: str, func, deps, results: dict, timings: dict, started: float) -> None:
+        if deps:
+            await asyncio.gather(*deps)
+
+        usage = dict(llm_calls=0, prompt_tokens=0, completion_tokens=0)
+        _stage_usage.set(usage)
+        stage_start = time.perf_counter()
+        results[name] = await func(results)
+        timings[name] = dict(
+            start_ms=round((stage_start - started) * 1000, 1),
+            duration_ms=round((time.perf_counter() - stage_start) * 1000, 1),
+            **usage
+        )
@@ -0,0 +1,62 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Iterable, TypeVar, Union
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def aclose(source) -> None:
+    # async generator 는 중간에 순회를 멈추면 자동으로 닫히지 않으므로 명시적으로 닫아 finally 정리가 돌게 한다
+    close = getattr(source, "aclose", None)
+    if close is not None:
+        await close()
+
+
+async def aiter_items(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    # 리스트와 async iterator 를 같은 방식으로 순회하기 위한 어댑터
+    if hasattr(items, "__aiter__"):
+        try:
+            async for item in items:
+                yield item
+        finally:
+            await aclose(items)
+    else:
+        for item in items:
+            yield item
+
+
+async def bounded(source: AsyncIterable[T], maxsize: int) -> AsyncIterator[T]:
+    """
+    source 를 별도 Task 에서 미리 읽어 크기 제한 큐에 넣고, 소비자는 큐에서 꺼낸다.
+    - 생산(예: 페이지 추출)과 소비(예: 청킹/LLM 호출)가 겹쳐서 진행된다
+    - 소비자가 느리면 큐가 차서 생산자가 기다린다 (backpressure)
+    - 생산자 예외는 소비자 쪽에서 그대로 다시 올라오고, 소비자가 중간에 그만두면 생산자는 취소된다
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)
+            await queue.put(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put(e)
+        finally:
+            await aclose(source)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
@@ -0,0 +1,255 @@
+import asyncio
+import copy
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from ai_analyzer.infrastructure.cache.embedding_cache import normalize_rows
+from ai_analyzer.infrastructure.executor.inference_executor import InferenceExecutor
+from config.singleflight import SingleFlight
+from pdf_analyzer.application.port.chunk_index_port import ChunkIndexPort
+from pdf_analyzer.infrastucture.chunking.token_chunker import TokenChunker
+
+# 청크 인덱스 설정 (환경변수로 조정 가능)
+# - PDF_RAG_INDEX_DIR: 문서별 인덱스 디렉터리 (<dir>/<key 앞 2자리>/<key>/{vectors.npy, chunks.json})
+# - PDF_RAG_INDEX_MAX_MB: 전체 크기가 넘으면 오래 안 쓴 인덱스부터 삭제 (LRU)
+# - PDF_RAG_OPEN_INDEXES: 프로세스에서 열어 둘 인덱스 수 (memmap 이라 메모리는 실제로 읽은 페이지만큼만 사용)
+PDF_RAG_INDEX_DIR = os.getenv("PDF_RAG_INDEX_DIR", "/tmp/pdf_chunk_index")
+PDF_RAG_INDEX_MAX_MB = int(os.getenv("PDF_RAG_INDEX_MAX_MB", "2048"))
+PDF_RAG_OPEN_INDEXES = int(os.getenv("PDF_RAG_OPEN_INDEXES", "64"))
+PDF_RAG_EMBED_BATCH = int(os.getenv("PDF_RAG_EMBED_BATCH", "32"))
+
+
+def _minilm():
+    # 뉴스 키워드 추출과 같은 MiniLM (레지스트리의 "minilm" = KeyBERT, 안의 SentenceTransformer)
+    from ai_analyzer.infrastructure.registry.model_registry import ModelRegistry
+
+    return ModelRegistry.getInstance().get("minilm")
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    # 키워드 추출과 같은 토크나이저를 쓰므로 tokenizer_lock 안에서 (추론 풀 스레드에서 호출됨)
+    kw_model = _minilm()
+    with kw_model.tokenizer_lock:
+        vectors = kw_model.model.embedding_model.encode(texts, batch_size=PDF_RAG_EMBED_BATCH, show_progress_bar=False)
+    return normalize_rows(vectors)
+
+
+def _counting_tokenizer(kw_model) -> Tuple[object, threading.Lock]:
+    # 토큰 수 세기는 설정(특수 토큰/truncation/padding 없음)이 encode 와 달라 공유 토크나이저를 건드리지 않도록
+    # 모델마다 한 번 복사해 둔 토크나이저와 그 전용 락을 쓴다 (모델이 다시 로드되면 새로 복사)
+    with kw_model.tokenizer_lock:
+        counting = getattr(kw_model, "counting_tokenizer", None)
+        if counting is None:
+            counting = (copy.deepcopy(kw_model.model.embedding_model.tokenizer), threading.Lock())
+            kw_model.counting_tokenizer = counting
+    return counting
+
+
+def embedding_chunker(max_tokens: int, overlap_tokens: int) -> TokenChunker:
+    """
+    임베딩 모델 입력에 잘리지 않고 들어가는 청커.
+    LLM 토큰(tiktoken) 이 아니라 MiniLM 토크나이저로 세고, 크기는 max_seq_length 에서 특수 토큰 자리를 뺀 값을 넘지 않는다.
+    """
+    kw_model = _minilm()
+    embedding_model = kw_model.model.embedding_model
+    tokenizer, lock = _counting_tokenizer(kw_model)
+    limit = embedding_model.max_seq_length - tokenizer.num_special_tokens_to_add()
+
+    def count(text: str) -> int:
+        with lock:
+            return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+    return TokenChunker(min(max_tokens, limit), overlap_tokens, token_counter=count)
+
+
+class ChunkIndex:
+    """
+    디스크에 저장된 문서 하나의 인덱스.
+    vectors.npy 는 memmap 으로 열어서, 검색할 때 필요한 페이지만 OS 페이지 캐시에서 읽는다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r")
+        with open(os.path.join(directory, "chunks.json"), encoding="utf-8") as f:
+            self.chunks: List[str] = json.load(f)
+        if len(self.chunks) != len(self.vectors):
+            raise ValueError(f"chunk/vector count mismatch: {len(self.chunks)} != {len(self.vectors)}")
+
+    def top_k(self, query_vector: np.ndarray, k: int) -> List[Tuple[int, float, str]]:
+        # 정규화된 벡터끼리의 내적 = 코사인 유사도
+        k = min(k, len(self.chunks))
+        if k <= 0:
+            return []
+        scores = np.asarray(self.vectors @ query_vector)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(i), float(scores[i]), self.chunks[i]) for i in top]
+
+
+class ChunkIndexStore(ChunkIndexPort):
+    """
+    문서별 청크 임베딩 인덱스 저장소 (RAG 질의응답용).
+    - 청크는 문서당 한 번만 임베딩하고 디스크에 저장, 이후 질문은 질문 임베딩 1회 + 내적 검색만 한다
+    - 같은 문서의 인덱스를 동시에 만들려는 요청은 하나만 만들고 나머지는 결과를 기다린다 (프로세스 단위)
+    - 여러 워커가 같은 디렉터리를 써도 되도록 임시 디렉터리에 쓴 뒤 rename 으로 한 번에 공개한다
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.root = PDF_RAG_INDEX_DIR
+            cls.__instance.max_bytes = PDF_RAG_INDEX_MAX_MB * 1024 * 1024
+            cls.__instance.opened: "OrderedDict[str, ChunkIndex]" = OrderedDict()
+            cls.__instance.flight = SingleFlight()
+            cls.__instance.lock = threading.Lock()
+            cls.__instance.counters = dict(
+                hits=0, loads=0, builds=0, coalesced=0, errors=0, build_ms=0, searches=0, search_ms=0
+            )
+            os.makedirs(cls.__instance.root, exist_ok=True)
+            cls.__instance.total_bytes = sum(size for _, _, size in cls.__instance._entries())
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def get_or_build(self, key: str, build_chunks: Callable[[], Awaitable[List[str]]]) -> ChunkIndex:
+        index = self._remembered(key)
+        if index is not None:
+            self._count("hits")
+            return index
+
+        async def load_or_build() -> ChunkIndex:
+            index = await asyncio.to_thread(self._load, key)
+            if index is not None:
+                self._count("loads")
+            else:
+                start = time.perf_counter()
+                chunks = await build_chunks()
+                if not chunks:
+                    raise ValueError("no chunks to index")
+                # 임베딩은 뉴스 분석과 같은 추론 풀에서 (동시 추론 수 제한, 대기열이 차면 InferenceQueueFullError)
+                vectors = await InferenceExecutor.getInstance().run(embed_texts, chunks)
+                index = await asyncio.to_thread(self._save, key, chunks, vectors)
+                self._count("builds")
+                self._count("build_ms", int((time.perf_counter() - start) * 1000))
+            self._remember(key, index)
+            return index
+
+        # 만들던 요청이 취소되면 기다리던 요청이 이어서 만든다
+        index, joined = await self.flight.run(key, load_or_build)
+        if joined:
+            self._count("coalesced")
+        return index
+
+    async def search(self, index: ChunkIndex, query: str, top_k: int) -> List[Tuple[int, float, str]]:
+        start = time.perf_counter()
+        query_vector = (await InferenceExecutor.getInstance().run(embed_texts, [query]))[0]
+        hits = await asyncio.to_thread(index.top_k, query_vector, top_k)
+        self._count("searches")
+        self._count("search_ms", int((time.perf_counter() - start) * 1000))
+        return hits
+
+    def stats(self) -> dict:
+        with self.lock:
+            return dict(**self.counters, opened=len(self.opened), inflight=len(self.flight),
+                        disk_mb=round(self.total_bytes / (1024 * 1024), 1))
+
+    def _remembered(self, key: str) -> Optional[ChunkIndex]:
+        with self.lock:
+            index = self.opened.get(key)
+            if index is not None:
+                self.opened.move_to_end(key)
+            return index
+
+    def _remember(self, key: str, index: ChunkIndex) -> None:
+        with self.lock:
+            self.opened[key] = index
+            self.opened.move_to_end(key)
+            while len(self.opened) > PDF_RAG_OPEN_INDEXES:
+                self.opened.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[ChunkIndex]:
+        directory = self._path(key)
+        if not os.path.isdir(directory):
+            return None
+        try:
+            index = ChunkIndex(directory)
+        except (OSError, ValueError) as e:
+            # 깨진 인덱스는 지우고 다시 만든다
+            print(f"[ChunkIndexStore] broken index {key}: {type(e).__name__}: {e}")
+            self._count("errors")
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+        os.utime(directory)
+        return index
+
+    def _save(self, key: str, chunks: List[str], vectors: np.ndarray) -> ChunkIndex:
+        directory = self._path(key)
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+        tmp = f"{directory}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        np.save(os.path.join(tmp, "vectors.npy"), np.asarray(vectors, dtype=np.float32))
+        with open(os.path.join(tmp, "chunks.json"), "w", encoding="utf-8") as f:
+            json.dump(chunks, f, ensure_ascii=False)
+        size = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+        try:
+            os.rename(tmp, directory)
+        except OSError:
+            # 다른 워커가 먼저 같은 인덱스를 만들었으면 그것을 쓴다
+            shutil.rmtree(tmp, ignore_errors=True)
+            size = 0
+
+        with self.lock:
+            self.total_bytes += size
+            if self.total_bytes > self.max_bytes:
+                self._evict(keep=directory)
+        return ChunkIndex(directory)
+
+    def _evict(self, keep: str) -> None:
+        # 디렉터리 mtime(마지막 사용 시각)이 오래된 인덱스부터 상한의 90% 아래가 될 때까지 삭제
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for directory, _, size in entries:
+            if total <= target:
+                break
+            if directory == keep:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+            self.opened.pop(os.path.basename(directory), None)
+            total -= size
+        self.total_bytes = total
+
+    def _entries(self):
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                directory = os.path.join(prefix_dir, name)
+                if name.endswith(".tmp") or not os.path.isdir(directory):
+                    continue
+                try:
+                    size = sum(entry.stat().st_size for entry in os.scandir(directory))
+                    yield directory, os.stat(directory).st_mtime, size
+                except FileNotFoundError:
+                    continue
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[name] += amount